@@ -1,6 +1,7 @@
 """Signal generation engine using ICT strategy and multi-timeframe analysis."""
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
+import math
 from app.models import (
     Candle,
     SignalResponse,
@@ -14,7 +15,7 @@ from .ict_strategies import ICTStrategies, ICTSignalResult
 from .ict_phase1_enhancements import ICTPhase1Enhancements
 from .smc_strategies import SMCStrategies, SMCSignalResult
 from .ai_enhancer import AIEnhancer, AIConfidenceScore, MarketRegime, SignalQuality
-from .kill_zones import KillZoneDetector, KillZoneType, KillZoneInfo
+from .kill_zones import KillZoneDetector, KillZoneType, KillZoneInfo, kill_zone_detector
 
 
 class SignalEngine:
@@ -40,7 +41,7 @@ class SignalEngine:
         self.ict_phase1 = ICTPhase1Enhancements()
         self.smc_strategies = SMCStrategies()
         self.ai_enhancer = AIEnhancer()
-        self.kill_zone_detector = KillZoneDetector()
+        self.kill_zone_detector = kill_zone_detector
     
     def _analyze_with_ict(
         self, 
@@ -99,7 +100,7 @@ class SignalEngine:
             return MiniSignal.NEUTRAL, 0.0, f"{interval.value}: Insufficient data"
         
         # Calculate indicators
-        indicators = Indicators.calculate_all_indicators(candles)
+        indicators = Indicators.calculate_all_indicators(candles, as_arrays=True)
         
         # Get latest values (last candle is closed)
         idx = -1
@@ -111,8 +112,8 @@ class SignalEngine:
         macd_signal = indicators["macd_signal"][idx]
         macd_hist = indicators["macd_histogram"][idx]
         
-        # Check if we have valid indicator values
-        if any(v is None for v in [sma50, sma200, rsi, macd_line, macd_signal]):
+        # Check if we have valid indicator values (NaN until warmed up)
+        if any(math.isnan(v) for v in [sma50, sma200, rsi, macd_line, macd_signal]):
             return MiniSignal.NEUTRAL, 0.0, f"{interval.value}: Indicators not ready"
         
         # Initialize scoring
@@ -1,6 +1,7 @@
 """Signal generation engine using ICT strategy and multi-timeframe analysis."""
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
+import math
 from app.models import (
     Candle, 
     SignalResponse, 
@@ -93,7 +94,7 @@ class SignalEngine:
             return MiniSignal.NEUTRAL, 0.0, f"{interval.value}: Insufficient data"
         
         # Calculate indicators
-        indicators = Indicators.calculate_all_indicators(candles)
+        indicators = Indicators.calculate_all_indicators(candles, as_arrays=True)
         
         # Get latest values (last candle is closed)
         idx = -1
@@ -105,8 +106,8 @@ class SignalEngine:
         macd_signal = indicators["macd_signal"][idx]
         macd_hist = indicators["macd_histogram"][idx]
         
-        # Check if we have valid indicator values
-        if any(v is None for v in [sma50, sma200, rsi, macd_line, macd_signal]):
+        # Check if we have valid indicator values (NaN until warmed up)
+        if any(math.isnan(v) for v in [sma50, sma200, rsi, macd_line, macd_signal]):
             return MiniSignal.NEUTRAL, 0.0, f"{interval.value}: Indicators not ready"
         
         # Initialize scoring
@@ -8,16 +8,31 @@ This module uses machine learning-inspired algorithms to:
 - Adapt confidence based on symbol-specific performance
 """
 
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Union
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
-import pandas as pd
 from datetime import datetime
 
 from ..models import Candle
 
 
+def _linear_slope(values: np.ndarray) -> float:
+    """
+    Least-squares slope of values against x = 0..n-1.
+
+    Closed form of np.polyfit(x, values, 1)[0]: since x is an index ramp,
+    mean(x) = (n-1)/2 and n*var(x) = n*(n^2-1)/12 depend only on n.
+    """
+    n = values.size
+    if n < 2:
+        return 0.0
+    x_mean = (n - 1) * 0.5
+    var_x_n = n * (n * n - 1) / 12.0
+    return float((values @ np.arange(n) - n * x_mean * values.mean()) / var_x_n)
+
+
 class MarketRegime(Enum):
     """Market regime classification"""
     STRONG_TREND_UP = "strong_trend_up"
@@ -38,6 +53,18 @@ class SignalQuality(Enum):
     REJECT = "reject"      # 0-24%
 
 
+# Lower probability bound of each quality tier above REJECT; bisect_right keeps
+# a probability sitting exactly on a bound in the higher tier.
+_QUALITY_THRESHOLDS: Tuple[float, ...] = (25.0, 50.0, 75.0, 90.0)
+_QUALITY_TIERS: Tuple[SignalQuality, ...] = (
+    SignalQuality.REJECT,
+    SignalQuality.POOR,
+    SignalQuality.MODERATE,
+    SignalQuality.GOOD,
+    SignalQuality.EXCELLENT,
+)
+
+
 @dataclass
 class AIConfidenceScore:
     """AI-generated confidence metrics"""
@@ -82,7 +109,7 @@ class AIEnhancer:
     
     def enhance_signal(
         self,
-        candles: List[Candle],
+        candles: Union[List[Candle], np.ndarray],
         pattern_type: str,
         base_strength: float,
         base_confidence: float,
@@ -95,7 +122,8 @@ class AIEnhancer:
         Enhance a signal with AI-powered confidence scoring
         
         Args:
-            candles: Recent price data
+            candles: Recent price data (list of Candle, or a structured
+                ndarray with t/o/h/l/c/v fields)
             pattern_type: Type of pattern (ICT or SMC)
             base_strength: Original signal strength (0-100)
             base_confidence: Original confidence (0-100)
@@ -107,10 +135,43 @@ class AIEnhancer:
         Returns:
             AIConfidenceScore with comprehensive metrics
         """
-        df = self._candles_to_dataframe(candles)
+        opens, highs, lows, closes, volumes, timestamps = self._candles_to_arrays(candles)
         
+        return self.enhance_signal_arrays(
+            opens, highs, lows, closes, volumes, timestamps,
+            pattern_type=pattern_type,
+            base_strength=base_strength,
+            base_confidence=base_confidence,
+            symbol=symbol,
+            timeframe=timeframe,
+            ict_signals=ict_signals,
+            smc_signals=smc_signals
+        )
+    
+    def enhance_signal_arrays(
+        self,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        timestamps: np.ndarray,
+        pattern_type: str,
+        base_strength: float,
+        base_confidence: float,
+        symbol: str = "",
+        timeframe: str = "1h",
+        ict_signals: List[Any] = None,
+        smc_signals: List[Any] = None
+    ) -> AIConfidenceScore:
+        """
+        Enhance a signal from pre-packed OHLCV column arrays
+        
+        Same as enhance_signal, but skips the per-candle conversion when
+        the caller already holds the price data as parallel arrays.
+        """
         # 1. Classify market regime
-        regime = self._classify_market_regime(df)
+        regime = self._classify_market_regime(closes, highs, lows)
         
         # 2. Calculate regime alignment
         regime_alignment = self._calculate_regime_alignment(
@@ -121,7 +182,9 @@ class AIEnhancer:
         pattern_perf = self._get_pattern_performance(pattern_type, symbol, timeframe)
         
         # 4. Calculate false signal risk
-        false_signal_risk = self._calculate_false_signal_risk(df, pattern_type, regime)
+        false_signal_risk = self._calculate_false_signal_risk(
+            highs, lows, closes, volumes, pattern_type, regime
+        )
         
         # 5. Calculate confluence bonus
         confluence_bonus = self._calculate_confluence_bonus(ict_signals, smc_signals)
@@ -163,32 +226,46 @@ class AIEnhancer:
             recommendations=recommendations
         )
     
-    def _candles_to_dataframe(self, candles: List[Candle]) -> pd.DataFrame:
-        """Convert candles to pandas DataFrame"""
-        return pd.DataFrame([{
-            'timestamp': c.t,
-            'open': c.o,
-            'high': c.h,
-            'low': c.l,
-            'close': c.c,
-            'volume': c.v
-        } for c in candles])
+    def _candles_to_arrays(
+        self,
+        candles: Union[List[Candle], np.ndarray]
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Convert candles to (opens, highs, lows, closes, volumes, timestamps)
+        
+        Structured arrays are split into column views without copying;
+        Candle lists are read once per field.
+        """
+        if isinstance(candles, np.ndarray) and candles.dtype.names:
+            return tuple(
+                np.asarray(candles[field], dtype=np.float64)
+                for field in ('o', 'h', 'l', 'c', 'v')
+            ) + (np.asarray(candles['t'], dtype=np.int64),)
+        
+        n = len(candles)
+        return (
+            np.fromiter((c.o for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.h for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.l for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.c for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.v for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.t for c in candles), dtype=np.int64, count=n),
+        )
     
-    def _classify_market_regime(self, df: pd.DataFrame) -> MarketRegime:
+    def _classify_market_regime(
+        self,
+        closes: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray
+    ) -> MarketRegime:
         """
         Classify current market regime using multiple factors
         """
-        if len(df) < 20:
+        if len(closes) < 20:
             return MarketRegime.UNKNOWN
         
-        # Calculate indicators
-        closes = df['close'].values
-        highs = df['high'].values
-        lows = df['low'].values
-        
         # 1. Trend strength (using linear regression slope)
-        x = np.arange(len(closes))
-        slope, _ = np.polyfit(x, closes, 1)
+        slope = _linear_slope(closes)
         slope_normalized = slope / np.mean(closes) * 100
         
         # 2. Volatility (ATR-like measure)
@@ -308,7 +385,10 @@ class AIEnhancer:
     
     def _calculate_false_signal_risk(
         self,
-        df: pd.DataFrame,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
         pattern_type: str,
         regime: MarketRegime
     ) -> float:
@@ -317,14 +397,16 @@ class AIEnhancer:
         """
         risk_factors = []
         
+        if len(closes) == 0:
+            return 0.0
+        
         # 1. Low volume check
-        recent_volume = df['volume'].tail(5).mean()
-        avg_volume = df['volume'].mean()
+        recent_volume = volumes[-5:].mean()
+        avg_volume = volumes.mean()
         if recent_volume < avg_volume * 0.5:
             risk_factors.append(20)  # Low volume
         
         # 2. Choppy market detection
-        closes = df['close'].values
         if len(closes) >= 10:
             # Count direction changes
             direction_changes = 0
@@ -340,8 +422,8 @@ class AIEnhancer:
                 risk_factors.append(25)  # Choppy market
         
         # 3. Wide spreads
-        spreads = (df['high'] - df['low']) / df['close']
-        if spreads.tail(3).mean() > spreads.mean() * 1.5:
+        spreads = (highs - lows) / closes
+        if spreads[-3:].mean() > spreads.mean() * 1.5:
             risk_factors.append(15)  # Wide spreads
         
         # 4. Regime mismatch
@@ -366,12 +448,15 @@ class AIEnhancer:
         if not ict_signals or not smc_signals:
             return bonus
         
-        # Check for directional alignment
-        ict_bullish = any('bullish' in str(s.signal_type).lower() for s in ict_signals)
-        ict_bearish = any('bearish' in str(s.signal_type).lower() for s in ict_signals)
+        # Check for directional alignment (direction: 1 bullish, -1 bearish)
+        ict_directions = {s.direction for s in ict_signals}
+        smc_directions = {s.direction for s in smc_signals}
         
-        smc_bullish = any('bullish' in str(s.signal_type).lower() for s in smc_signals)
-        smc_bearish = any('bearish' in str(s.signal_type).lower() for s in smc_signals)
+        ict_bullish = 1 in ict_directions
+        ict_bearish = -1 in ict_directions
+        
+        smc_bullish = 1 in smc_directions
+        smc_bearish = -1 in smc_directions
         
         # Both agree on bullish
         if ict_bullish and smc_bullish:
@@ -424,16 +509,7 @@ class AIEnhancer:
     
     def _determine_quality_rating(self, probability: float) -> SignalQuality:
         """Determine quality rating from probability"""
-        if probability >= 90:
-            return SignalQuality.EXCELLENT
-        elif probability >= 75:
-            return SignalQuality.GOOD
-        elif probability >= 50:
-            return SignalQuality.MODERATE
-        elif probability >= 25:
-            return SignalQuality.POOR
-        else:
-            return SignalQuality.REJECT
+        return _QUALITY_TIERS[bisect_right(_QUALITY_THRESHOLDS, probability)]
     
     def _generate_ai_rationale(
         self,
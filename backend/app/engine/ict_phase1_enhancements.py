@@ -9,9 +9,9 @@ This module implements critical ICT trading enhancements:
 Based on ICT methodology by Michael J. Huddleston
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from enum import Enum
 
 import numpy as np
@@ -31,7 +31,95 @@ class KillZoneType(Enum):
     OFF_HOURS = "off_hours"
 
 
-@dataclass
+# Kill zones in match priority order (earlier entries win where windows
+# overlap): (zone, start_hour, end_hour, strength multiplier, description)
+_KILL_ZONES: Tuple[Tuple[KillZoneType, int, int, float, str], ...] = (
+    (KillZoneType.LONDON_OPEN, 7, 10, 1.30,
+     'London Open Kill Zone - Highest probability setups'),
+    (KillZoneType.NY_OPEN, 12, 15, 1.25,
+     'New York Open Kill Zone - Second highest probability'),
+    (KillZoneType.LONDON_CLOSE, 15, 17, 1.15,
+     'London Close Kill Zone - Moderate probability'),
+    (KillZoneType.ASIAN_SESSION, 0, 8, 1.10,
+     'Asian Session - Moderate activity'),
+    (KillZoneType.NY_CLOSE, 19, 21, 1.05,
+     'New York Close Kill Zone - Lower probability'),
+)
+
+
+# Optimal entry choices indexed by _PD_TABLE entry ids
+_PD_ENTRY_DISCOUNT_TOP, _PD_ENTRY_OTE_62, _PD_ENTRY_OTE_MID, _PD_ENTRY_PRICE = range(4)
+
+
+def _build_pd_table() -> Tuple[Tuple[str, float, int], ...]:
+    """
+    Map PD array comparison bits to (location, alignment_score, entry_id).
+    
+    State bits: 1 = above premium bottom, 2 = below discount top,
+    4 = beyond the outer 5% (premium top / discount bottom), 8 = inside OTE.
+    """
+    table = []
+    for state in range(16):
+        if state & 1:
+            # In premium zone = good for SELL signals; wait for discount
+            entry = ('premium', 20.0 if state & 4 else 40.0, _PD_ENTRY_DISCOUNT_TOP)
+        elif state & 2:
+            # In discount zone = good for BUY signals; OTE is optimal
+            entry = ('discount', 90.0 if state & 4 else 75.0, _PD_ENTRY_OTE_62)
+        else:
+            # In equity (middle) zone = neutral
+            entry = ('equity', 50.0, _PD_ENTRY_OTE_MID)
+        if state & 8:
+            # In OTE: sweet spot, enter at current price
+            entry = (entry[0], 95.0, _PD_ENTRY_PRICE)
+        table.append(entry)
+    return tuple(table)
+
+
+_PD_TABLE = _build_pd_table()
+
+# Number of calculate_pd_arrays results kept per instance
+_PD_CACHE_SIZE = 32
+
+# Liquidity sweep records: side, pool level, timestamp, strength, candle index
+SWEEP_BUY_SIDE = 0   # price took buy-side liquidity, expect a bearish move
+SWEEP_SELL_SIDE = 1  # price took sell-side liquidity, expect a bullish move
+_SWEEP_DTYPE = np.dtype([
+    ('side', np.uint8),
+    ('pool', np.float64),
+    ('t', np.int64),
+    ('strength', np.float64),
+    ('idx', np.int64),
+])
+_SWEEP_SIDES = (
+    ('buy_side_sweep', 'bearish_move'),
+    ('sell_side_sweep', 'bullish_move'),
+)
+
+# Rationale flags returned by calculate_phase1_enhancement_batch
+PHASE1_KILL_ZONE = 1
+PHASE1_PD_ARRAY = 2
+PHASE1_LIQUIDITY_SWEEP = 4
+
+# Recommendation codes used by the Phase 1 scoring core
+_REC_NEUTRAL, _REC_BUY, _REC_SELL = range(3)
+_REC_CODES = {'buy': _REC_BUY, 'sell': _REC_SELL}
+
+
+def _build_kill_zone_table() -> np.ndarray:
+    """Map each UTC minute of the day to an index into _KILL_ZONES (len = off hours)"""
+    table = np.full(24 * 60, len(_KILL_ZONES), dtype=np.uint8)
+    # Fill lowest priority first so higher-priority zones overwrite overlaps
+    for zone_idx in reversed(range(len(_KILL_ZONES))):
+        _, start_hour, end_hour, _, _ = _KILL_ZONES[zone_idx]
+        table[start_hour * 60:end_hour * 60] = zone_idx
+    return table
+
+
+_KZ_TABLE = _build_kill_zone_table()
+
+
+@dataclass(slots=True)
 class KillZoneInfo:
     """Kill zone information"""
     zone_type: KillZoneType
@@ -42,7 +130,7 @@ class KillZoneInfo:
     end_hour: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PDArrayInfo:
     """Premium/Discount Array information"""
     premium_zone: Tuple[float, float]      # (low, high)
@@ -55,7 +143,7 @@ class PDArrayInfo:
     alignment_score: float                  # 0-100 based on location
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquiditySweep:
     """Liquidity sweep detection result"""
     sweep_type: str                         # 'buy_side_sweep' or 'sell_side_sweep'
@@ -67,6 +155,139 @@ class LiquiditySweep:
     reversal_candle_index: int
 
 
+def _scan_sweeps(
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    buy_levels: np.ndarray,
+    sell_levels: np.ndarray,
+    prev_close: float = np.nan
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scan candles against every liquidity pool in one broadcast pass.
+    
+    A buy-side pool is swept when the high reaches 0.1% above it on a bearish
+    reversal candle (close below open or below the previous close); sell-side
+    pools mirror this. Returns (candle_indices, pool_columns) in scan order:
+    per candle, buy-side pools first. Columns >= len(buy_levels) index
+    sell_levels after subtracting len(buy_levels).
+    """
+    # prev_close is the close before the first candle (NaN = none, which makes
+    # the previous-close comparisons False)
+    prev_closes = np.concatenate(([prev_close], closes[:-1]))
+    bearish_reversal = (closes < opens) | (closes < prev_closes)
+    bullish_reversal = (closes > opens) | (closes > prev_closes)
+    
+    buy_hits = (highs[:, None] >= buy_levels[None, :] * 1.001) & bearish_reversal[:, None]
+    sell_hits = (lows[:, None] <= sell_levels[None, :] * 0.999) & bullish_reversal[:, None]
+    
+    return np.nonzero(np.hstack((buy_hits, sell_hits)))
+
+
+class _RollingRange:
+    """
+    Rolling highest-high / lowest-low over the last `window` pushed candles.
+    
+    Monotonic deques of (index, value) keep the current extreme at the front,
+    so each push is O(1) amortized.
+    """
+    
+    __slots__ = ('window', 'count', 'last_key', '_max_dq', '_min_dq')
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.count = 0
+        self.last_key: Optional[Tuple[int, float, float]] = None
+        self._max_dq: Deque[Tuple[int, float]] = deque()
+        self._min_dq: Deque[Tuple[int, float]] = deque()
+    
+    @classmethod
+    def from_arrays(cls, window: int, highs: np.ndarray, lows: np.ndarray) -> '_RollingRange':
+        """Build the window state for the given highs/lows in one vectorized pass"""
+        state = cls(window)
+        n = len(highs)
+        state.count = n
+        if n == 0:
+            return state
+        # An element stays in the deque only if it beats everything after it
+        later_max = np.append(np.maximum.accumulate(highs[::-1])[::-1][1:], -np.inf)
+        later_min = np.append(np.minimum.accumulate(lows[::-1])[::-1][1:], np.inf)
+        max_idx = np.flatnonzero(highs > later_max)
+        min_idx = np.flatnonzero(lows < later_min)
+        state._max_dq.extend(zip(max_idx.tolist(), highs[max_idx].tolist()))
+        state._min_dq.extend(zip(min_idx.tolist(), lows[min_idx].tolist()))
+        return state
+    
+    def push(self, high: float, low: float):
+        """Add the next candle and expire the one falling out of the window"""
+        i = self.count
+        expired = i - self.window
+        
+        max_dq = self._max_dq
+        while max_dq and max_dq[-1][1] <= high:
+            max_dq.pop()
+        max_dq.append((i, high))
+        if max_dq[0][0] <= expired:
+            max_dq.popleft()
+        
+        min_dq = self._min_dq
+        while min_dq and min_dq[-1][1] >= low:
+            min_dq.pop()
+        min_dq.append((i, low))
+        if min_dq[0][0] <= expired:
+            min_dq.popleft()
+        
+        self.count = i + 1
+    
+    @property
+    def high(self) -> float:
+        return self._max_dq[0][1]
+    
+    @property
+    def low(self) -> float:
+        return self._min_dq[0][1]
+
+
+# (kill_zone_info, pd_info, best_bullish_sweep, best_bearish_sweep)
+_Phase1Context = Tuple[
+    KillZoneInfo, Optional[PDArrayInfo], Optional[LiquiditySweep], Optional[LiquiditySweep]
+]
+
+
+@dataclass(slots=True)
+class _SweepScanState:
+    """Hits of the previous liquidity sweep scan (positions within its window)"""
+    pools_key: Tuple[int, bytes]
+    last_key: Tuple[int, float, float, float]  # (t, h, l, c) of the last scanned candle
+    window_len: int
+    candle_hits: np.ndarray
+    pool_hits: np.ndarray
+
+
+def _sweep_from_record(record: Tuple[int, float, int, float, int]) -> LiquiditySweep:
+    """Build a LiquiditySweep from a _SWEEP_DTYPE row (as a tuple)"""
+    side, pool_level, timestamp, strength, index = record
+    sweep_type, expectation = _SWEEP_SIDES[side]
+    return LiquiditySweep(
+        sweep_type=sweep_type,
+        pool_level=pool_level,
+        sweep_timestamp=timestamp,
+        expectation=expectation,
+        strength=strength,
+        is_confirmed=True,
+        reversal_candle_index=index
+    )
+
+
+def _strongest_sweep(sweeps: np.ndarray, side: int) -> Optional[LiquiditySweep]:
+    """Strongest sweep on one side of a _SWEEP_DTYPE array (earliest wins ties)"""
+    side_sweeps = sweeps[sweeps['side'] == side]
+    if len(side_sweeps) == 0:
+        return None
+    return _sweep_from_record(side_sweeps[int(side_sweeps['strength'].argmax())].tolist())
+
+
 class ICTPhase1Enhancements:
     """
     ICT Phase 1 Enhancements - Critical improvements for signal accuracy
@@ -82,6 +303,77 @@ class ICTPhase1Enhancements:
         self.enabled_kill_zones = settings.ENABLE_KILL_ZONES
         self.enabled_pd_arrays = settings.ENABLE_PD_ARRAYS
         self.enabled_liquidity_sweeps = settings.ENABLE_LIQUIDITY_SWEEPS
+        # (key, column arrays) for the most recently converted candle list
+        self._candle_cache: Optional[Tuple[Tuple, Tuple[np.ndarray, ...]]] = None
+        # Rolling high/low windows for PD arrays, keyed by lookback
+        self._pd_windows: Dict[int, _RollingRange] = {}
+        # Hits from the previous liquidity sweep scan, for incremental rescans
+        self._sweep_state: Optional[_SweepScanState] = None
+        # Recent calculate_pd_arrays results (LRU), keyed on candle series + lookback
+        self._pd_cache: OrderedDict[Tuple, PDArrayInfo] = OrderedDict()
+    
+    def _candle_arrays(self, candles: List[Candle], window: int) -> Tuple[np.ndarray, ...]:
+        """
+        Get (timestamps, opens, highs, lows, closes, volumes) for the last `window` candles.
+        
+        The conversion is cached per candle list, so the PD array and liquidity
+        sweep passes over the same candles share a single extraction. The key
+        includes the last candle's values, since a forming bar may be updated
+        in place within the same list.
+        """
+        last_candle = candles[-1]
+        key = (id(candles), len(candles), last_candle.t, last_candle.o, last_candle.h,
+               last_candle.l, last_candle.c, last_candle.v)
+        cached = self._candle_cache
+        if cached is None or cached[0] != key or len(cached[1][0]) < min(window, len(candles)):
+            tail = candles[-window:]
+            n = len(tail)
+            arrays = (
+                np.fromiter((c.t for c in tail), dtype=np.int64, count=n),
+                np.fromiter((c.o for c in tail), dtype=np.float64, count=n),
+                np.fromiter((c.h for c in tail), dtype=np.float64, count=n),
+                np.fromiter((c.l for c in tail), dtype=np.float64, count=n),
+                np.fromiter((c.c for c in tail), dtype=np.float64, count=n),
+                np.fromiter((c.v for c in tail), dtype=np.float64, count=n),
+            )
+            cached = self._candle_cache = (key, arrays)
+        
+        return tuple(column[-window:] for column in cached[1])
+    
+    def _rolling_range(self, candles: List[Candle], lookback: int) -> Tuple[float, float]:
+        """
+        Get (highest high, lowest low) of the last `lookback` candles.
+        
+        A rolling window per lookback follows the candle stream: when the series
+        has only advanced by a few bars since the previous call, just the new
+        bars are pushed (O(1) amortized each) instead of rescanning the window.
+        """
+        if lookback <= 0:
+            # Non-positive lookback slices the whole series; nothing to roll
+            _, _, highs, lows, _, _ = self._candle_arrays(candles, lookback)
+            return float(highs.max()), float(lows.min())
+        
+        last_candle = candles[-1]
+        last_key = (last_candle.t, last_candle.h, last_candle.l)
+        
+        window = self._pd_windows.get(lookback)
+        if window is not None:
+            # Find the last candle the window has seen within the new lookback
+            tail = candles[-lookback:]
+            for offset in range(len(tail) - 1, -1, -1):
+                c = tail[offset]
+                if (c.t, c.h, c.l) == window.last_key:
+                    for c in tail[offset + 1:]:
+                        window.push(c.h, c.l)
+                    window.last_key = last_key
+                    return window.high, window.low
+        
+        # Different or jumped series: rebuild the window from the column arrays
+        _, _, highs, lows, _, _ = self._candle_arrays(candles, lookback)
+        window = _RollingRange.from_arrays(lookback, highs, lows)
+        window.last_key = last_key
+        self._pd_windows[lookback] = window
+        return window.high, window.low
     
     # ============================================================================
     # KILL ZONE DETECTION
@@ -115,57 +407,18 @@ class ICTPhase1Enhancements:
                 end_hour=24
             )
         
-        # Convert to UTC datetime
-        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        hour = dt.hour
-        minute = dt.minute
-        time_decimal = hour + minute / 60.0
-        
-        # Define kill zones with strength multipliers
-        kill_zones = {
-            KillZoneType.LONDON_OPEN: {
-                'start': 7.0,   # 07:00 UTC
-                'end': 10.0,    # 10:00 UTC
-                'multiplier': 1.30,  # +30% signal strength
-                'description': 'London Open Kill Zone - Highest probability setups'
-            },
-            KillZoneType.NY_OPEN: {
-                'start': 12.0,  # 12:00 UTC
-                'end': 15.0,    # 15:00 UTC
-                'multiplier': 1.25,  # +25% signal strength
-                'description': 'New York Open Kill Zone - Second highest probability'
-            },
-            KillZoneType.LONDON_CLOSE: {
-                'start': 15.0,  # 15:00 UTC
-                'end': 17.0,    # 17:00 UTC
-                'multiplier': 1.15,  # +15% signal strength
-                'description': 'London Close Kill Zone - Moderate probability'
-            },
-            KillZoneType.ASIAN_SESSION: {
-                'start': 0.0,   # 00:00 UTC
-                'end': 8.0,     # 08:00 UTC
-                'multiplier': 1.10,  # +10% signal strength
-                'description': 'Asian Session - Moderate activity'
-            },
-            KillZoneType.NY_CLOSE: {
-                'start': 19.0,  # 19:00 UTC
-                'end': 21.0,    # 21:00 UTC
-                'multiplier': 1.05,  # +5% signal strength
-                'description': 'New York Close Kill Zone - Lower probability'
-            }
-        }
-        
-        # Check which kill zone we're in
-        for zone_type, zone_info in kill_zones.items():
-            if zone_info['start'] <= time_decimal < zone_info['end']:
-                return KillZoneInfo(
-                    zone_type=zone_type,
-                    is_active=True,
-                    strength_multiplier=zone_info['multiplier'],
-                    description=zone_info['description'],
-                    start_hour=int(zone_info['start']),
-                    end_hour=int(zone_info['end'])
-                )
+        # Look up the zone active at this UTC minute of the day (epoch days are 86400s)
+        zone_idx = _KZ_TABLE[int(timestamp) % 86400 // 60]
+        if zone_idx < len(_KILL_ZONES):
+            zone_type, start_hour, end_hour, multiplier, description = _KILL_ZONES[zone_idx]
+            return KillZoneInfo(
+                zone_type=zone_type,
+                is_active=True,
+                strength_multiplier=multiplier,
+                description=description,
+                start_hour=start_hour,
+                end_hour=end_hour
+            )
         
         # Off hours (no kill zone active)
         return KillZoneInfo(
@@ -214,12 +467,25 @@ class ICTPhase1Enhancements:
                 alignment_score=50.0
             )
         
-        # Get recent candles
-        recent_candles = candles[-lookback:]
-        
+        # Reuse the result when the same candle series is analyzed again
+        last_candle = candles[-1]
+        cache_key = (id(candles), len(candles), last_candle.t, last_candle.h,
+                     last_candle.l, last_candle.c, lookback)
+        pd_info = self._pd_cache.get(cache_key)
+        if pd_info is not None:
+            self._pd_cache.move_to_end(cache_key)
+            return pd_info
+        
+        pd_info = self._compute_pd_arrays(candles, lookback)
+        self._pd_cache[cache_key] = pd_info
+        if len(self._pd_cache) > _PD_CACHE_SIZE:
+            self._pd_cache.popitem(last=False)
+        return pd_info
+    
+    def _compute_pd_arrays(self, candles: List[Candle], lookback: int) -> PDArrayInfo:
+        """Compute PD arrays for calculate_pd_arrays (uncached)"""
         # Calculate range
-        high = max(c.h for c in recent_candles)
-        low = min(c.l for c in recent_candles)
+        high, low = self._rolling_range(candles, lookback)
         range_size = high - low
         
         if range_size == 0:
@@ -248,30 +514,19 @@ class ICTPhase1Enhancements:
         # Current price
         current_price = candles[-1].c
         
-        # Determine current location
-        if current_price > premium_bottom:
-            current_location = 'premium'
-            # In premium zone = good for SELL signals (alignment: low for buy, high for sell)
-            alignment_score = 20.0 if current_price > premium_top else 40.0
-            optimal_entry = discount_top  # Should wait for discount
-        elif current_price < discount_top:
-            current_location = 'discount'
-            # In discount zone = good for BUY signals (alignment: high for buy, low for sell)
-            alignment_score = 90.0 if current_price < discount_bottom else 75.0
-            optimal_entry = ote_62  # OTE is optimal
-        else:
-            current_location = 'equity'
-            # In equity (middle) zone = neutral
-            alignment_score = 50.0
-            optimal_entry = (ote_62 + ote_79) / 2
+        # Check if in OTE zone (test the upper bound first: the OTE sits in the
+        # discount half, so prices in premium exit on the first comparison)
+        is_in_ote = current_price <= ote_62 and ote_79 <= current_price
         
-        # Check if in OTE zone
-        is_in_ote = ote_79 <= current_price <= ote_62
-        
-        # If in OTE, boost alignment score significantly
-        if is_in_ote:
-            alignment_score = 95.0  # Sweet spot!
-            optimal_entry = current_price
+        # Resolve location, alignment and entry from the comparison bits
+        state = (
+            (current_price > premium_bottom)
+            | (current_price < discount_top) << 1
+            | ((current_price > premium_top) | (current_price < discount_bottom)) << 2
+            | is_in_ote << 3
+        )
+        current_location, alignment_score, entry_id = _PD_TABLE[state]
+        optimal_entry = (discount_top, ote_62, (ote_62 + ote_79) / 2, current_price)[entry_id]
         
         return PDArrayInfo(
             premium_zone=(premium_bottom, premium_top),
@@ -310,68 +565,194 @@ class ICTPhase1Enhancements:
         Returns:
             List of detected LiquiditySweep objects
         """
+        return [
+            _sweep_from_record(record)
+            for record in self.detect_liquidity_sweeps_array(
+                candles, liquidity_pools, lookback
+            ).tolist()
+        ]
+    
+    def detect_liquidity_sweeps_array(
+        self,
+        candles: List[Candle],
+        liquidity_pools: Dict[str, float],
+        lookback: int = 10
+    ) -> np.ndarray:
+        """
+        Record-array form of detect_liquidity_sweeps.
+        
+        Returns a _SWEEP_DTYPE array (side, pool, t, strength, idx) in detection
+        order, filled in one vectorized pass without per-sweep objects. side is
+        SWEEP_BUY_SIDE or SWEEP_SELL_SIDE; every row is a confirmed sweep.
+        """
         if not self.enabled_liquidity_sweeps:
-            return []
+            return np.empty(0, dtype=_SWEEP_DTYPE)
         
         if not candles or len(candles) < lookback:
-            return []
+            return np.empty(0, dtype=_SWEEP_DTYPE)
+        
+        # Resolve the pool levels once: buy-side first, then sell-side
+        buy_levels = list(liquidity_pools.get('buy_side', {}).values())
+        sell_levels = list(liquidity_pools.get('sell_side', {}).values())
+        pool_levels = buy_levels + sell_levels
+        n_buy = len(buy_levels)
         
-        sweeps = []
-        recent_candles = candles[-lookback:]
+        if not pool_levels:
+            return np.empty(0, dtype=_SWEEP_DTYPE)
+        
+        timestamps, opens, highs, lows, closes, volumes = self._candle_arrays(candles, lookback)
+        levels = np.asarray(pool_levels, dtype=np.float64)
+        base_idx = len(candles) - len(timestamps)  # index of the first scanned candle
         
         # Calculate average volume for confirmation
-        volumes = [c.v for c in recent_candles]
-        avg_volume = sum(volumes) / len(volumes) if volumes else 0
-        
-        for i, candle in enumerate(recent_candles):
-            # Check buy-side liquidity sweeps (price pokes above highs, reverses down)
-            for pool_name, pool_level in liquidity_pools.get('buy_side', {}).items():
-                # Price touched or slightly exceeded the pool
-                if candle.h >= pool_level * 1.001:  # 0.1% threshold
-                    # Check for reversal (close below open or below previous close)
-                    is_bearish_reversal = (
-                        candle.c < candle.o or  # Bearish candle
-                        (i > 0 and candle.c < recent_candles[i-1].c)  # Lower close
-                    )
-                    
-                    if is_bearish_reversal:
-                        sweeps.append(LiquiditySweep(
-                            sweep_type='buy_side_sweep',
-                            pool_level=pool_level,
-                            sweep_timestamp=candle.t,
-                            expectation='bearish_move',
-                            strength=min(95, 75 + (20 if candle.v > avg_volume else 0)),
-                            is_confirmed=True,
-                            reversal_candle_index=len(candles) - len(recent_candles) + i
-                        ))
-            
-            # Check sell-side liquidity sweeps (price pokes below lows, reverses up)
-            for pool_name, pool_level in liquidity_pools.get('sell_side', {}).items():
-                # Price touched or slightly exceeded the pool
-                if candle.l <= pool_level * 0.999:  # 0.1% threshold
-                    # Check for reversal (close above open or above previous close)
-                    is_bullish_reversal = (
-                        candle.c > candle.o or  # Bullish candle
-                        (i > 0 and candle.c > recent_candles[i-1].c)  # Higher close
-                    )
-                    
-                    if is_bullish_reversal:
-                        sweeps.append(LiquiditySweep(
-                            sweep_type='sell_side_sweep',
-                            pool_level=pool_level,
-                            sweep_timestamp=candle.t,
-                            expectation='bullish_move',
-                            strength=min(95, 75 + (20 if candle.v > avg_volume else 0)),
-                            is_confirmed=True,
-                            reversal_candle_index=len(candles) - len(recent_candles) + i
-                        ))
+        avg_volume = float(volumes.mean())
+        
+        candle_hits, pool_hits = self._scan_sweeps_incremental(
+            timestamps, opens, highs, lows, closes, levels, n_buy
+        )
+        
+        sweeps = np.empty(len(candle_hits), dtype=_SWEEP_DTYPE)
+        sweeps['side'] = np.where(pool_hits < n_buy, SWEEP_BUY_SIDE, SWEEP_SELL_SIDE)
+        sweeps['pool'] = levels[pool_hits]
+        sweeps['t'] = timestamps[candle_hits]
+        # 75 base, +20 on above-average volume (tops out at 95, no clamp needed)
+        sweeps['strength'] = 75.0 + 20.0 * (volumes[candle_hits] > avg_volume)
+        sweeps['idx'] = base_idx + candle_hits
         
         return sweeps
     
+    def _scan_sweeps_incremental(
+        self,
+        timestamps: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        levels: np.ndarray,
+        n_buy: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run _scan_sweeps over the window, reusing hits from the previous call.
+        
+        A candle's hits only depend on the candle, the previous close and the
+        pool levels, so when the same pools are checked against a window that
+        continues the previous one, only the newly arrived candles are scanned
+        and earlier hits are shifted into the new window.
+        """
+        n = len(timestamps)
+        pools_key = (n_buy, levels.tobytes())
+        state = self._sweep_state
+        
+        start = 0
+        if state is not None and state.pools_key == pools_key:
+            # Locate the last candle seen by the previous scan in this window
+            seen = np.flatnonzero(timestamps == state.last_key[0])
+            if seen.size:
+                m = int(seen[-1])
+                # The previous window must cover everything up to that candle
+                if (highs[m], lows[m], closes[m]) == state.last_key[1:] and m < state.window_len:
+                    start = m + 1
+        
+        if start:
+            shift = state.window_len - start
+            old_candles = state.candle_hits - shift
+            new_candles, new_pools = _scan_sweeps(
+                opens[start:], highs[start:], lows[start:], closes[start:],
+                levels[:n_buy], levels[n_buy:], prev_close=closes[start - 1]
+            )
+            if shift:
+                # The window's first candle has no previous close here, unlike
+                # in the previous window, so it is rescanned on its own
+                keep = old_candles >= 1
+                head_candles, head_pools = _scan_sweeps(
+                    opens[:1], highs[:1], lows[:1], closes[:1],
+                    levels[:n_buy], levels[n_buy:]
+                )
+            else:
+                keep = old_candles >= 0
+                head_candles = head_pools = np.empty(0, dtype=np.intp)
+            candle_hits = np.concatenate((head_candles, old_candles[keep], new_candles + start))
+            pool_hits = np.concatenate((head_pools, state.pool_hits[keep], new_pools))
+        else:
+            candle_hits, pool_hits = _scan_sweeps(
+                opens, highs, lows, closes, levels[:n_buy], levels[n_buy:]
+            )
+        
+        self._sweep_state = _SweepScanState(
+            pools_key=pools_key,
+            last_key=(int(timestamps[-1]), highs[-1], lows[-1], closes[-1]),
+            window_len=n,
+            candle_hits=candle_hits,
+            pool_hits=pool_hits
+        )
+        return candle_hits, pool_hits
+    
     # ============================================================================
     # PHASE 1 SIGNAL ENHANCEMENT CALCULATION
     # ============================================================================
     
+    def _phase1_context(
+        self,
+        candles: List[Candle],
+        liquidity_pools: Dict[str, float],
+        include_pd_arrays: bool = True
+    ) -> _Phase1Context:
+        """
+        Compute the signal-independent Phase 1 inputs for a candle series.
+        
+        Returns:
+            Tuple of (kill_zone_info, pd_info, best_bullish_sweep, best_bearish_sweep);
+            pd_info is None when include_pd_arrays is False
+        """
+        kill_zone_info = self.get_kill_zone_info(candles[-1].t)
+        pd_info = self.calculate_pd_arrays(candles) if include_pd_arrays else None
+        
+        # Strongest sweep per side (first one wins ties); only these become objects
+        sweeps = self.detect_liquidity_sweeps_array(candles, liquidity_pools)
+        best_bullish_sweep = _strongest_sweep(sweeps, SWEEP_SELL_SIDE)
+        best_bearish_sweep = _strongest_sweep(sweeps, SWEEP_BUY_SIDE)
+        
+        return kill_zone_info, pd_info, best_bullish_sweep, best_bearish_sweep
+    
+    def _score_phase1(
+        self,
+        context: _Phase1Context,
+        rec_code: int
+    ) -> Tuple[float, float, float, int]:
+        """
+        Score the Phase 1 context for one recommendation code.
+        
+        Pure numeric core shared by the single and batched paths; rationale
+        text is formatted separately from the returned flags.
+        
+        Returns:
+            Tuple of (kill_zone_bonus, pd_bonus, sweep_bonus, rationale_flags)
+        """
+        kill_zone_info, pd_info, best_bullish_sweep, best_bearish_sweep = context
+        kz_bonus = pd_bonus = sweep_bonus = 0.0
+        flags = 0
+        
+        # 1. Kill Zone
+        if kill_zone_info.is_active:
+            kz_bonus = (kill_zone_info.strength_multiplier - 1.0) * 100
+            flags |= PHASE1_KILL_ZONE
+        
+        # 2. PD Array alignment: buy in discount (OTE pays extra), sell in premium
+        if rec_code == _REC_BUY and pd_info.current_location == 'discount':
+            pd_bonus = 20.0 if pd_info.is_in_ote else 15.0
+            flags |= PHASE1_PD_ARRAY
+        elif rec_code == _REC_SELL and pd_info.current_location == 'premium':
+            pd_bonus = 15.0
+            flags |= PHASE1_PD_ARRAY
+        
+        # 3. Strongest sweep whose expectation aligns with the recommendation
+        best_sweep = (None, best_bullish_sweep, best_bearish_sweep)[rec_code]
+        if best_sweep is not None:
+            sweep_bonus = (best_sweep.strength / 100) * 25  # Max 25 points
+            flags |= PHASE1_LIQUIDITY_SWEEP
+        
+        return kz_bonus, pd_bonus, sweep_bonus, flags
+    
     def calculate_phase1_enhancement(
         self,
         candles: List[Candle],
@@ -394,69 +775,85 @@ class ICTPhase1Enhancements:
         Returns:
             Tuple of (enhancement_bonus, rationale_list)
         """
-        enhancement_bonus = 0.0
         rationale_parts = []
         
         if not candles:
-            return enhancement_bonus, rationale_parts
+            return 0.0, rationale_parts
         
-        current_timestamp = candles[-1].t
+        # Normalize the recommendation once
+        rec_code = _REC_CODES.get(recommendation.lower(), _REC_NEUTRAL)
         
-        # 1. Kill Zone Detection
-        kill_zone_info = self.get_kill_zone_info(current_timestamp)
-        if kill_zone_info.is_active:
-            kz_bonus = (kill_zone_info.strength_multiplier - 1.0) * 100
-            enhancement_bonus += kz_bonus
+        # PD arrays only score buy/sell signals, so neutral ones skip them
+        context = self._phase1_context(
+            candles, liquidity_pools, include_pd_arrays=rec_code != _REC_NEUTRAL
+        )
+        kz_bonus, pd_bonus, sweep_bonus, flags = self._score_phase1(context, rec_code)
+        kill_zone_info, pd_info, best_bullish_sweep, best_bearish_sweep = context
+        
+        if flags & PHASE1_KILL_ZONE:
             rationale_parts.append(
                 f"Kill Zone: {kill_zone_info.zone_type.value} (+{kz_bonus:.0f} points)"
             )
         
-        # 2. PD Array Analysis
-        pd_info = self.calculate_pd_arrays(candles)
-        
-        # Check if signal aligns with PD array location
-        pd_aligned = False
-        if recommendation.lower() == 'buy' and pd_info.current_location == 'discount':
-            pd_aligned = True
-            pd_bonus = 15.0  # Bonus for buying in discount
-            if pd_info.is_in_ote:
-                pd_bonus = 20.0  # Extra bonus for OTE entry
-        elif recommendation.lower() == 'sell' and pd_info.current_location == 'premium':
-            pd_aligned = True
-            pd_bonus = 15.0  # Bonus for selling in premium
-        else:
-            pd_bonus = 0.0
-        
-        if pd_aligned:
-            enhancement_bonus += pd_bonus
+        if flags & PHASE1_PD_ARRAY:
             rationale_parts.append(
                 f"PD Array: {pd_info.current_location.title()} zone aligned "
                 f"({'+OTE' if pd_info.is_in_ote else 'standard'}) (+{pd_bonus:.0f} points)"
             )
         
-        # 3. Liquidity Sweep Detection
-        sweeps = self.detect_liquidity_sweeps(candles, liquidity_pools)
-        recent_sweeps = [s for s in sweeps if s.is_confirmed]
-        
-        if recent_sweeps:
-            # Check if sweep expectation aligns with recommendation
-            aligned_sweeps = []
-            for sweep in recent_sweeps:
-                if (recommendation.lower() == 'buy' and sweep.expectation == 'bullish_move') or \
-                   (recommendation.lower() == 'sell' and sweep.expectation == 'bearish_move'):
-                    aligned_sweeps.append(sweep)
-            
-            if aligned_sweeps:
-                # Use the strongest aligned sweep
-                best_sweep = max(aligned_sweeps, key=lambda x: x.strength)
-                sweep_bonus = (best_sweep.strength / 100) * 25  # Max 25 points
-                enhancement_bonus += sweep_bonus
-                rationale_parts.append(
-                    f"Liquidity Sweep: {best_sweep.sweep_type} confirmed "
-                    f"(strength: {best_sweep.strength:.0f}) (+{sweep_bonus:.0f} points)"
-                )
+        if flags & PHASE1_LIQUIDITY_SWEEP:
+            best_sweep = best_bullish_sweep if rec_code == _REC_BUY else best_bearish_sweep
+            rationale_parts.append(
+                f"Liquidity Sweep: {best_sweep.sweep_type} confirmed "
+                f"(strength: {best_sweep.strength:.0f}) (+{sweep_bonus:.0f} points)"
+            )
         
         # Cap enhancement bonus
-        enhancement_bonus = min(enhancement_bonus, 40.0)
+        enhancement_bonus = min(kz_bonus + pd_bonus + sweep_bonus, 40.0)
         
         return enhancement_bonus, rationale_parts
+    
+    def calculate_phase1_enhancement_batch(
+        self,
+        candles: List[Candle],
+        liquidity_pools: Dict[str, float],
+        base_strengths: np.ndarray,
+        recommendations: Sequence[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate Phase 1 enhancement bonuses for many signals on the same candles.
+        
+        Kill zone, PD arrays and liquidity sweeps are evaluated once; since the
+        result only depends on the recommendation, each of buy/sell/neutral is
+        scored once and broadcast to the signals. Rationale is returned as bit
+        flags (PHASE1_KILL_ZONE | PHASE1_PD_ARRAY | PHASE1_LIQUIDITY_SWEEP) so
+        string formatting can be deferred until display.
+        
+        Args:
+            candles: Recent candles for analysis
+            liquidity_pools: Detected liquidity pools
+            base_strengths: Base signal strengths before enhancement
+            recommendations: Signal recommendations ('buy', 'sell', 'neutral')
+            
+        Returns:
+            Tuple of (enhancement_bonuses, rationale_flags) arrays
+        """
+        n = len(base_strengths)
+        
+        if not candles or n == 0:
+            return np.zeros(n, dtype=np.float64), np.zeros(n, dtype=np.uint8)
+        
+        context = self._phase1_context(candles, liquidity_pools)
+        
+        # Bonus and flags per recommendation code (neutral, buy, sell)
+        code_bonuses = np.empty(3, dtype=np.float64)
+        code_flags = np.empty(3, dtype=np.uint8)
+        for rec_code in (_REC_NEUTRAL, _REC_BUY, _REC_SELL):
+            kz_bonus, pd_bonus, sweep_bonus, flags = self._score_phase1(context, rec_code)
+            code_bonuses[rec_code] = min(kz_bonus + pd_bonus + sweep_bonus, 40.0)
+            code_flags[rec_code] = flags
+        
+        recs = np.char.lower(np.asarray(recommendations, dtype=str))
+        rec_codes = np.where(recs == 'buy', _REC_BUY, np.where(recs == 'sell', _REC_SELL, _REC_NEUTRAL))
+        
+        return code_bonuses[rec_codes], code_flags[rec_codes]
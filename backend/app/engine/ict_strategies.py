@@ -10,13 +10,15 @@ This module implements the core ICT trading strategies:
 Based on ICT methodology by Michael J. Huddleston
 """
 
-from typing import List, Dict, Optional, Tuple, NamedTuple
+from typing import Any, Callable, List, Dict, Optional, Sequence, Tuple, NamedTuple
 from dataclasses import dataclass
+import heapq
 from enum import Enum
 import numpy as np
-import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ..models import Candle
+from .signals import signal_directions
 
 
 class ICTSignal(Enum):
@@ -34,6 +36,14 @@ class ICTSignal(Enum):
     NEUTRAL = "neutral"
 
 
+# Most recent order blocks / fair value gaps kept per ICTStrategies instance
+_MAX_TRACKED_ZONES = 500
+
+
+# Trade direction per signal type (1 = bullish, -1 = bearish, 0 = neutral)
+_SIGNAL_DIRECTION: Dict[ICTSignal, int] = signal_directions(ICTSignal)
+
+
 @dataclass
 class OrderBlock:
     """Represents an order block zone"""
@@ -82,17 +92,275 @@ class ICTSignalResult:
     entry_zone: Tuple[float, float]  # (low, high)
     stop_loss: float
     take_profit: float
-    rationale: List[str]
+    rationale: Sequence[str]
     market_phase: Optional[str] = None
     liquidity_pool: Optional[float] = None
+    
+    @property
+    def direction(self) -> int:
+        """Trade direction: 1 bullish, -1 bearish, 0 neutral"""
+        return _SIGNAL_DIRECTION[self.signal_type]
+
+
+# Fixed rationales, shared by every signal of a kind (never mutated)
+_BOS_BULLISH_RATIONALE: Tuple[str, ...] = (
+    "Bullish Break of Structure confirmed",
+    "Higher high established",
+)
+_BOS_BEARISH_RATIONALE: Tuple[str, ...] = (
+    "Bearish Break of Structure confirmed",
+    "Lower low established",
+)
+_BULLISH_BREAKER_RATIONALE: Tuple[str, ...] = (
+    "Bearish order block broken to upside",
+    "Support-resistance role reversal confirmed",
+    "High-probability bullish setup",
+)
+_BEARISH_BREAKER_RATIONALE: Tuple[str, ...] = (
+    "Bullish order block broken to downside",
+    "Support-resistance role reversal confirmed",
+    "High-probability bearish setup",
+)
+_MM_BUY_RATIONALE: Tuple[str, ...] = (
+    "Market Maker Buy Model phase detected",
+    "Accumulation → Distribution pattern identified",
+    "Smart Money accumulation in progress",
+)
+_MM_SELL_RATIONALE: Tuple[str, ...] = (
+    "Market Maker Sell Model phase detected",
+    "Distribution → Accumulation pattern identified",
+    "Smart Money distribution in progress",
+)
+
+
+# Column layouts (dtype, fill value) of the order block and FVG stores
+_ORDER_BLOCK_COLUMNS: Dict[str, Tuple[type, object]] = {
+    'high': (np.float64, 0.0),
+    'low': (np.float64, 0.0),
+    'timestamp': (np.int64, 0),
+    'bullish': (np.bool_, False),  # type: True = 'bullish', False = 'bearish'
+    'confirmed': (np.bool_, False),
+    'broken': (np.bool_, False),
+    'breaker_confirmed': (np.bool_, False),
+    'pool_key': (object, None),  # 'block_<timestamp>' liquidity pool key
+}
+
+_FVG_COLUMNS: Dict[str, Tuple[type, object]] = {
+    'high': (np.float64, 0.0),
+    'low': (np.float64, 0.0),
+    'start_timestamp': (np.int64, 0),
+    'end_timestamp': (np.int64, 0),
+    'bullish': (np.bool_, False),  # direction: True = 'bullish', False = 'bearish'
+    'filled': (np.bool_, False),
+    'fill_price': (np.float64, np.nan),  # NaN = None
+}
+
+
+class _ColumnStore:
+    """
+    Columnar (one array per field) store keeping the most recent maxlen rows
+    
+    Rows live in [start, end) of buffers sized 2 * maxlen; when the end is
+    reached, the live rows are moved back to the front, so appends stay
+    amortized O(1) per row.
+    """
+    
+    __slots__ = ('maxlen', '_columns', '_fills', '_start', '_end')
+    
+    def __init__(self, columns: Dict[str, Tuple[type, object]], maxlen: int):
+        self.maxlen = maxlen
+        self._columns = {
+            name: np.full(2 * maxlen, fill, dtype=dtype)
+            for name, (dtype, fill) in columns.items()
+        }
+        self._fills = {name: fill for name, (_, fill) in columns.items()}
+        self._start = 0
+        self._end = 0
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Column names"""
+        return tuple(self._columns)
+    
+    def column(self, name: str) -> np.ndarray:
+        """Writable view of a column's live rows, oldest first"""
+        return self._columns[name][self._start:self._end]
+    
+    def extend(self, **values: np.ndarray) -> Dict[str, np.ndarray]:
+        """Append rows (missing columns get their fill value); return the evicted rows"""
+        k = len(next(iter(values.values())))
+        maxlen = self.maxlen
+        n_evict = max(len(self) + k - maxlen, 0)
+        
+        # Rows pushed out by the new ones, oldest first; when more than maxlen
+        # rows arrive, the oldest new rows are dropped as well
+        n_old = min(n_evict, len(self))
+        evicted = {name: self.column(name)[:n_old].copy() for name in values}
+        if k > maxlen:
+            evicted = {
+                name: np.concatenate((rows, values[name][:k - maxlen]))
+                for name, rows in evicted.items()
+            }
+        
+        k_kept = min(k, maxlen)
+        self._start += n_old
+        if self._end + k_kept > 2 * maxlen:
+            for col in self._columns.values():
+                col[:len(self)] = col[self._start:self._end]
+            self._end -= self._start
+            self._start = 0
+        
+        end = self._end + k_kept
+        for name, col in self._columns.items():
+            col[self._end:end] = values[name][k - k_kept:] if name in values else self._fills[name]
+        self._end = end
+        
+        return evicted
+
+
+class _RowView(Sequence):
+    """Read-only sequence over a _ColumnStore that builds row objects on access"""
+    
+    __slots__ = ('_store', '_make_row')
+    
+    def __init__(self, store: _ColumnStore, make_row: Callable[[Dict[str, Any]], Any]):
+        self._store = store
+        self._make_row = make_row
+    
+    def __len__(self) -> int:
+        return len(self._store)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("row index out of range")
+        
+        return self._make_row({
+            name: self._store.column(name)[index:index + 1].tolist()[0]
+            for name in self._store.names
+        })
+
+
+def _order_block_from_row(row: Dict[str, Any]) -> OrderBlock:
+    """Build an OrderBlock from a _ColumnStore row"""
+    return OrderBlock(
+        high=row['high'],
+        low=row['low'],
+        timestamp=row['timestamp'],
+        type='bullish' if row['bullish'] else 'bearish',
+        confirmed=row['confirmed'],
+        broken=row['broken'],
+        breaker_confirmed=row['breaker_confirmed']
+    )
+
+
+def _fair_value_gap_from_row(row: Dict[str, Any]) -> FairValueGap:
+    """Build a FairValueGap from a _ColumnStore row"""
+    fill_price = row['fill_price']
+    return FairValueGap(
+        high=row['high'],
+        low=row['low'],
+        start_timestamp=row['start_timestamp'],
+        end_timestamp=row['end_timestamp'],
+        direction='bullish' if row['bullish'] else 'bearish',
+        filled=row['filled'],
+        fill_price=None if np.isnan(fill_price) else fill_price
+    )
+
+
+def _candles_to_arrays(
+    candles: List[Candle],
+    dtype: type = np.float64
+) -> Tuple[np.ndarray, ...]:
+    """
+    Convert candles to (timestamps, opens, highs, lows, closes, volumes) arrays
+    
+    Timestamps are int64; the price and volume columns use `dtype`.
+    """
+    n = len(candles)
+    timestamps = np.empty(n, dtype=np.int64)
+    opens = np.empty(n, dtype=dtype)
+    highs = np.empty(n, dtype=dtype)
+    lows = np.empty(n, dtype=dtype)
+    closes = np.empty(n, dtype=dtype)
+    volumes = np.empty(n, dtype=dtype)
+    
+    for i, c in enumerate(candles):
+        timestamps[i] = c.t
+        opens[i] = c.o
+        highs[i] = c.h
+        lows[i] = c.l
+        closes[i] = c.c
+        volumes[i] = c.v
+    
+    return timestamps, opens, highs, lows, closes, volumes
+
+
+def _compute_features(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Compute the event masks of every detector in one pass over the OHLC arrays
+    
+    Masks are aligned to candle index (entry i describes candle i). Swing
+    masks cover only the last 10 candles, the window market structure uses.
+    """
+    n = len(closes)
+    features = {
+        name: np.zeros(n, dtype=bool)
+        for name in ('strong_bearish', 'strong_bullish', 'fvg_bullish', 'fvg_bearish')
+    }
+    
+    # Strong candles: close moves more than 2% against the previous close
+    prev_closes = closes[:-1]
+    strong_bearish = closes[1:] < prev_closes * 0.98
+    features['strong_bearish'][1:] = strong_bearish
+    features['strong_bullish'][1:] = ~strong_bearish & (closes[1:] > prev_closes * 1.02)
+    
+    # Bullish FVG: current low jumps above the low two candles back
+    # Bearish FVG: current high drops below the high two candles back
+    fvg_bullish = lows[2:] > lows[:-2] * 1.001
+    features['fvg_bullish'][2:] = fvg_bullish
+    features['fvg_bearish'][2:] = ~fvg_bullish & (highs[2:] < highs[:-2] * 0.999)
+    
+    # Swing points: the middle bar of a 5-bar window is its extreme
+    recent_highs = highs[-10:]
+    recent_lows = lows[-10:]
+    swing_highs = np.zeros(len(recent_highs), dtype=bool)
+    swing_lows = np.zeros(len(recent_highs), dtype=bool)
+    if len(recent_highs) >= 5:
+        high_windows = sliding_window_view(recent_highs, 5)
+        low_windows = sliding_window_view(recent_lows, 5)
+        swing_highs[2:-2] = high_windows.max(axis=1) == high_windows[:, 2]
+        swing_lows[2:-2] = ~swing_highs[2:-2] & (low_windows.min(axis=1) == low_windows[:, 2])
+    features['swing_high'] = swing_highs
+    features['swing_low'] = swing_lows
+    
+    return features
 
 
 class ICTStrategies:
     """Main ICT strategies class"""
     
     def __init__(self):
-        self.order_blocks: List[OrderBlock] = []
-        self.fair_value_gaps: List[FairValueGap] = []
+        # Order blocks and FVGs are stored column-wise; see the properties below
+        self._order_blocks = _ColumnStore(_ORDER_BLOCK_COLUMNS, _MAX_TRACKED_ZONES)
+        self._fair_value_gaps = _ColumnStore(_FVG_COLUMNS, _MAX_TRACKED_ZONES)
+        # Running extrema of order block levels, updated as blocks are added
+        self._max_bearish_block_high = float('-inf')
+        self._min_bullish_block_low = float('inf')
+        # (t, h, l, c) of the last candle scanned for order blocks and FVGs
+        self._last_scanned: Optional[Tuple[int, float, float, float]] = None
         self.market_structure = MarketStructure(
             trend='neutral',
             last_swing_high=0.0,
@@ -102,6 +370,16 @@ class ICTStrategies:
         )
         self._initialize_market_structure()
     
+    @property
+    def order_blocks(self) -> Sequence[OrderBlock]:
+        """Tracked order blocks, oldest first"""
+        return _RowView(self._order_blocks, _order_block_from_row)
+    
+    @property
+    def fair_value_gaps(self) -> Sequence[FairValueGap]:
+        """Tracked fair value gaps, oldest first"""
+        return _RowView(self._fair_value_gaps, _fair_value_gap_from_row)
+    
     def _initialize_market_structure(self):
         """Initialize market structure with basic state"""
         self.market_structure = MarketStructure(
@@ -117,360 +395,450 @@ class ICTStrategies:
         if len(candles) < 50:  # Need sufficient data
             return []
         
-        # Convert to pandas for easier analysis
-        df = pd.DataFrame([{
-            'timestamp': c.t,
-            'open': c.o,
-            'high': c.h,
-            'low': c.l,
-            'close': c.c,
-            'volume': c.v
-        } for c in candles])
+        # One contiguous array per OHLCV column
+        return self.analyze_arrays(*_candles_to_arrays(candles))
+    
+    def analyze_arrays(
+        self,
+        timestamps: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray
+    ) -> List[ICTSignalResult]:
+        """
+        Analyze pre-packed OHLCV column arrays for ICT patterns
+        
+        Same as analyze_candles, but skips the per-candle conversion when
+        the caller already holds the columns. Price columns may be float32;
+        detection runs in the input precision, while stored zones and
+        signal prices are reported as float64.
+        """
+        if len(closes) < 50:  # Need sufficient data
+            return []
+        
+        # Zero-copy views of the recent window, shared by the detectors below
+        t30, h30, l30, c30 = timestamps[-30:], highs[-30:], lows[-30:], closes[-30:]
+        
+        # Event masks for all detectors, computed once
+        features = _compute_features(highs, lows, closes)
+        
+        # Candles up to the last one scanned before were already searched for
+        # order blocks and FVGs; only newer candles can add more
+        first_new = self._first_unscanned_index(timestamps, highs, lows, closes)
         
         results = []
         
         # 1. Detect Order Blocks
-        self._detect_order_blocks(df)
+        self._detect_order_blocks(
+            t30[-20:], h30[-20:], l30[-20:],
+            features['strong_bullish'][-20:], features['strong_bearish'][-20:],
+            start=max(first_new - (len(closes) - 20), 1)
+        )
         
         # 2. Detect Fair Value Gaps
-        self._detect_fair_value_gaps(df)
+        self._detect_fair_value_gaps(
+            timestamps, highs, lows, features['fvg_bullish'], features['fvg_bearish'],
+            start=first_new
+        )
         
         # 3. Analyze Market Structure and BOS/MSS
-        bos_mss_results = self._analyze_market_structure(df)
+        bos_mss_results = self._analyze_market_structure(
+            t30[-10:], h30[-10:], l30[-10:], features['swing_high'], features['swing_low']
+        )
         results.extend(bos_mss_results)
         
         # 4. Detect Breaker Blocks
-        breaker_results = self._detect_breaker_blocks(candles[-20:])  # Recent candles
+        breaker_results = self._detect_breaker_blocks(c30[-20:])  # Recent closes
         results.extend(breaker_results)
         
         # 5. Analyze Market Maker Model
-        mm_results = self._analyze_market_maker_model(df)
+        mm_results = self._analyze_market_maker_model(h30, l30, c30)
         results.extend(mm_results)
         
         # 6. Combine and rank signals
         return self._rank_and_filter_signals(results)
     
-    def _detect_order_blocks(self, df: pd.DataFrame):
-        """Detect order blocks in price action"""
-        recent_candles = df.tail(20)
+    def _first_unscanned_index(
+        self,
+        timestamps: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray
+    ) -> int:
+        """Index of the first candle after the last scanned one (0 for a different series)"""
+        last_scanned = self._last_scanned
+        self._last_scanned = (int(timestamps[-1]), highs[-1], lows[-1], closes[-1])
+        
+        if last_scanned is None:
+            return 0
+        
+        seen = np.flatnonzero(timestamps == last_scanned[0])
+        if seen.size:
+            i = int(seen[-1])
+            if (highs[i], lows[i], closes[i]) == last_scanned[1:]:
+                return i + 1
+        return 0
+    
+    def _detect_order_blocks(
+        self,
+        timestamps: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        bullish: np.ndarray,
+        bearish: np.ndarray,
+        start: int = 1
+    ):
+        """Detect order blocks in the given recent candles from the strong-candle masks"""
+        # Strong candles from `start` on mark the previous candle as an order
+        # block; the window's first candle has no previous candle in the window
+        start = max(start, 1)
+        idx = np.flatnonzero(bullish[start:] | bearish[start:]) + start
+        if not idx.size:
+            return
+        
+        block_bullish = bullish[idx]
+        block_highs = highs[idx - 1]
+        block_lows = lows[idx - 1]
+        block_timestamps = timestamps[idx]
+        evicted = self._order_blocks.extend(
+            high=block_highs,
+            low=block_lows,
+            timestamp=block_timestamps,
+            bullish=block_bullish,
+            # Format each block's pool key once, not on every get_liquidity_pools
+            pool_key=np.array(
+                [f'block_{timestamp}' for timestamp in block_timestamps.tolist()],
+                dtype=object
+            )
+        )
         
-        for i in range(1, len(recent_candles)):
-            current = recent_candles.iloc[i]
-            previous = recent_candles.iloc[i-1]
-            
-            # Look for strong rejection patterns
-            if current['close'] < previous['close'] * 0.98:  # Strong bearish candle
-                # Potential bearish order block
-                block = OrderBlock(
-                    high=previous['high'],
-                    low=previous['low'],
-                    timestamp=current['timestamp'],
-                    type='bearish'
-                )
-                self.order_blocks.append(block)
-            
-            elif current['close'] > previous['close'] * 1.02:  # Strong bullish candle
-                # Potential bullish order block
-                block = OrderBlock(
-                    high=previous['high'],
-                    low=previous['low'],
-                    timestamp=current['timestamp'],
-                    type='bullish'
-                )
-                self.order_blocks.append(block)
-    
-    def _detect_fair_value_gaps(self, df: pd.DataFrame):
-        """Detect Fair Value Gaps (price imbalances)"""
-        for i in range(2, len(df)):
-            current = df.iloc[i]
-            gap_candle = df.iloc[i-1]
-            prev_candle = df.iloc[i-2]
-            
-            # Bullish FVG: gap between prev_candle low and current high
-            if current['low'] > prev_candle['low'] * 1.001:  # Price jump up
-                fvg = FairValueGap(
-                    high=current['low'],
-                    low=prev_candle['low'],
-                    start_timestamp=prev_candle['timestamp'],
-                    end_timestamp=current['timestamp'],
-                    direction='bullish'
-                )
-                self.fair_value_gaps.append(fvg)
-            
-            # Bearish FVG: gap between current high and prev_candle low
-            elif current['high'] < prev_candle['high'] * 0.999:  # Price drop down
-                fvg = FairValueGap(
-                    high=prev_candle['high'],
-                    low=current['high'],
-                    start_timestamp=prev_candle['timestamp'],
-                    end_timestamp=current['timestamp'],
-                    direction='bearish'
-                )
-                self.fair_value_gaps.append(fvg)
+        # Update the running extrema with the new blocks
+        new_bearish_highs = block_highs[~block_bullish]
+        new_bullish_lows = block_lows[block_bullish]
+        if new_bearish_highs.size:
+            self._max_bearish_block_high = max(self._max_bearish_block_high, new_bearish_highs.max())
+        if new_bullish_lows.size:
+            self._min_bullish_block_low = min(self._min_bullish_block_low, new_bullish_lows.min())
+        
+        # Recompute them if an extreme block was evicted
+        evicted_bullish = evicted['bullish']
+        if (
+            np.any(evicted['high'][~evicted_bullish] == self._max_bearish_block_high)
+            or np.any(evicted['low'][evicted_bullish] == self._min_bullish_block_low)
+        ):
+            self._refresh_block_extrema()
+    
+    def _refresh_block_extrema(self):
+        """Recompute the order block extrema from the retained blocks"""
+        bullish = self._order_blocks.column('bullish')
+        bearish_highs = self._order_blocks.column('high')[~bullish]
+        bullish_lows = self._order_blocks.column('low')[bullish]
+        self._max_bearish_block_high = bearish_highs.max() if bearish_highs.size else float('-inf')
+        self._min_bullish_block_low = bullish_lows.min() if bullish_lows.size else float('inf')
     
-    def _analyze_market_structure(self, df: pd.DataFrame) -> List[ICTSignalResult]:
-        """Analyze market structure for BOS/MSS patterns"""
+    def _detect_fair_value_gaps(
+        self,
+        timestamps: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        bullish: np.ndarray,
+        bearish: np.ndarray,
+        start: int = 0
+    ):
+        """Detect Fair Value Gaps (price imbalances) ending at candles from `start` on"""
+        idx = np.flatnonzero(bullish[start:] | bearish[start:]) + start
+        if not idx.size:
+            return
+        
+        # Bullish gaps span the lows, bearish gaps the highs, of candles i-2 and i
+        gap_bullish = bullish[idx]
+        self._fair_value_gaps.extend(
+            high=np.where(gap_bullish, lows[idx], highs[idx - 2]),
+            low=np.where(gap_bullish, lows[idx - 2], highs[idx]),
+            start_timestamp=timestamps[idx - 2],
+            end_timestamp=timestamps[idx],
+            bullish=gap_bullish
+        )
+    
+    def _analyze_market_structure(
+        self,
+        timestamps: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        swing_highs: np.ndarray,
+        swing_lows: np.ndarray
+    ) -> List[ICTSignalResult]:
+        """Analyze market structure for BOS/MSS patterns in the last 10 candles"""
         results = []
         
-        if len(df) < 10:
+        if len(highs) < 10:
             return results
         
-        recent_data = df.tail(10)
-        
-        # Identify swing points
-        for i in range(2, len(recent_data)-2):
-            current = recent_data.iloc[i]
-            
-            # Check for swing high (local peak)
-            if all(current['high'] >= recent_data.iloc[j]['high'] for j in range(i-2, i+3)):
-                self.market_structure.last_swing_high = current['high']
-                self.market_structure.swing_high_timestamp = current['timestamp']
-                
-                # Check for BOS/Breakout
-                if self._check_bullish_bos():
-                    result = ICTSignalResult(
-                        signal_type=ICTSignal.BOS_BULLISH,
-                        strength=75.0,
-                        confidence=80.0,
-                        price=current['high'],
-                        entry_zone=(current['low'], current['high']),
-                        stop_loss=current['low'] * 0.995,
-                        take_profit=current['high'] * 1.02,
-                        rationale=["Bullish Break of Structure confirmed", "Higher high established"],
-                        liquidity_pool=current['high']
-                    )
-                    results.append(result)
-                    self.market_structure.bos_confirmed = True
-                    self.market_structure.bos_direction = 'bullish'
-            
-            # Check for swing low (local trough)
-            elif all(current['low'] <= recent_data.iloc[j]['low'] for j in range(i-2, i+3)):
-                self.market_structure.last_swing_low = current['low']
-                self.market_structure.swing_low_timestamp = current['timestamp']
-                
-                # Check for BOS/Breakdown
-                if self._check_bearish_bos():
-                    result = ICTSignalResult(
-                        signal_type=ICTSignal.BOS_BEARISH,
-                        strength=75.0,
-                        confidence=80.0,
-                        price=current['low'],
-                        entry_zone=(current['low'], current['high']),
-                        stop_loss=current['high'] * 1.005,
-                        take_profit=current['low'] * 0.98,
-                        rationale=["Bearish Break of Structure confirmed", "Lower low established"],
-                        liquidity_pool=current['low']
-                    )
-                    results.append(result)
-                    self.market_structure.bos_confirmed = True
-                    self.market_structure.bos_direction = 'bearish'
-        
-        return results
+        ms = self.market_structure
+        high_idx = np.flatnonzero(swing_highs)
+        low_idx = np.flatnonzero(swing_lows)
+        
+        # Market structure tracks the latest swing point of each kind
+        if high_idx.size:
+            ms.last_swing_high = float(highs[high_idx[-1]])
+            ms.swing_high_timestamp = int(timestamps[high_idx[-1]])
+        if low_idx.size:
+            ms.last_swing_low = float(lows[low_idx[-1]])
+            ms.swing_low_timestamp = int(timestamps[low_idx[-1]])
+        
+        # Swing points that break structure
+        bullish_breaks = high_idx[self._check_bullish_bos(highs[high_idx])]
+        bearish_breaks = low_idx[self._check_bearish_bos(lows[low_idx])]
+        
+        # Only the earliest break per direction can survive signal ranking,
+        # so emit just that one
+        breaks = []
+        if bullish_breaks.size:
+            i = bullish_breaks[0]
+            high, low = float(highs[i]), float(lows[i])
+            breaks.append((i, ICTSignalResult(
+                signal_type=ICTSignal.BOS_BULLISH,
+                strength=75.0,
+                confidence=80.0,
+                price=high,
+                entry_zone=(low, high),
+                stop_loss=low * 0.995,
+                take_profit=high * 1.02,
+                rationale=_BOS_BULLISH_RATIONALE,
+                liquidity_pool=high
+            )))
+        
+        if bearish_breaks.size:
+            i = bearish_breaks[0]
+            high, low = float(highs[i]), float(lows[i])
+            breaks.append((i, ICTSignalResult(
+                signal_type=ICTSignal.BOS_BEARISH,
+                strength=75.0,
+                confidence=80.0,
+                price=low,
+                entry_zone=(low, high),
+                stop_loss=high * 1.005,
+                take_profit=low * 0.98,
+                rationale=_BOS_BEARISH_RATIONALE,
+                liquidity_pool=low
+            )))
+        
+        if breaks:
+            # The latest break sets the BOS direction
+            ms.bos_confirmed = True
+            if not bearish_breaks.size:
+                ms.bos_direction = 'bullish'
+            elif not bullish_breaks.size:
+                ms.bos_direction = 'bearish'
+            else:
+                ms.bos_direction = 'bullish' if bullish_breaks[-1] > bearish_breaks[-1] else 'bearish'
+        
+        # Emit in candle order
+        breaks.sort(key=lambda item: item[0])
+        return [result for _, result in breaks]
     
-    def _check_bullish_bos(self) -> bool:
-        """Check for bullish Break of Structure"""
-        if len(self.order_blocks) == 0:
-            return False
+    def _check_bullish_bos(self, swing_highs: np.ndarray) -> np.ndarray:
+        """Check which swing highs confirm a bullish Break of Structure"""
+        # No bearish order block means no resistance to break
+        if self._max_bearish_block_high == float('-inf'):
+            return np.zeros(len(swing_highs), dtype=bool)
         
         # Look for recent resistance break
-        recent_resistance = max([block.high for block in self.order_blocks if block.type == 'bearish'])
-        return self.market_structure.last_swing_high > recent_resistance * 1.001
+        recent_resistance = self._max_bearish_block_high
+        return swing_highs > recent_resistance * 1.001
     
-    def _check_bearish_bos(self) -> bool:
-        """Check for bearish Break of Structure"""
-        if len(self.order_blocks) == 0:
-            return False
+    def _check_bearish_bos(self, swing_lows: np.ndarray) -> np.ndarray:
+        """Check which swing lows confirm a bearish Break of Structure"""
+        # No bullish order block means no support to break
+        if self._min_bullish_block_low == float('inf'):
+            return np.zeros(len(swing_lows), dtype=bool)
         
         # Look for recent support break
-        recent_support = min([block.low for block in self.order_blocks if block.type == 'bullish'])
-        return self.market_structure.last_swing_low < recent_support * 0.999
+        recent_support = self._min_bullish_block_low
+        return swing_lows < recent_support * 0.999
     
-    def _detect_breaker_blocks(self, recent_candles: List[Candle]) -> List[ICTSignalResult]:
+    def _detect_breaker_blocks(self, recent_closes: np.ndarray) -> List[ICTSignalResult]:
         """Detect Breaker Blocks in recent price action"""
         results = []
         
-        if len(recent_candles) < 3:
+        if len(recent_closes) < 3:
             return results
         
-        current_price = recent_candles[-1].close
-        
-        for block in self.order_blocks[-10:]:  # Check recent order blocks
-            if not block.broken:
-                # Check if block was broken
-                if block.type == 'bearish' and current_price > block.high:
-                    # Bullish Breaker Block confirmed
-                    block.broken = True
-                    block.breaker_confirmed = True
-                    
-                    result = ICTSignalResult(
-                        signal_type=ICTSignal.BULLISH_BREAKER,
-                        strength=85.0,
-                        confidence=90.0,
-                        price=current_price,
-                        entry_zone=(block.low, block.high),
-                        stop_loss=block.low * 0.997,
-                        take_profit=block.high * 1.03,
-                        rationale=[
-                            "Bearish order block broken to upside",
-                            "Support-resistance role reversal confirmed",
-                            "High-probability bullish setup"
-                        ],
-                        market_phase="Smart Money Reversal (SMR)"
-                    )
-                    results.append(result)
-                
-                elif block.type == 'bullish' and current_price < block.low:
-                    # Bearish Breaker Block confirmed
-                    block.broken = True
-                    block.breaker_confirmed = True
-                    
-                    result = ICTSignalResult(
-                        signal_type=ICTSignal.BEARISH_BREAKER,
-                        strength=85.0,
-                        confidence=90.0,
-                        price=current_price,
-                        entry_zone=(block.low, block.high),
-                        stop_loss=block.high * 1.003,
-                        take_profit=block.low * 0.97,
-                        rationale=[
-                            "Bullish order block broken to downside",
-                            "Support-resistance role reversal confirmed",
-                            "High-probability bearish setup"
-                        ],
-                        market_phase="Smart Money Reversal (SMR)"
-                    )
-                    results.append(result)
+        current_price = float(recent_closes[-1])
+        
+        # Check recent order blocks (writable views of the last 10)
+        store = self._order_blocks
+        start = max(len(store) - 10, 0)
+        block_highs = store.column('high')[start:]
+        block_lows = store.column('low')[start:]
+        block_bullish = store.column('bullish')[start:]
+        block_broken = store.column('broken')[start:]
+        block_breaker = store.column('breaker_confirmed')[start:]
+        
+        # Only blocks that are not broken yet can turn into breakers: bearish
+        # blocks broken to the upside, bullish blocks broken to the downside
+        active = ~block_broken
+        bullish_breakers = active & ~block_bullish & (current_price > block_highs)
+        bearish_breakers = active & block_bullish & (current_price < block_lows)
+        breakers = bullish_breakers | bearish_breakers
+        block_broken[breakers] = True
+        block_breaker[breakers] = True
+        
+        for i in np.flatnonzero(breakers).tolist():
+            high = float(block_highs[i])
+            low = float(block_lows[i])
+            
+            if bullish_breakers[i]:
+                # Bullish Breaker Block confirmed
+                result = ICTSignalResult(
+                    signal_type=ICTSignal.BULLISH_BREAKER,
+                    strength=85.0,
+                    confidence=90.0,
+                    price=current_price,
+                    entry_zone=(low, high),
+                    stop_loss=low * 0.997,
+                    take_profit=high * 1.03,
+                    rationale=_BULLISH_BREAKER_RATIONALE,
+                    market_phase="Smart Money Reversal (SMR)"
+                )
+                results.append(result)
+            
+            else:
+                # Bearish Breaker Block confirmed
+                result = ICTSignalResult(
+                    signal_type=ICTSignal.BEARISH_BREAKER,
+                    strength=85.0,
+                    confidence=90.0,
+                    price=current_price,
+                    entry_zone=(low, high),
+                    stop_loss=high * 1.003,
+                    take_profit=low * 0.97,
+                    rationale=_BEARISH_BREAKER_RATIONALE,
+                    market_phase="Smart Money Reversal (SMR)"
+                )
+                results.append(result)
         
         return results
     
-    def _analyze_market_maker_model(self, df: pd.DataFrame) -> List[ICTSignalResult]:
-        """Analyze Market Maker Model patterns"""
+    def _analyze_market_maker_model(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray
+    ) -> List[ICTSignalResult]:
+        """Analyze Market Maker Model patterns in the last 30 candles"""
         results = []
         
-        if len(df) < 30:
+        if len(closes) < 30:
             return results
         
-        # Analyze recent price action for MM Model phases
-        recent_data = df.tail(30)
-        
         # Calculate volatility and range
-        price_range = recent_data['high'].max() - recent_data['low'].min()
-        current_price = recent_data['close'].iloc[-1]
-        avg_price = recent_data['close'].mean()
+        range_high = float(highs.max())
+        range_low = float(lows.min())
+        price_range = range_high - range_low
+        current_price = float(closes[-1])
+        avg_price = float(closes.mean(dtype=np.float64))
         
         # Market Maker Buy Model detection
-        if self._detect_market_maker_buy_model(recent_data):
+        if self._detect_market_maker_buy_model(highs, lows, closes):
             result = ICTSignalResult(
                 signal_type=ICTSignal.MM_BUY_MODEL,
                 strength=90.0,
                 confidence=85.0,
                 price=current_price,
                 entry_zone=(avg_price * 0.99, avg_price),
-                stop_loss=recent_data['low'].min() * 0.997,
+                stop_loss=range_low * 0.997,
                 take_profit=avg_price * 1.05,
-                rationale=[
-                    "Market Maker Buy Model phase detected",
-                    "Accumulation → Distribution pattern identified",
-                    "Smart Money accumulation in progress"
-                ],
+                rationale=_MM_BUY_RATIONALE,
                 market_phase="Accumulation to Distribution"
             )
             results.append(result)
         
         # Market Maker Sell Model detection
-        elif self._detect_market_maker_sell_model(recent_data):
+        elif self._detect_market_maker_sell_model(highs, lows, closes):
             result = ICTSignalResult(
                 signal_type=ICTSignal.MM_SELL_MODEL,
                 strength=90.0,
                 confidence=85.0,
                 price=current_price,
                 entry_zone=(avg_price, avg_price * 1.01),
-                stop_loss=recent_data['high'].max() * 1.003,
+                stop_loss=range_high * 1.003,
                 take_profit=avg_price * 0.95,
-                rationale=[
-                    "Market Maker Sell Model phase detected",
-                    "Distribution → Accumulation pattern identified",
-                    "Smart Money distribution in progress"
-                ],
+                rationale=_MM_SELL_RATIONALE,
                 market_phase="Distribution to Accumulation"
             )
             results.append(result)
         
         return results
     
-    def _detect_market_maker_buy_model(self, df: pd.DataFrame) -> bool:
+    def _detect_market_maker_buy_model(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray
+    ) -> bool:
         """Detect Market Maker Buy Model conditions"""
-        # Look for signs of institutional accumulation
-        recent_lows = df['low'].tail(5)
-        current_price = df['close'].iloc[-1]
-        
-        # Check for higher lows pattern (accumulation)
-        higher_lows = all(recent_lows.iloc[i] >= recent_lows.iloc[i-1] * 0.9995 
-                         for i in range(1, len(recent_lows)))
-        
-        # Check for price above recent range
-        recent_high = df['high'].tail(10).max()
-        above_range = current_price > recent_high * 0.998
-        
-        return higher_lows and above_range
+        # Look for signs of institutional accumulation: higher lows pattern
+        # over the last 5 candles, with price above the recent 10-candle range
+        recent_lows = lows[-5:]
+        return bool(
+            np.all(recent_lows[1:] >= recent_lows[:-1] * 0.9995)
+            and closes[-1] > highs[-10:].max() * 0.998
+        )
     
-    def _detect_market_maker_sell_model(self, df: pd.DataFrame) -> bool:
+    def _detect_market_maker_sell_model(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray
+    ) -> bool:
         """Detect Market Maker Sell Model conditions"""
-        # Look for signs of institutional distribution
-        recent_highs = df['high'].tail(5)
-        current_price = df['close'].iloc[-1]
-        
-        # Check for lower highs pattern (distribution)
-        lower_highs = all(recent_highs.iloc[i] <= recent_highs.iloc[i-1] * 1.0005 
-                         for i in range(1, len(recent_highs)))
-        
-        # Check for price below recent range
-        recent_low = df['low'].tail(10).min()
-        below_range = current_price < recent_low * 1.002
-        
-        return lower_highs and below_range
+        # Look for signs of institutional distribution: lower highs pattern
+        # over the last 5 candles, with price below the recent 10-candle range
+        recent_highs = highs[-5:]
+        return bool(
+            np.all(recent_highs[1:] <= recent_highs[:-1] * 1.0005)
+            and closes[-1] < lows[-10:].min() * 1.002
+        )
     
     def _rank_and_filter_signals(self, signals: List[ICTSignalResult]) -> List[ICTSignalResult]:
         """Rank signals by strength and confidence, return top signals"""
         if not signals:
             return []
         
-        # Sort by strength and confidence
-        sorted_signals = sorted(
-            signals, 
-            key=lambda x: (x.strength * x.confidence), 
-            reverse=True
-        )
-        
-        # Remove duplicates and keep top 3
-        unique_signals = []
-        seen_types = set()
-        
-        for signal in sorted_signals:
-            if signal.signal_type not in seen_types and len(unique_signals) < 3:
-                unique_signals.append(signal)
-                seen_types.add(signal.signal_type)
-        
-        return unique_signals
+        # Best signal per type by strength * confidence (earliest wins ties),
+        # keyed on the type's string value
+        best: Dict[str, Tuple[float, int, ICTSignalResult]] = {}
+        for i, signal in enumerate(signals):
+            score = signal.strength * signal.confidence
+            signal_value = signal.signal_type.value
+            current = best.get(signal_value)
+            if current is None or score > current[0]:
+                best[signal_value] = (score, -i, signal)
+        
+        # Keep the top 3 without sorting everything
+        top = heapq.nlargest(3, best.values(), key=lambda item: item[:2])
+        return [signal for _, _, signal in top]
     
     def get_liquidity_pools(self, current_price: float) -> Dict[str, float]:
         """Get identified liquidity pools"""
-        liquidity_pools = {
-            'buy_side': {},
-            'sell_side': {}
-        }
-        
-        # Find buy-side liquidity (resistance levels)
-        for block in self.order_blocks:
-            if block.type == 'bearish':  # Resistance broken becomes buy-side liquidity
-                liquidity_pools['buy_side'][f'block_{block.timestamp}'] = block.high
-        
-        # Find sell-side liquidity (support levels)
-        for block in self.order_blocks:
-            if block.type == 'bullish':  # Support broken becomes sell-side liquidity
-                liquidity_pools['sell_side'][f'block_{block.timestamp}'] = block.low
+        store = self._order_blocks
+        bullish = store.column('bullish')
+        bearish = ~bullish
+        pool_keys = store.column('pool_key')
         
-        return liquidity_pools
+        return {
+            # Buy-side liquidity (resistance levels): bearish block highs
+            'buy_side': dict(zip(
+                pool_keys[bearish].tolist(), store.column('high')[bearish].tolist()
+            )),
+            # Sell-side liquidity (support levels): bullish block lows
+            'sell_side': dict(zip(
+                pool_keys[bullish].tolist(), store.column('low')[bullish].tolist()
+            ))
+        }
     
     def get_timeframe_bias(self) -> Dict[str, str]:
         """Get multi-timeframe bias analysis"""
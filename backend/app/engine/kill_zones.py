@@ -6,16 +6,26 @@ ICT Kill Zones are specific time windows when institutional activity is highest:
 - NY Kill Zone: 9:30 AM - 11:30 AM EST (Equity market open)
 - London Close: 11:00 AM - 12:00 PM EST (Forex volatility)
 - Asian Session: 8:00 PM - 12:00 AM EST (lower volume)
+
+Times are New York local time (EST, or EDT during daylight saving).
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Mapping, Optional, Tuple, TypeVar
 from dataclasses import dataclass
 from enum import Enum
-from datetime import datetime, time, timezone, timedelta
+from types import MappingProxyType
+from itertools import islice
+from bisect import bisect_right
+from functools import lru_cache
+from datetime import datetime, time, timezone
+from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
 
 from ..models import Candle
 
+_Acc = TypeVar("_Acc")
+
 
 class KillZoneType(Enum):
     """Types of ICT Kill Zones"""
@@ -35,7 +45,7 @@ class SessionType(Enum):
     AFTER_HOURS = "after_hours"    # 8:00 PM - 9:30 AM
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KillZoneInfo:
     """Information about current kill zone status"""
     zone_type: KillZoneType
@@ -48,7 +58,7 @@ class KillZoneInfo:
     rationale: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KillZoneStatistics:
     """Statistics for signals within kill zones"""
     zone_type: KillZoneType
@@ -60,16 +70,305 @@ class KillZoneStatistics:
     best_performing_time: str
 
 
-class KillZoneDetector:
-    """Detect and analyze ICT Kill Zones"""
+# Trading bias recommendations per kill zone (shared, read-only)
+_BIASES: Mapping[KillZoneType, Mapping[str, Any]] = MappingProxyType({
+    KillZoneType.LONDON_KILL_ZONE: MappingProxyType({
+        'bias': 'bullish_bearish',
+        'timeframe': '15m, 1h',
+        'entry_criteria': (
+            'Wait for 3:00 AM EST open',
+            'Look for liquidity sweeps from Asian session',
+            'Trade the initial directional move',
+            'Avoid counter-trend entries first 30 min'
+        ),
+        'warnings': (
+            'Can be choppy first 15 minutes',
+            'Watch for false breakouts',
+            'Lower volume on Mondays'
+        ),
+        'optimal_strategies': (
+            'Breaker Blocks after sweep',
+            'Liquidity sweeps',
+            'Inducement patterns'
+        )
+    }),
+    KillZoneType.NY_KILL_ZONE: MappingProxyType({
+        'bias': 'strong_directional',
+        'timeframe': '15m, 1h',
+        'entry_criteria': (
+            'Wait for 9:30 AM NYSE open',
+            'Look for gap fills or continuations',
+            'Trade first 1-2 hours only',
+            'Use 15m for entries, 1h for bias'
+        ),
+        'warnings': (
+            'High volatility - use proper position sizing',
+            'Avoid news releases first 5 min',
+            'Monday mornings can be unpredictable'
+        ),
+        'optimal_strategies': (
+            'Market Maker Model',
+            'BOS/MSS confirmations',
+            'FVG entries on pullbacks'
+        )
+    }),
+    KillZoneType.LONDON_CLOSE: MappingProxyType({
+        'bias': 'reversal_consolidation',
+        'timeframe': '15m',
+        'entry_criteria': (
+            'Watch for London traders closing positions',
+            'Look for reversals at key levels',
+            'Lower position sizes',
+            'Focus on NY session continuation'
+        ),
+        'warnings': (
+            'Lower volume - wider spreads possible',
+            'False moves common',
+            'Not ideal for breakout entries'
+        ),
+        'optimal_strategies': (
+            'Mitigation zones',
+            'Order block retests',
+            'Range trading'
+        )
+    }),
+    KillZoneType.ASIAN_SESSION: MappingProxyType({
+        'bias': 'consolidation',
+        'timeframe': '1h, 4h',
+        'entry_criteria': (
+            'Lower expectations for big moves',
+            'Use higher timeframes',
+            'Wait for London session for entries',
+            'Good for analysis, not trading'
+        ),
+        'warnings': (
+            'Very low volume',
+            'Wide spreads on some pairs',
+            'Best to observe, not trade'
+        ),
+        'optimal_strategies': (
+            'Market structure marking',
+            'Level identification',
+            'Patience'
+        )
+    }),
+    KillZoneType.OFF_HOURS: MappingProxyType({
+        'bias': 'neutral',
+        'timeframe': 'N/A',
+        'entry_criteria': (
+            'Avoid new entries',
+            'Manage existing positions',
+            'Wait for next kill zone',
+            'Use for chart analysis'
+        ),
+        'warnings': (
+            'Low institutional participation',
+            'Choppy price action',
+            'Reduced liquidity'
+        ),
+        'optimal_strategies': (
+            'None - wait for kill zone',
+        )
+    })
+})
+
+# Recommended timeframes per kill zone
+_TIMEFRAMES: Mapping[KillZoneType, Tuple[str, ...]] = MappingProxyType({
+    KillZoneType.LONDON_KILL_ZONE: ('15m', '1h'),
+    KillZoneType.NY_KILL_ZONE: ('15m', '1h'),
+    KillZoneType.LONDON_CLOSE: ('15m', '30m'),
+    KillZoneType.ASIAN_SESSION: ('1h', '4h', '1d'),
+    KillZoneType.OFF_HOURS: ('1h', '4h')
+})
+
+# Kill zones where entries are considered optimal
+_OPTIMAL_ZONES = frozenset({
+    KillZoneType.LONDON_KILL_ZONE,
+    KillZoneType.NY_KILL_ZONE,
+    KillZoneType.LONDON_CLOSE,
+})
+
+# Display names, e.g. "London Kill Zone"
+_ZONE_TITLES: Mapping[KillZoneType, str] = MappingProxyType({
+    zone_type: zone_type.value.replace('_', ' ').title() for zone_type in KillZoneType
+})
+
+_OFF_HOURS_WAIT_REASON = "{minutes} minutes until next kill zone - wait for better timing"
+
+
+@lru_cache(maxsize=None)
+def _off_hours_wait_reason(minutes: Optional[int]) -> str:
+    """Off-hours wait reason for a number of minutes (at most one per minute of the day)"""
+    return _OFF_HOURS_WAIT_REASON.format(minutes=minutes)
+
+
+# Representative signal strength per band: < 50, 50-69, 70-79, >= 80
+_STRENGTH_BAND_SAMPLES = (0.0, 50.0, 70.0, 80.0)
+
+
+def _strength_band(signal_strength: float) -> int:
+    """Index into _STRENGTH_BAND_SAMPLES for a signal strength"""
+    return (signal_strength >= 50) + (signal_strength >= 70) + (signal_strength >= 80)
+
+
+def _trade_decision(zone_type: KillZoneType, signal_strength: float) -> Tuple[bool, str]:
+    """
+    Trading rules behind should_trade_signal
     
-    # Kill Zone time windows (EST timezone)
-    KILL_ZONES = {
-        KillZoneType.LONDON_KILL_ZONE: (time(3, 0), time(5, 0)),
-        KillZoneType.NY_KILL_ZONE: (time(9, 30), time(11, 30)),
-        KillZoneType.LONDON_CLOSE: (time(11, 0), time(12, 0)),
-        KillZoneType.ASIAN_SESSION: (time(20, 0), time(0, 0)),
-    }
+    The off-hours wait reason is left as the _OFF_HOURS_WAIT_REASON template.
+    """
+    is_active = zone_type != KillZoneType.OFF_HOURS
+    
+    # Always trade high-strength signals in kill zones
+    if is_active and signal_strength >= 70:
+        return True, f"High-strength signal in {_ZONE_TITLES[zone_type]}"
+    
+    # Trade moderate signals in optimal kill zones
+    if is_active and zone_type in _OPTIMAL_ZONES and signal_strength >= 50:
+        return True, "Signal in optimal kill zone with moderate strength"
+    
+    # Be cautious in Asian session
+    if zone_type == KillZoneType.ASIAN_SESSION:
+        return False, "Avoid trading during Asian session - low volume"
+    
+    # Off-hours signals need high strength
+    if zone_type == KillZoneType.OFF_HOURS:
+        if signal_strength >= 80:
+            return True, "Very high-strength signal - exception for off-hours"
+        return False, _OFF_HOURS_WAIT_REASON
+    
+    # Low strength in kill zone
+    if is_active and signal_strength < 50:
+        return False, "Signal strength too low even in kill zone"
+    
+    return True, "Signal meets criteria for current kill zone"
+
+
+# should_trade_signal decisions by (zone, strength band)
+_TRADE_DECISIONS: Dict[Tuple[KillZoneType, int], Tuple[bool, str]] = {
+    (zone_type, band): _trade_decision(zone_type, strength)
+    for zone_type in KillZoneType
+    for band, strength in enumerate(_STRENGTH_BAND_SAMPLES)
+}
+
+# Width of the zone lookup buckets; all window bounds fall on these marks
+_ZONE_BUCKET_SECONDS = 300
+
+# Candles classified per batch when streaming through iter_zones
+_ZONE_BATCH_SIZE = 4096
+
+# Zone types by id (position in KillZoneType), as used by the lookup arrays
+_ZONE_TYPES: Tuple[KillZoneType, ...] = tuple(KillZoneType)
+
+# Kill zone windows are New York local time
+_NY = ZoneInfo("America/New_York")
+
+# New York UTC offset in seconds by UTC hour (DST changes on the hour)
+_NY_OFFSET_CACHE: Dict[int, int] = {}
+
+# New York DST transitions are always more than 120 days apart
+_MIN_DST_GAP_SECONDS = 120 * 86400
+
+# New York local (EST/EDT) seconds-of-day for off-hours rationale and session boundaries
+_LONDON_OPEN_SOD = 3 * 3600
+_LONDON_END_SOD = 5 * 3600
+_MARKET_OPEN_SOD = 9 * 3600 + 1800
+_MARKET_HOURS_SOD = 10 * 3600
+_LUNCH_END_SOD = 12 * 3600
+_MARKET_CLOSE_SOD = 16 * 3600
+_AFTER_HOURS_SOD = 20 * 3600
+
+
+def _ny_utc_offset(timestamp: int) -> int:
+    """New York UTC offset in seconds at a Unix timestamp"""
+    hour = int(timestamp // 3600)
+    offset = _NY_OFFSET_CACHE.get(hour)
+    if offset is None:
+        offset = int(datetime.fromtimestamp(hour * 3600, _NY).utcoffset().total_seconds())
+        _NY_OFFSET_CACHE[hour] = offset
+    return offset
+
+
+def _ny_utc_offsets(timestamps: np.ndarray) -> np.ndarray:
+    """
+    New York UTC offsets in seconds for an int64 array of Unix timestamps
+    
+    Returns a 0-d array when the timestamps span no DST transition.
+    """
+    first, last = int(timestamps.min()), int(timestamps.max())
+    offset = _ny_utc_offset(first)
+    if last - first < _MIN_DST_GAP_SECONDS and _ny_utc_offset(last) == offset:
+        return np.array(offset, dtype=np.int64)
+    
+    hours, inverse = np.unique(timestamps // 3600, return_inverse=True)
+    offsets = np.array([_ny_utc_offset(hour * 3600) for hour in hours.tolist()], dtype=np.int64)
+    return offsets[inverse]
+
+
+def _zone_ids_for_sod(sod: np.ndarray, bucket_ids: np.ndarray,
+                      bucket_start_ids: np.ndarray) -> np.ndarray:
+    """Zone id per local second-of-day from the five-minute bucket tables"""
+    buckets = sod // _ZONE_BUCKET_SECONDS
+    at_start = sod % _ZONE_BUCKET_SECONDS == 0
+    return np.where(at_start, bucket_start_ids.take(buckets), bucket_ids.take(buckets))
+
+
+def _classify_kernel(timestamps: np.ndarray, offsets: np.ndarray,
+                     bucket_ids: np.ndarray, bucket_start_ids: np.ndarray) -> np.ndarray:
+    """Zone id per timestamp: local second-of-day looked up in the bucket tables"""
+    sod = timestamps + offsets
+    np.remainder(sod, 86400, out=sod)
+    return _zone_ids_for_sod(sod, bucket_ids, bucket_start_ids)
+
+
+def _to_sod(t: time) -> int:
+    """Seconds since midnight for a time of day"""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def _zone_by_second(kill_zones: Dict[KillZoneType, Tuple[time, time]]) -> np.ndarray:
+    """
+    Zone id for every second of the local day
+    
+    Windows include their end second, and earlier entries in kill_zones win
+    overlaps, the same as the per-timestamp check in get_current_kill_zone.
+    """
+    day = np.full(86400, _ZONE_TYPES.index(KillZoneType.OFF_HOURS), dtype=np.int8)
+    
+    # Paint lowest-priority windows first so earlier entries overwrite them
+    for zone_type, (start, end) in reversed(list(kill_zones.items())):
+        start_sod = _to_sod(start)
+        end_sod = _to_sod(end)
+        zone_id = _ZONE_TYPES.index(zone_type)
+        if start_sod < end_sod:
+            day[start_sod:end_sod + 1] = zone_id
+        else:  # Crosses midnight
+            day[start_sod:] = zone_id
+            day[:end_sod + 1] = zone_id
+    return day
+
+
+def _build_zone_runs(day: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split the day into runs of seconds that share a zone: (run starts, zone ids)"""
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(day)) + 1))
+    return starts, day[starts]
+
+
+def _build_zone_buckets(day: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Zone ids per five-minute bucket: (rest of the bucket, first second)
+    
+    Windows start on five-minute marks and end on them inclusively, so only
+    a bucket's first second can differ from the rest of it.
+    """
+    buckets = day.reshape(-1, _ZONE_BUCKET_SECONDS)
+    if not (buckets[:, 1:] == buckets[:, 1:2]).all():
+        raise ValueError("Kill zone windows must start and end on five-minute marks")
+    return np.ascontiguousarray(buckets[:, 1]), np.ascontiguousarray(buckets[:, 0])
+
+
+class KillZoneStatsTracker:
+    """Track signal statistics per kill zone"""
     
     def __init__(self):
         self.statistics: Dict[KillZoneType, KillZoneStatistics] = {}
@@ -88,6 +387,51 @@ class KillZoneDetector:
                     avg_duration_minutes=0.0,
                     best_performing_time=""
                 )
+
+
+class KillZoneDetector:
+    """
+    Detect and analyze ICT Kill Zones
+    
+    Holds only lookup tables and caches that are safe to share, so use the
+    module-level kill_zone_detector instance.
+    """
+    
+    __slots__ = ('_kill_zone_cache', '_window')
+    
+    # Kill Zone time windows (New York local time)
+    KILL_ZONES = {
+        KillZoneType.LONDON_KILL_ZONE: (time(3, 0), time(5, 0)),
+        KillZoneType.NY_KILL_ZONE: (time(9, 30), time(11, 30)),
+        KillZoneType.LONDON_CLOSE: (time(11, 0), time(12, 0)),
+        KillZoneType.ASIAN_SESSION: (time(20, 0), time(0, 0)),
+    }
+    
+    # (zone, start, end) in New York local seconds-of-day, in KILL_ZONES priority order
+    _ZONE_WINDOWS: Tuple[Tuple[KillZoneType, int, int], ...] = tuple(
+        (zone_type, _to_sod(start), _to_sod(end))
+        for zone_type, (start, end) in KILL_ZONES.items()
+    )
+    
+    # Zone start seconds-of-day in ascending order, with their zones
+    _START_SODS, _START_ZONES = zip(*sorted(
+        ((start, zone_type) for zone_type, start, _ in _ZONE_WINDOWS), key=lambda w: w[0]
+    ))
+    
+    # Kill zone id by local second-of-day, also as runs (see prepare_window)
+    # and as five-minute buckets (see _classify_timestamps)
+    _ZONE_BY_SECOND = _zone_by_second(KILL_ZONES)
+    _ZONE_RUN_STARTS, _ZONE_RUN_IDS = _build_zone_runs(_ZONE_BY_SECOND)
+    _ZONE_BUCKET_IDS, _ZONE_BUCKET_START_IDS = _build_zone_buckets(_ZONE_BY_SECOND)
+    # Same per-second ids as bytes, for cheap scalar lookups
+    _ZONE_ID_BY_SECOND = _ZONE_BY_SECOND.tobytes()
+    
+    def __init__(self):
+        # KillZoneInfo by local second-of-day (at most 86400 entries)
+        self._kill_zone_cache: Dict[int, KillZoneInfo] = {}
+        # (t_min, t_max, run starts in UTC, zone ids) from prepare_window,
+        # replaced as a whole so concurrent readers see a consistent window
+        self._window: Optional[Tuple[int, int, np.ndarray, np.ndarray]] = None
     
     def get_current_kill_zone(self, timestamp: Optional[int] = None) -> KillZoneInfo:
         """
@@ -102,34 +446,41 @@ class KillZoneDetector:
         if timestamp is None:
             timestamp = int(datetime.now(timezone.utc).timestamp())
         
-        # Convert to EST (UTC-5, -4 during DST)
-        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        est_time = dt.astimezone(timezone(timedelta(hours=-5)))  # EST
-        current_time = est_time.time()
-        
+        # Zone status depends only on the New York local (EST/EDT) time of day, so reuse it
+        sod = int(timestamp + _ny_utc_offset(timestamp)) % 86400
+        info = self._kill_zone_cache.get(sod)
+        if info is None:
+            info = self._kill_zone_for_second(sod)
+            self._kill_zone_cache[sod] = info
+        return info
+    
+    def get_zone_id(self, timestamp: int) -> int:
+        """Kill zone id (index into KillZoneType) at a Unix timestamp, without building KillZoneInfo"""
+        return self._ZONE_ID_BY_SECOND[int(timestamp + _ny_utc_offset(timestamp)) % 86400]
+    
+    def _kill_zone_for_second(self, sod: int) -> KillZoneInfo:
+        """Kill zone status for a New York local second-of-day"""
         # Check each kill zone
-        for zone_type, (start, end) in self.KILL_ZONES.items():
-            if self._is_time_in_window(current_time, start, end):
-                return self._create_kill_zone_info(zone_type, True, current_time)
+        for zone_type, start, end in self._ZONE_WINDOWS:
+            if self._in_window_sec(sod, start, end):
+                return self._create_kill_zone_info(zone_type, True, sod)
         
         # Not in any kill zone
-        return self._create_kill_zone_info(KillZoneType.OFF_HOURS, False, current_time)
+        return self._create_kill_zone_info(KillZoneType.OFF_HOURS, False, sod)
     
-    def _is_time_in_window(self, current: time, start: time, end: time) -> bool:
-        """Check if current time is within window (handles midnight crossover)"""
+    def _in_window_sec(self, sod: int, start: int, end: int) -> bool:
+        """Check if second-of-day is within window (handles midnight crossover)"""
         if start < end:
-            return start <= current <= end
+            return start <= sod <= end
         else:  # Crosses midnight (e.g., 20:00 - 00:00)
-            return current >= start or current <= end
+            return sod >= start or sod <= end
     
     def _create_kill_zone_info(self, zone_type: KillZoneType, is_active: bool, 
-                              current_time: time) -> KillZoneInfo:
+                              sod: int) -> KillZoneInfo:
         """Create KillZoneInfo with calculated times"""
-        now = datetime.combine(datetime.today(), current_time)
-        
         time_until_next = None
         time_remaining = None
-        session = self._get_session_type(current_time)
+        session = self._get_session_type(sod)
         optimal = False
         volatility = 'low'
         rationale = ""
@@ -137,11 +488,11 @@ class KillZoneDetector:
         if is_active:
             # Calculate remaining time in zone
             start, end = self.KILL_ZONES[zone_type]
-            end_dt = datetime.combine(datetime.today(), end)
+            end_sod = _to_sod(end)
             if end < start:  # Crosses midnight
-                end_dt += timedelta(days=1)
+                end_sod += 86400
             
-            time_remaining = int((end_dt - now).total_seconds() / 60)
+            time_remaining = (end_sod - sod) // 60
             
             # Determine optimality and volatility
             if zone_type == KillZoneType.LONDON_KILL_ZONE:
@@ -162,15 +513,15 @@ class KillZoneDetector:
                 rationale = "Asian session - lower volume, consolidation likely"
         else:
             # Calculate time until next kill zone
-            next_zone, minutes_until = self._get_next_kill_zone(current_time)
+            next_zone, minutes_until = self._get_next_kill_zone(sod)
             time_until_next = minutes_until
             
             # Provide rationale for off-hours
-            if current_time < time(3, 0):
+            if sod < _LONDON_OPEN_SOD:
                 rationale = "Pre-London - waiting for institutional activity"
-            elif time(5, 0) <= current_time < time(9, 30):
+            elif _LONDON_END_SOD <= sod < _MARKET_OPEN_SOD:
                 rationale = "Between London and NY - lower volatility period"
-            elif time(12, 0) <= current_time < time(20, 0):
+            elif _LUNCH_END_SOD <= sod < _AFTER_HOURS_SOD:
                 rationale = "Post-lunch session - reduced institutional activity"
             else:
                 rationale = "Off-hours - limited institutional participation"
@@ -186,34 +537,88 @@ class KillZoneDetector:
             rationale=rationale
         )
     
-    def _get_session_type(self, current_time: time) -> SessionType:
+    def _get_session_type(self, sod: int) -> SessionType:
         """Determine market session type"""
-        if current_time < time(9, 30):
+        if sod < _MARKET_OPEN_SOD:
             return SessionType.PRE_MARKET
-        elif time(9, 30) <= current_time < time(10, 0):
+        elif sod < _MARKET_HOURS_SOD:
             return SessionType.MARKET_OPEN
-        elif time(10, 0) <= current_time < time(16, 0):
+        elif sod < _MARKET_CLOSE_SOD:
             return SessionType.MARKET_HOURS
-        elif time(16, 0) <= current_time < time(20, 0):
+        elif sod < _AFTER_HOURS_SOD:
             return SessionType.MARKET_CLOSE
         else:
             return SessionType.AFTER_HOURS
     
-    def _get_next_kill_zone(self, current_time: time) -> Tuple[KillZoneType, int]:
+    def _get_next_kill_zone(self, sod: int) -> Tuple[KillZoneType, int]:
         """Get next kill zone and minutes until it starts"""
-        now = datetime.combine(datetime.today(), current_time)
+        # First zone starting strictly after now, wrapping to tomorrow
+        i = bisect_right(self._START_SODS, sod) % len(self._START_SODS)
+        seconds_until = (self._START_SODS[i] - sod - 1) % 86400 + 1
+        return self._START_ZONES[i], seconds_until // 60
+    
+    def _classify_timestamps(self, timestamps: np.ndarray) -> np.ndarray:
+        """Kill zone ids (indices into KillZoneType) for an int64 array of Unix timestamps"""
+        return _classify_kernel(timestamps, _ny_utc_offsets(timestamps),
+                                self._ZONE_BUCKET_IDS, self._ZONE_BUCKET_START_IDS)
+    
+    def prepare_window(self, t_min: int, t_max: int):
+        """
+        Precompute kill zone runs as UTC timestamps for [t_min, t_max]
         
-        candidates = []
-        for zone_type, (start, end) in self.KILL_ZONES.items():
-            start_dt = datetime.combine(datetime.today(), start)
-            if start_dt <= now:
-                start_dt += timedelta(days=1)  # Tomorrow
-            
-            minutes_until = int((start_dt - now).total_seconds() / 60)
-            candidates.append((zone_type, minutes_until))
+        classify_batch then resolves timestamps in that range with a single
+        search, with DST transitions already folded into the run starts.
+        """
+        t_min, t_max = int(t_min), int(t_max)
+        hours = np.arange(t_min // 3600, t_max // 3600 + 1, dtype=np.int64)
+        hour_offsets = np.broadcast_to(_ny_utc_offsets(hours * 3600), hours.shape)
         
-        # Return the soonest
-        return min(candidates, key=lambda x: x[1])
+        # Zone changes happen at a run start under one of the offsets in use,
+        # or where the offset itself changes
+        candidates = [[t_min], hours[1:][hour_offsets[1:] != hour_offsets[:-1]] * 3600]
+        for offset in np.unique(hour_offsets).tolist():
+            first_day = (t_min + offset) // 86400
+            last_day = (t_max + offset) // 86400
+            days = np.arange(first_day, last_day + 1, dtype=np.int64) * 86400 - offset
+            candidates.append((days[:, None] + self._ZONE_RUN_STARTS).ravel())
+        
+        starts = np.unique(np.concatenate(candidates).astype(np.int64))
+        starts = starts[(starts >= t_min) & (starts <= t_max)]
+        zone_ids = self._classify_timestamps(starts)
+        
+        # Merge neighbouring candidates that resolve to the same zone
+        keep = np.ones(len(starts), dtype=bool)
+        keep[1:] = zone_ids[1:] != zone_ids[:-1]
+        
+        self._window = (t_min, t_max, starts[keep], zone_ids[keep])
+    
+    def classify_batch(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Kill zone ids (indices into KillZoneType) for an int64 array of Unix timestamps
+        
+        Uses the runs from prepare_window when they cover every timestamp.
+        """
+        window = self._window
+        if len(timestamps) and window is not None:
+            t_min, t_max, starts_utc, zone_ids = window
+            if t_min <= timestamps.min() and timestamps.max() <= t_max:
+                runs = np.searchsorted(starts_utc, timestamps, side='right')
+                runs -= 1
+                return zone_ids.take(runs)
+        return self._classify_timestamps(timestamps)
+    
+    def classify(self, df: pd.DataFrame, ts_col: str = 't') -> pd.DataFrame:
+        """
+        Add kill zone columns to a DataFrame of Unix timestamps (seconds)
+        
+        Returns:
+            Copy of df with 'zone' (int8 zone id, an index into KillZoneType)
+            and 'sod_est' (int32 New York local second-of-day) columns
+        """
+        local = pd.to_datetime(df[ts_col], unit='s', utc=True).dt.tz_convert(_NY)
+        sod = (local.dt.hour * 3600 + local.dt.minute * 60 + local.dt.second).to_numpy(np.int32)
+        zone_ids = _zone_ids_for_sod(sod, self._ZONE_BUCKET_IDS, self._ZONE_BUCKET_START_IDS)
+        return df.assign(zone=zone_ids, sod_est=sod)
     
     def analyze_candles_in_kill_zones(self, candles: List[Candle]) -> Dict[KillZoneType, List[Candle]]:
         """
@@ -222,123 +627,77 @@ class KillZoneDetector:
         Returns:
             Dict mapping kill zone types to lists of candles
         """
+        return self.analyze_candles_in_kill_zones_fast(candles)
+    
+    def analyze_candles_in_kill_zones_fast(self, candles: List[Candle]) -> Dict[KillZoneType, List[Candle]]:
+        """
+        Group candles by kill zone, classifying all timestamps at once
+        
+        Returns:
+            Dict mapping kill zone types to lists of candles (in input order)
+        """
         zone_candles = {zone: [] for zone in KillZoneType}
+        if not candles:
+            return zone_candles
+        
+        timestamps = np.fromiter((c.t for c in candles), dtype=np.int64, count=len(candles))
+        zone_ids = self.classify_batch(timestamps)
         
-        for candle in candles:
-            info = self.get_current_kill_zone(candle.t)
-            zone_candles[info.zone_type].append(candle)
+        # Stable sort keeps each zone's candles in input order
+        order = np.argsort(zone_ids, kind='stable')
+        ids, starts = np.unique(zone_ids[order], return_index=True)
+        for zone_id, group in zip(ids.tolist(), np.split(order, starts[1:])):
+            zone_candles[_ZONE_TYPES[zone_id]] = [candles[i] for i in group.tolist()]
         
         return zone_candles
     
-    def get_kill_zone_bias(self, zone_type: KillZoneType) -> Dict:
+    def _iter_zone_ids(self, candles: Iterable[Candle]) -> Iterator[Tuple[int, Candle]]:
+        """Yield (zone id, candle) pairs in input order, classifying in batches"""
+        candles = iter(candles)
+        while True:
+            batch = list(islice(candles, _ZONE_BATCH_SIZE))
+            if not batch:
+                return
+            timestamps = np.fromiter((c.t for c in batch), dtype=np.int64, count=len(batch))
+            yield from zip(self.classify_batch(timestamps).tolist(), batch)
+    
+    def iter_zones(self, candles: Iterable[Candle]) -> Iterator[Tuple[KillZoneType, Candle]]:
         """
-        Get trading bias recommendations for specific kill zone
+        Yield (kill zone, candle) pairs in input order
+        
+        Candles are classified in fixed-size batches, so any iterable can be
+        streamed without building per-zone lists.
+        """
+        for zone_id, candle in self._iter_zone_ids(candles):
+            yield _ZONE_TYPES[zone_id], candle
+    
+    def aggregate_by_zone(self, candles: Iterable[Candle], init: Callable[[], _Acc],
+                          reduce_fn: Callable[[_Acc, Candle], _Acc]) -> Dict[KillZoneType, _Acc]:
+        """
+        Fold candles per kill zone in a single pass
         
+        Args:
+            candles: Candles to aggregate (any iterable)
+            init: Creates the starting accumulator for each zone
+            reduce_fn: Combines an accumulator with the next candle in its zone
+            
         Returns:
-            Dict with bias, entry criteria, and warnings
+            Dict mapping every kill zone type to its accumulator
+        """
+        # Accumulators indexed by zone id; enum keys only for the result
+        acc = [init() for _ in _ZONE_TYPES]
+        for zone_id, candle in self._iter_zone_ids(candles):
+            acc[zone_id] = reduce_fn(acc[zone_id], candle)
+        return dict(zip(_ZONE_TYPES, acc))
+    
+    def get_kill_zone_bias(self, zone_type: KillZoneType) -> Mapping[str, Any]:
         """
-        biases = {
-            KillZoneType.LONDON_KILL_ZONE: {
-                'bias': 'bullish_bearish',
-                'timeframe': '15m, 1h',
-                'entry_criteria': [
-                    'Wait for 3:00 AM EST open',
-                    'Look for liquidity sweeps from Asian session',
-                    'Trade the initial directional move',
-                    'Avoid counter-trend entries first 30 min'
-                ],
-                'warnings': [
-                    'Can be choppy first 15 minutes',
-                    'Watch for false breakouts',
-                    'Lower volume on Mondays'
-                ],
-                'optimal_strategies': [
-                    'Breaker Blocks after sweep',
-                    'Liquidity sweeps',
-                    'Inducement patterns'
-                ]
-            },
-            KillZoneType.NY_KILL_ZONE: {
-                'bias': 'strong_directional',
-                'timeframe': '15m, 1h',
-                'entry_criteria': [
-                    'Wait for 9:30 AM NYSE open',
-                    'Look for gap fills or continuations',
-                    'Trade first 1-2 hours only',
-                    'Use 15m for entries, 1h for bias'
-                ],
-                'warnings': [
-                    'High volatility - use proper position sizing',
-                    'Avoid news releases first 5 min',
-                    'Monday mornings can be unpredictable'
-                ],
-                'optimal_strategies': [
-                    'Market Maker Model',
-                    'BOS/MSS confirmations',
-                    'FVG entries on pullbacks'
-                ]
-            },
-            KillZoneType.LONDON_CLOSE: {
-                'bias': 'reversal_consolidation',
-                'timeframe': '15m',
-                'entry_criteria': [
-                    'Watch for London traders closing positions',
-                    'Look for reversals at key levels',
-                    'Lower position sizes',
-                    'Focus on NY session continuation'
-                ],
-                'warnings': [
-                    'Lower volume - wider spreads possible',
-                    'False moves common',
-                    'Not ideal for breakout entries'
-                ],
-                'optimal_strategies': [
-                    'Mitigation zones',
-                    'Order block retests',
-                    'Range trading'
-                ]
-            },
-            KillZoneType.ASIAN_SESSION: {
-                'bias': 'consolidation',
-                'timeframe': '1h, 4h',
-                'entry_criteria': [
-                    'Lower expectations for big moves',
-                    'Use higher timeframes',
-                    'Wait for London session for entries',
-                    'Good for analysis, not trading'
-                ],
-                'warnings': [
-                    'Very low volume',
-                    'Wide spreads on some pairs',
-                    'Best to observe, not trade'
-                ],
-                'optimal_strategies': [
-                    'Market structure marking',
-                    'Level identification',
-                    'Patience'
-                ]
-            },
-            KillZoneType.OFF_HOURS: {
-                'bias': 'neutral',
-                'timeframe': 'N/A',
-                'entry_criteria': [
-                    'Avoid new entries',
-                    'Manage existing positions',
-                    'Wait for next kill zone',
-                    'Use for chart analysis'
-                ],
-                'warnings': [
-                    'Low institutional participation',
-                    'Choppy price action',
-                    'Reduced liquidity'
-                ],
-                'optimal_strategies': [
-                    'None - wait for kill zone'
-                ]
-            }
-        }
+        Get trading bias recommendations for specific kill zone
         
-        return biases.get(zone_type, biases[KillZoneType.OFF_HOURS])
+        Returns:
+            Read-only mapping with bias, entry criteria, and warnings
+        """
+        return _BIASES.get(zone_type, _BIASES[KillZoneType.OFF_HOURS])
     
     def should_trade_signal(self, signal_timestamp: int, signal_strength: float) -> Tuple[bool, str]:
         """
@@ -348,41 +707,18 @@ class KillZoneDetector:
             Tuple of (should_trade, reason)
         """
         info = self.get_current_kill_zone(signal_timestamp)
-        
-        # Always trade high-strength signals in kill zones
-        if info.is_active and signal_strength >= 70:
-            return True, f"High-strength signal in {info.zone_type.value.replace('_', ' ').title()}"
-        
-        # Trade moderate signals in optimal kill zones
-        if info.is_active and info.optimal_for_entries and signal_strength >= 50:
-            return True, f"Signal in optimal kill zone with moderate strength"
-        
-        # Be cautious in Asian session
-        if info.zone_type == KillZoneType.ASIAN_SESSION:
-            return False, "Avoid trading during Asian session - low volume"
-        
-        # Off-hours signals need high strength
-        if info.zone_type == KillZoneType.OFF_HOURS:
-            if signal_strength >= 80:
-                return True, "Very high-strength signal - exception for off-hours"
-            return False, f"{info.time_until_next} minutes until next kill zone - wait for better timing"
-        
-        # Low strength in kill zone
-        if info.is_active and signal_strength < 50:
-            return False, "Signal strength too low even in kill zone"
-        
-        return True, "Signal meets criteria for current kill zone"
+        should_trade, reason = _TRADE_DECISIONS[(info.zone_type, _strength_band(signal_strength))]
+        if not should_trade and info.zone_type == KillZoneType.OFF_HOURS:
+            reason = _off_hours_wait_reason(info.time_until_next)
+        return should_trade, reason
+    
+    def get_zone_title(self, zone_type: KillZoneType) -> str:
+        """Display name for a kill zone, e.g. London Kill Zone"""
+        return _ZONE_TITLES[zone_type]
     
-    def get_recommended_timeframes(self, zone_type: KillZoneType) -> List[str]:
+    def get_recommended_timeframes(self, zone_type: KillZoneType) -> Tuple[str, ...]:
         """Get recommended timeframes for specific kill zone"""
-        recommendations = {
-            KillZoneType.LONDON_KILL_ZONE: ['15m', '1h'],
-            KillZoneType.NY_KILL_ZONE: ['15m', '1h'],
-            KillZoneType.LONDON_CLOSE: ['15m', '30m'],
-            KillZoneType.ASIAN_SESSION: ['1h', '4h', '1d'],
-            KillZoneType.OFF_HOURS: ['1h', '4h']
-        }
-        return recommendations.get(zone_type, ['1h'])
+        return _TIMEFRAMES.get(zone_type, ('1h',))
     
     def format_time_until(self, minutes: int) -> str:
         """Format minutes until next kill zone in readable format"""
@@ -395,3 +731,7 @@ class KillZoneDetector:
         if hours > 0:
             return f"{hours}h {mins}m"
         return f"{mins}m"
+
+
+# Shared detector instance
+kill_zone_detector = KillZoneDetector()
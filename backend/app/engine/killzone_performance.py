@@ -8,36 +8,284 @@ for each symbol to identify best trading windows.
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import hashlib
 import json
 import os
+import tempfile
+import threading
+import time
+import weakref
+import numpy as np
+import pandas as pd
 
-from .kill_zones import KillZoneType, KillZoneDetector
+try:
+    import orjson
+except ImportError:  # Optional faster encoder; stdlib json is used without it
+    orjson = None
+
+from .kill_zones import KillZoneType, kill_zone_detector
+
+
+# Dirty profiles are written after this delay, or at once when this many are pending
+_FLUSH_INTERVAL_SECONDS = 2.0
+_FLUSH_MAX_DIRTY = 32
+
+# Threads reading profile files at startup
+_LOAD_WORKERS = 16
+
+# Trackers to flush at exit, held weakly so each one can still be collected
+_LIVE_TRACKERS: weakref.WeakSet = weakref.WeakSet()
+
+
+def _flush_live_trackers():
+    """Save the pending changes of every tracker still alive at exit"""
+    for tracker in list(_LIVE_TRACKERS):
+        # A tracker whose directory was removed (e.g. a test's temp dir) has nowhere to save
+        if os.path.isdir(tracker.data_dir):
+            tracker.flush()
+
+
+atexit.register(_flush_live_trackers)
+
+
+# Zone ids (positions in KillZoneType) used as stats table columns. Enum members
+# hash through a Python-level __hash__, so they are turned into ids with
+# _ZONE_TYPES.index (identity comparisons) rather than used as dict keys
+_ZONE_TYPES: Tuple[KillZoneType, ...] = tuple(KillZoneType)
+_ZONE_IDS_BY_VALUE = {zone_type.value: i for i, zone_type in enumerate(_ZONE_TYPES)}
+# Zones reported in symbol summaries
+_SUMMARY_ZONE_IDS: Tuple[int, ...] = tuple(
+    i for i, zone_type in enumerate(_ZONE_TYPES) if zone_type is not KillZoneType.OFF_HOURS
+)
+
+# Trading session of each zone id ("" for zones outside a session)
+_ZONE_TO_SESSION: Tuple[str, ...] = tuple(
+    {
+        KillZoneType.LONDON_KILL_ZONE: "london_session",
+        KillZoneType.NY_KILL_ZONE: "ny_session",
+        KillZoneType.LONDON_CLOSE: "london_session",
+        KillZoneType.ASIAN_SESSION: "asian_session"
+    }.get(zone_type, "")
+    for zone_type in _ZONE_TYPES
+)
+# Distinct sessions, and each zone id's index into them
+_SESSIONS: Tuple[str, ...] = tuple(dict.fromkeys(_ZONE_TO_SESSION))
+_ZONE_SESSION_IDS = np.array([_SESSIONS.index(session) for session in _ZONE_TO_SESSION], dtype=np.intp)
+
+# Recommendation tiers, highest first: (minimum win rate, recommendation, confidence, message)
+_RECOMMENDATION_TIERS = (
+    (60, 'strong_buy', lambda win_rate: min(100, win_rate), 'Excellent {:.1f}% win rate in this zone'),
+    (50, 'favorable', lambda win_rate: win_rate, 'Favorable {:.1f}% win rate in this zone'),
+    (40, 'neutral', lambda win_rate: 50, 'Moderate {:.1f}% win rate - use caution'),
+    (float('-inf'), 'avoid', lambda win_rate: 100 - win_rate, 'Poor {:.1f}% win rate - consider avoiding'),
+)
+
+
+def _dump_json(data: dict) -> bytes:
+    """Encode a profile as compact JSON"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def _content_digest(data: dict) -> bytes:
+    """Digest of a serialized profile, ignoring its timestamps"""
+    content = dict(data, updated_at=None, updated_at_ns=None, zone_stats={
+        zone: dict(stats, last_updated=None, last_updated_ns=None)
+        for zone, stats in data['zone_stats'].items()
+    })
+    return hashlib.blake2b(_dump_json(content), digest_size=16).digest()
+
+
+def _read_file(path: str) -> bytes:
+    """Read a small file in one unbuffered read"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _load_json(buf: bytes) -> dict:
+    """Decode a profile written by _dump_json"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _read_profile(path: str):
+    """Read and decode a profile file (None if empty); returns the exception instead of raising"""
+    try:
+        buf = _read_file(path)
+        return _load_json(buf) if buf else None
+    except Exception as e:
+        return e
+
+
+class _ZoneStatsTable:
+    """Kill zone statistics for all symbols as (symbol row, zone id) arrays"""
+    
+    NUMERIC_COLUMNS = {
+        'total_signals': np.int64,
+        'trades': np.int64,  # Wins and losses packed by _pack_trades
+        'win_rate': np.float64,
+        'sum_return': np.float64,
+        'sum_duration': np.float64,
+        'last_updated': np.int64,  # Nanoseconds since the epoch (time.time_ns)
+    }
+    TEXT_COLUMNS = ('best_pattern', 'worst_pattern')
+    
+    def __init__(self, capacity: int = 64):
+        shape = (capacity, len(KillZoneType))
+        self.rows = 0
+        # Whether a symbol has a stats entry for a zone
+        self.present = np.zeros(shape, dtype=bool)
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.zeros(shape, dtype=dtype) for name, dtype in self.NUMERIC_COLUMNS.items()
+        }
+        for name in self.TEXT_COLUMNS:
+            self.columns[name] = np.full(shape, "", dtype=object)
+    
+    def add_row(self) -> int:
+        """Append an empty row, doubling capacity when full"""
+        if self.rows == len(self.present):
+            self.present = self._grow(self.present, False)
+            for name, column in self.columns.items():
+                self.columns[name] = self._grow(column, "" if name in self.TEXT_COLUMNS else 0)
+        self.rows += 1
+        return self.rows - 1
+    
+    def clear_row(self, row: int):
+        """Reset a row to no stats entries"""
+        self.present[row] = False
+        for name, column in self.columns.items():
+            column[row] = "" if name in self.TEXT_COLUMNS else 0
+    
+    @staticmethod
+    def _grow(column: np.ndarray, fill) -> np.ndarray:
+        grown = np.full((2 * len(column), column.shape[1]), fill, dtype=column.dtype)
+        grown[:len(column)] = column
+        return grown
+
+
+# Trade counts share one int64: wins in the high 32 bits, losses in the low 32
+_WIN = 1 << 32
+_LOSS_MASK = _WIN - 1
+
+
+def _pack_trades(wins: int, losses: int) -> int:
+    """Packed trade counts for a stats table cell"""
+    return (wins << 32) + losses
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _stored_ns(data: dict, ns_key: str, iso_key: str, default: int) -> int:
+    """Epoch nanoseconds saved under ns_key, else parsed from the naive UTC ISO 8601 string under iso_key"""
+    ns = data.get(ns_key)
+    if ns is not None:
+        return ns
+    value = data.get(iso_key)
+    if value is None:
+        return default
+    return (datetime.fromisoformat(value) - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Naive UTC ISO 8601 string for epoch nanoseconds"""
+    return (_EPOCH + timedelta(microseconds=int(ns) // 1000)).isoformat()
+
+
+def _stats_column(name: str, cast) -> property:
+    """Property reading and writing one column of the stats table"""
+    def fget(self):
+        return cast(self._table.columns[name][self._row, self._zone])
+    
+    def fset(self, value):
+        self._table.columns[name][self._row, self._zone] = value
+    
+    return property(fget, fset)
 
 
-@dataclass
 class KillZoneStats:
-    """Statistics for a specific kill zone"""
-    total_signals: int = 0
-    successful_trades: int = 0
-    failed_trades: int = 0
-    win_rate: float = 0.0
-    avg_return_percent: float = 0.0
-    avg_duration_minutes: float = 0.0
-    best_pattern: str = ""
-    worst_pattern: str = ""
-    last_updated: datetime = field(default_factory=datetime.utcnow)
+    """Statistics for a specific kill zone (a view of one stats table cell)"""
+    
+    __slots__ = ('_table', '_row', '_zone')
+    
+    total_signals = _stats_column('total_signals', int)
+    trades = _stats_column('trades', int)  # Packed wins and losses
+    win_rate = _stats_column('win_rate', float)
+    sum_return = _stats_column('sum_return', float)
+    sum_duration = _stats_column('sum_duration', float)
+    best_pattern = _stats_column('best_pattern', str)
+    worst_pattern = _stats_column('worst_pattern', str)
+    last_updated = _stats_column('last_updated', int)  # Epoch nanoseconds
+    
+    def __init__(self, table: _ZoneStatsTable, row: int, zone: int):
+        self._table = table
+        self._row = row
+        self._zone = zone
+    
+    @property
+    def successful_trades(self) -> int:
+        return self.trades >> 32
+    
+    @property
+    def failed_trades(self) -> int:
+        return self.trades & _LOSS_MASK
+    
+    @property
+    def total_trades(self) -> int:
+        trades = self.trades
+        return (trades >> 32) + (trades & _LOSS_MASK)
+    
+    @property
+    def avg_return_percent(self) -> float:
+        """Average return per trade"""
+        total_trades = self.total_trades
+        return self.sum_return / total_trades if total_trades else 0.0
+    
+    @property
+    def avg_duration_minutes(self) -> float:
+        """Average trade duration"""
+        total_trades = self.total_trades
+        return self.sum_duration / total_trades if total_trades else 0.0
 
 
 @dataclass
 class SymbolKillZoneProfile:
-    """Complete kill zone profile for a symbol"""
+    """Complete kill zone profile for a symbol (zone stats live in the tracker's table)"""
     symbol: str
-    zone_stats: Dict[KillZoneType, KillZoneStats] = field(default_factory=dict)
+    row: int
+    table: _ZoneStatsTable = field(repr=False)
+    # Stats views indexed by zone id (None for zones without an entry)
+    zone_stats: List[Optional[KillZoneStats]] = field(default_factory=lambda: [None] * len(_ZONE_TYPES))
+    # Zone ids with a stats entry, in the order they were first seen
+    zone_ids: List[int] = field(default_factory=list)
     overall_best_zone: Optional[KillZoneType] = None
     overall_worst_zone: Optional[KillZoneType] = None
     optimal_session: str = ""
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    # Set when trades change the zone stats the overall fields derive from
+    overall_dirty: bool = False
+    updated_at: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
+    # Bumped on every recorded signal or trade; cached recommendations carry the version they were built at
+    version: int = 0
+    recommendations: List[Optional[Tuple[int, Dict]]] = field(
+        default_factory=lambda: [None] * len(_ZONE_TYPES), repr=False
+    )
+    
+    def ensure_zone(self, zone: int, now_ns: int) -> bool:
+        """Create an empty stats entry for a zone id; returns True if it was new"""
+        if self.table.present[self.row, zone]:
+            return False
+        self.table.present[self.row, zone] = True
+        self.table.columns['last_updated'][self.row, zone] = now_ns
+        self.zone_stats[zone] = KillZoneStats(self.table, self.row, zone)
+        self.zone_ids.append(zone)
+        return True
 
 
 class KillZonePerformanceTracker:
@@ -54,9 +302,23 @@ class KillZonePerformanceTracker:
     def __init__(self, data_dir: str = "data/killzone_stats"):
         self.data_dir = data_dir
         self.profiles: Dict[str, SymbolKillZoneProfile] = {}
-        self.kill_zone_detector = KillZoneDetector()
+        self.kill_zone_detector = kill_zone_detector
+        # Symbols with unsaved changes (written behind by flush)
+        self._dirty: set = set()
+        self._flush_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Serializes writes to the stats table (records, new rows), profile
+        # saves and lazy overall-stats refreshes, which run on the flush timer
+        # thread as well as the callers'
+        self._profile_lock = threading.RLock()
+        # Zone stats for every profile, one row per symbol
+        self._table = _ZoneStatsTable()
+        self._row_symbols: List[str] = []
+        # Content digest of each symbol's last written profile
+        self._saved_digests: Dict[str, bytes] = {}
         self._ensure_data_dir()
         self._load_profiles()
+        _LIVE_TRACKERS.add(self)
     
     def _ensure_data_dir(self):
         """Create data directory if it doesn't exist"""
@@ -73,65 +335,105 @@ class KillZonePerformanceTracker:
         if not os.path.exists(self.data_dir):
             return
         
-        for filename in os.listdir(self.data_dir):
-            if filename.endswith("_killzone.json"):
+        with os.scandir(self.data_dir) as entries:
+            entries = [entry for entry in entries if entry.name.endswith("_killzone.json")]
+        if not entries:
+            return
+        
+        # Overlap the file reads in threads; profiles are built on this thread
+        with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(entries))) as executor:
+            results = executor.map(_read_profile, [entry.path for entry in entries])
+            for entry, data in zip(entries, results):
+                if data is None:
+                    continue
                 try:
-                    filepath = os.path.join(self.data_dir, filename)
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                        self._deserialize_profile(data)
+                    if isinstance(data, Exception):
+                        raise data
+                    self._deserialize_profile(data)
                 except Exception as e:
-                    print(f"Error loading profile {filename}: {e}")
+                    print(f"Error loading profile {entry.name}: {e}")
     
     def _deserialize_profile(self, data: dict):
         """Deserialize profile from JSON"""
         symbol = data['symbol']
-        profile = SymbolKillZoneProfile(symbol=symbol)
+        profile = self._new_profile(symbol)
+        # Timestamp for entries saved without one
+        now_ns = time.time_ns()
+        # The profile's row of each column, written back once at the end
+        values = {name: column[profile.row].tolist() for name, column in self._table.columns.items()}
         
         for zone_type_str, stats_data in data.get('zone_stats', {}).items():
-            zone_type = KillZoneType(zone_type_str)
-            stats = KillZoneStats(
-                total_signals=stats_data.get('total_signals', 0),
-                successful_trades=stats_data.get('successful_trades', 0),
-                failed_trades=stats_data.get('failed_trades', 0),
-                win_rate=stats_data.get('win_rate', 0.0),
-                avg_return_percent=stats_data.get('avg_return_percent', 0.0),
-                avg_duration_minutes=stats_data.get('avg_duration_minutes', 0.0),
-                best_pattern=stats_data.get('best_pattern', ''),
-                worst_pattern=stats_data.get('worst_pattern', ''),
-                last_updated=datetime.fromisoformat(stats_data.get('last_updated', datetime.utcnow().isoformat()))
-            )
-            profile.zone_stats[zone_type] = stats
+            zone = _ZONE_IDS_BY_VALUE[zone_type_str]
+            successful_trades = stats_data.get('successful_trades', 0)
+            failed_trades = stats_data.get('failed_trades', 0)
+            total_trades = successful_trades + failed_trades
+            
+            # Older profiles only stored averages
+            sum_return = stats_data.get('sum_return')
+            if sum_return is None:
+                sum_return = stats_data.get('avg_return_percent', 0.0) * total_trades
+            sum_duration = stats_data.get('sum_duration')
+            if sum_duration is None:
+                sum_duration = stats_data.get('avg_duration_minutes', 0.0) * total_trades
+            
+            profile.ensure_zone(zone, 0)
+            values['total_signals'][zone] = stats_data.get('total_signals', 0)
+            values['trades'][zone] = _pack_trades(successful_trades, failed_trades)
+            values['win_rate'][zone] = stats_data.get('win_rate', 0.0)
+            values['sum_return'][zone] = sum_return
+            values['sum_duration'][zone] = sum_duration
+            values['best_pattern'][zone] = stats_data.get('best_pattern', '')
+            values['worst_pattern'][zone] = stats_data.get('worst_pattern', '')
+            values['last_updated'][zone] = _stored_ns(stats_data, 'last_updated_ns', 'last_updated', now_ns)
+        
+        for name, row_values in values.items():
+            self._table.columns[name][profile.row] = row_values
         
         profile.overall_best_zone = KillZoneType(data['overall_best_zone']) if data.get('overall_best_zone') else None
         profile.overall_worst_zone = KillZoneType(data['overall_worst_zone']) if data.get('overall_worst_zone') else None
         profile.optimal_session = data.get('optimal_session', '')
-        profile.updated_at = datetime.fromisoformat(data.get('updated_at', datetime.utcnow().isoformat()))
+        profile.updated_at = _stored_ns(data, 'updated_at_ns', 'updated_at', now_ns)
         
         self.profiles[symbol] = profile
     
     def _serialize_profile(self, profile: SymbolKillZoneProfile) -> dict:
         """Serialize profile to JSON"""
+        self._refresh_overall_stats(profile)
+        
+        # Read each column's row once for all of the profile's zones
+        values = {name: column[profile.row].tolist() for name, column in self._table.columns.items()}
+        
+        zone_stats = {}
+        for zone in profile.zone_ids:
+            trades = values['trades'][zone]
+            successful_trades = trades >> 32
+            failed_trades = trades & _LOSS_MASK
+            total_trades = successful_trades + failed_trades
+            sum_return = values['sum_return'][zone]
+            sum_duration = values['sum_duration'][zone]
+            zone_stats[_ZONE_TYPES[zone].value] = {
+                'total_signals': values['total_signals'][zone],
+                'successful_trades': successful_trades,
+                'failed_trades': failed_trades,
+                'win_rate': values['win_rate'][zone],
+                'avg_return_percent': sum_return / total_trades if total_trades else 0.0,
+                'avg_duration_minutes': sum_duration / total_trades if total_trades else 0.0,
+                'sum_return': sum_return,
+                'sum_duration': sum_duration,
+                'best_pattern': values['best_pattern'][zone],
+                'worst_pattern': values['worst_pattern'][zone],
+                'last_updated': _ns_to_iso(values['last_updated'][zone]),
+                'last_updated_ns': values['last_updated'][zone]
+            }
+        
         return {
             'symbol': profile.symbol,
-            'zone_stats': {
-                zone_type.value: {
-                    'total_signals': stats.total_signals,
-                    'successful_trades': stats.successful_trades,
-                    'failed_trades': stats.failed_trades,
-                    'win_rate': stats.win_rate,
-                    'avg_return_percent': stats.avg_return_percent,
-                    'avg_duration_minutes': stats.avg_duration_minutes,
-                    'best_pattern': stats.best_pattern,
-                    'worst_pattern': stats.worst_pattern,
-                    'last_updated': stats.last_updated.isoformat()
-                }
-                for zone_type, stats in profile.zone_stats.items()
-            },
+            'zone_stats': zone_stats,
             'overall_best_zone': profile.overall_best_zone.value if profile.overall_best_zone else None,
             'overall_worst_zone': profile.overall_worst_zone.value if profile.overall_worst_zone else None,
             'optimal_session': profile.optimal_session,
-            'updated_at': profile.updated_at.isoformat()
+            'updated_at': _ns_to_iso(profile.updated_at),
+            'updated_at_ns': profile.updated_at
         }
     
     def _save_profile(self, symbol: str):
@@ -139,19 +441,81 @@ class KillZonePerformanceTracker:
         if symbol not in self.profiles:
             return
         
-        try:
-            filepath = self._get_profile_path(symbol)
-            data = self._serialize_profile(self.profiles[symbol])
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Error saving profile for {symbol}: {e}")
+        with self._profile_lock:
+            tmp_path = None
+            try:
+                filepath = self._get_profile_path(symbol)
+                data = self._serialize_profile(self.profiles[symbol])
+                # Nothing but timestamps changed since the last write
+                digest = _content_digest(data)
+                if self._saved_digests.get(symbol) == digest:
+                    return
+                
+                # Write to a unique temp file and swap it in so readers never see a partial file
+                fd, tmp_path = tempfile.mkstemp(dir=self.data_dir, suffix=".tmp")
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_dump_json(data))
+                os.replace(tmp_path, filepath)
+                tmp_path = None
+                self._saved_digests[symbol] = digest
+            except Exception as e:
+                print(f"Error saving profile for {symbol}: {e}")
+                # Keep the change pending so the next flush retries it
+                self._requeue(symbol)
+            finally:
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    
+    def _mark_dirty(self, symbol: str):
+        """Schedule a profile save, batching bursts of updates into one write"""
+        with self._flush_lock:
+            self._dirty.add(symbol)
+            flush_now = len(self._dirty) >= _FLUSH_MAX_DIRTY
+            if not flush_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_INTERVAL_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if flush_now:
+            self.flush()
+    
+    def _requeue(self, symbol: str):
+        """Mark a symbol dirty again after a failed save, retrying on the next timer"""
+        with self._flush_lock:
+            self._dirty.add(symbol)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_INTERVAL_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self):
+        """Save all profiles with pending changes"""
+        with self._flush_lock:
+            dirty, self._dirty = self._dirty, set()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        
+        for symbol in dirty:
+            self._save_profile(symbol)
     
     def get_or_create_profile(self, symbol: str) -> SymbolKillZoneProfile:
         """Get existing profile or create new one"""
-        if symbol not in self.profiles:
-            self.profiles[symbol] = SymbolKillZoneProfile(symbol=symbol)
-        return self.profiles[symbol]
+        with self._profile_lock:
+            if symbol not in self.profiles:
+                self.profiles[symbol] = self._new_profile(symbol)
+            return self.profiles[symbol]
+    
+    def _new_profile(self, symbol: str) -> SymbolKillZoneProfile:
+        """Empty profile backed by the symbol's stats table row"""
+        existing = self.profiles.get(symbol)
+        if existing is not None:
+            row = existing.row
+            self._table.clear_row(row)
+        else:
+            row = self._table.add_row()
+            self._row_symbols.append(symbol)
+        return SymbolKillZoneProfile(symbol=symbol, row=row, table=self._table)
     
     def record_signal(self, symbol: str, timestamp: int, signal_strength: float,
                      pattern_type: str, recommendation: str):
@@ -165,21 +529,22 @@ class KillZonePerformanceTracker:
             pattern_type: Type of pattern detected
             recommendation: Buy/Sell/Neutral
         """
-        profile = self.get_or_create_profile(symbol)
-        
-        # Determine which kill zone this signal occurred in
-        kill_zone_info = self.kill_zone_detector.get_current_kill_zone(timestamp)
-        zone_type = kill_zone_info.zone_type
-        
-        if zone_type not in profile.zone_stats:
-            profile.zone_stats[zone_type] = KillZoneStats()
-        
-        stats = profile.zone_stats[zone_type]
-        stats.total_signals += 1
-        stats.last_updated = datetime.utcnow()
-        
-        profile.updated_at = datetime.utcnow()
-        self._save_profile(symbol)
+        with self._profile_lock:
+            profile = self.get_or_create_profile(symbol)
+            
+            # Determine which kill zone this signal occurred in
+            zone = self.kill_zone_detector.get_zone_id(timestamp)
+            row = profile.row
+            columns = self._table.columns
+            now_ns = time.time_ns()
+            
+            profile.ensure_zone(zone, now_ns)
+            columns['total_signals'][row, zone] += 1
+            columns['last_updated'][row, zone] = now_ns
+            
+            profile.updated_at = now_ns
+            profile.version += 1
+            self._mark_dirty(symbol)
     
     def record_trade_outcome(self, symbol: str, timestamp: int, success: bool,
                            return_percent: float, duration_minutes: float,
@@ -195,102 +560,137 @@ class KillZonePerformanceTracker:
             duration_minutes: Trade duration
             pattern_type: Pattern that triggered the trade
         """
-        profile = self.get_or_create_profile(symbol)
-        
-        kill_zone_info = self.kill_zone_detector.get_current_kill_zone(timestamp)
-        zone_type = kill_zone_info.zone_type
-        
-        if zone_type not in profile.zone_stats:
-            profile.zone_stats[zone_type] = KillZoneStats()
-        
-        stats = profile.zone_stats[zone_type]
-        
-        # Update trade counts
-        if success:
-            stats.successful_trades += 1
-        else:
-            stats.failed_trades += 1
-        
-        # Recalculate win rate
-        total_trades = stats.successful_trades + stats.failed_trades
-        if total_trades > 0:
-            stats.win_rate = (stats.successful_trades / total_trades) * 100
-        
-        # Update average return (weighted moving average)
-        if total_trades == 1:
-            stats.avg_return_percent = return_percent
-        else:
-            stats.avg_return_percent = (
-                (stats.avg_return_percent * (total_trades - 1)) + return_percent
-            ) / total_trades
-        
-        # Update average duration
-        if total_trades == 1:
-            stats.avg_duration_minutes = duration_minutes
-        else:
-            stats.avg_duration_minutes = (
-                (stats.avg_duration_minutes * (total_trades - 1)) + duration_minutes
-            ) / total_trades
-        
-        stats.last_updated = datetime.utcnow()
+        with self._profile_lock:
+            profile = self.get_or_create_profile(symbol)
+            
+            zone = self.kill_zone_detector.get_zone_id(timestamp)
+            row = profile.row
+            columns = self._table.columns
+            now_ns = time.time_ns()
+            
+            profile.ensure_zone(zone, now_ns)
+            
+            # Update trade counts
+            trades = columns['trades']
+            trades[row, zone] += _WIN if success else 1
+            
+            # Recalculate win rate
+            packed = int(trades[row, zone])
+            successful_trades = packed >> 32
+            total_trades = successful_trades + (packed & _LOSS_MASK)
+            columns['win_rate'][row, zone] = (successful_trades / total_trades) * 100
+            
+            # Running sums; averages are derived on read
+            columns['sum_return'][row, zone] += return_percent
+            columns['sum_duration'][row, zone] += duration_minutes
+            columns['last_updated'][row, zone] = now_ns
+            
+            # Best/worst zones are recomputed when next read
+            profile.overall_dirty = True
+            
+            profile.updated_at = now_ns
+            profile.version += 1
+            self._mark_dirty(symbol)
+    
+    def record_trade_outcomes_bulk(self, symbols, timestamps, successes,
+                                   returns, durations):
+        """
+        Record many trade outcomes at once (e.g. from a backtest)
         
-        # Update overall best/worst zones
-        self._update_overall_stats(profile)
+        Equivalent to calling record_trade_outcome for each trade in order.
         
-        profile.updated_at = datetime.utcnow()
-        self._save_profile(symbol)
+        Args:
+            symbols: Trading symbol of each trade
+            timestamps: Entry timestamps
+            successes: Whether each trade was profitable
+            returns: Return percentage of each trade
+            durations: Duration of each trade in minutes
+        """
+        with self._profile_lock:
+            timestamps = np.asarray(timestamps, dtype=np.int64)
+            if not len(timestamps):
+                return
+            successes = np.asarray(successes, dtype=bool)
+            
+            # Profiles in order of first appearance, as one-by-one recording would create them
+            symbol_codes, unique_symbols = pd.factorize(np.asarray(symbols, dtype=object))
+            profiles = [self.get_or_create_profile(symbol) for symbol in unique_symbols]
+            rows = np.array([profile.row for profile in profiles], dtype=np.intp)[symbol_codes]
+            zones = self.kill_zone_detector.classify_batch(timestamps).astype(np.intp)
+            now_ns = time.time_ns()
+            
+            # New zone entries in the order their first trade appears
+            cells = rows * len(_ZONE_TYPES) + zones
+            cells, first_index = np.unique(cells, return_index=True)
+            for index in np.sort(first_index).tolist():
+                profiles[symbol_codes[index]].ensure_zone(int(zones[index]), now_ns)
+            
+            columns = self._table.columns
+            index = (rows, zones)
+            np.add.at(columns['trades'], index, np.where(successes, _WIN, 1))
+            np.add.at(columns['sum_return'], index, np.asarray(returns, dtype=np.float64))
+            np.add.at(columns['sum_duration'], index, np.asarray(durations, dtype=np.float64))
+            
+            # Win rates and timestamps of the touched cells
+            cell_rows, cell_zones = np.divmod(cells, len(_ZONE_TYPES))
+            trades = columns['trades'][cell_rows, cell_zones]
+            successful_trades = trades >> 32
+            total_trades = successful_trades + (trades & _LOSS_MASK)
+            columns['win_rate'][cell_rows, cell_zones] = (successful_trades / total_trades) * 100
+            columns['last_updated'][cell_rows, cell_zones] = now_ns
+            
+            for profile in profiles:
+                profile.overall_dirty = True
+                profile.updated_at = now_ns
+                profile.version += 1
+                self._mark_dirty(profile.symbol)
+    
+    def _refresh_overall_stats(self, profile: SymbolKillZoneProfile):
+        """Recompute the overall fields if trades were recorded since the last read"""
+        with self._profile_lock:
+            if profile.overall_dirty:
+                # Cleared first so a trade recorded meanwhile marks the profile again
+                profile.overall_dirty = False
+                self._update_overall_stats(profile)
     
     def _update_overall_stats(self, profile: SymbolKillZoneProfile):
         """Update overall best/worst zone statistics"""
-        if not profile.zone_stats:
+        if not profile.zone_ids:
             return
         
-        # Filter zones with sufficient data (at least 5 trades)
-        qualified_zones = {
-            zone: stats for zone, stats in profile.zone_stats.items()
-            if (stats.successful_trades + stats.failed_trades) >= 5
-        }
+        # Zone ids in first-seen order, so ties resolve to the earliest zone
+        zones = np.array(profile.zone_ids)
+        columns = self._table.columns
+        trades = columns['trades'][profile.row, zones]
+        wins = trades >> 32
+        totals = wins + (trades & _LOSS_MASK)
         
-        if not qualified_zones:
+        # Filter zones with sufficient data (at least 5 trades)
+        qualified = totals >= 5
+        if not qualified.any():
             return
-        
-        # Find best zone (highest win rate)
-        best_zone = max(qualified_zones.items(), key=lambda x: x[1].win_rate)
-        profile.overall_best_zone = best_zone[0]
-        
-        # Find worst zone (lowest win rate)
-        worst_zone = min(qualified_zones.items(), key=lambda x: x[1].win_rate)
-        profile.overall_worst_zone = worst_zone[0]
-        
-        # Determine optimal session
-        session_performance = defaultdict(lambda: {'wins': 0, 'total': 0})
-        
-        for zone_type, stats in qualified_zones.items():
-            session = self._get_session_from_zone(zone_type)
-            session_performance[session]['wins'] += stats.successful_trades
-            session_performance[session]['total'] += stats.successful_trades + stats.failed_trades
-        
-        # Calculate win rates per session
-        best_session = None
-        best_rate = 0
-        for session, data in session_performance.items():
-            if data['total'] > 0:
-                rate = (data['wins'] / data['total']) * 100
-                if rate > best_rate:
-                    best_rate = rate
-                    best_session = session
-        
-        profile.optimal_session = best_session or ""
+        zones, wins, totals = zones[qualified], wins[qualified], totals[qualified]
+        win_rates = columns['win_rate'][profile.row, zones]
+        
+        # Best (highest win rate) and worst (lowest win rate) zones
+        profile.overall_best_zone = _ZONE_TYPES[zones[np.argmax(win_rates)]]
+        profile.overall_worst_zone = _ZONE_TYPES[zones[np.argmin(win_rates)]]
+        
+        # Determine optimal session from wins and trades summed per session
+        session_ids = _ZONE_SESSION_IDS[zones]
+        session_wins = np.bincount(session_ids, wins, minlength=len(_SESSIONS))
+        session_totals = np.bincount(session_ids, totals, minlength=len(_SESSIONS))
+        
+        # Sessions in order of their first qualified zone, so ties resolve to the earliest
+        sessions, first_index = np.unique(session_ids, return_index=True)
+        sessions = sessions[np.argsort(first_index)]
+        rates = (session_wins[sessions] / session_totals[sessions]) * 100
+        best = np.argmax(rates)
+        profile.optimal_session = _SESSIONS[sessions[best]] if rates[best] > 0 else ""
     
     def _get_session_from_zone(self, zone_type: KillZoneType) -> str:
         """Map kill zone to trading session"""
-        mapping = {
-            KillZoneType.LONDON_KILL_ZONE: "london_session",
-            KillZoneType.NY_KILL_ZONE: "ny_session",
-            KillZoneType.LONDON_CLOSE: "london_session",
-            KillZoneType.ASIAN_SESSION: "asian_session"
-        }
-        return mapping.get(zone_type, "")
+        return _ZONE_TO_SESSION[_ZONE_TYPES.index(zone_type)]
     
     def get_zone_recommendation(self, symbol: str, zone_type: KillZoneType) -> Dict:
         """
@@ -300,8 +700,27 @@ class KillZonePerformanceTracker:
             Dict with recommendation, confidence, and statistics
         """
         profile = self.get_or_create_profile(symbol)
+        return self._zone_recommendation(profile, _ZONE_TYPES.index(zone_type))
+    
+    def _zone_recommendation(self, profile: SymbolKillZoneProfile, zone: int) -> Dict:
+        """Recommendation for a zone id, cached until the profile's version changes"""
+        version = profile.version
+        cached = profile.recommendations[zone]
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        self._refresh_overall_stats(profile)
+        recommendation = self._build_zone_recommendation(profile, zone)
+        profile.recommendations[zone] = (version, recommendation)
+        return recommendation
+    
+    def _build_zone_recommendation(self, profile: SymbolKillZoneProfile, zone: int) -> Dict:
+        """Recommendation for a zone id from the profile's current stats"""
+        symbol = profile.symbol
+        zone_type = _ZONE_TYPES[zone]
+        stats = profile.zone_stats[zone]
         
-        if zone_type not in profile.zone_stats:
+        if stats is None:
             return {
                 'recommendation': 'insufficient_data',
                 'confidence': 0,
@@ -309,8 +728,7 @@ class KillZonePerformanceTracker:
                 'statistics': None
             }
         
-        stats = profile.zone_stats[zone_type]
-        total_trades = stats.successful_trades + stats.failed_trades
+        total_trades = stats.total_trades
         
         if total_trades < 5:
             return {
@@ -320,28 +738,16 @@ class KillZonePerformanceTracker:
                 'statistics': self._format_stats(stats)
             }
         
-        # Determine recommendation
-        if stats.win_rate >= 60:
-            recommendation = 'strong_buy'
-            confidence = min(100, stats.win_rate)
-            message = f'Excellent {stats.win_rate:.1f}% win rate in this zone'
-        elif stats.win_rate >= 50:
-            recommendation = 'favorable'
-            confidence = stats.win_rate
-            message = f'Favorable {stats.win_rate:.1f}% win rate in this zone'
-        elif stats.win_rate >= 40:
-            recommendation = 'neutral'
-            confidence = 50
-            message = f'Moderate {stats.win_rate:.1f}% win rate - use caution'
-        else:
-            recommendation = 'avoid'
-            confidence = 100 - stats.win_rate
-            message = f'Poor {stats.win_rate:.1f}% win rate - consider avoiding'
+        # Determine recommendation from the first tier the win rate reaches
+        win_rate = stats.win_rate
+        for min_win_rate, recommendation, confidence, message in _RECOMMENDATION_TIERS:
+            if win_rate >= min_win_rate:
+                break
         
         return {
             'recommendation': recommendation,
-            'confidence': confidence,
-            'message': message,
+            'confidence': confidence(win_rate),
+            'message': message.format(win_rate),
             'statistics': self._format_stats(stats),
             'is_best_zone': profile.overall_best_zone == zone_type,
             'is_worst_zone': profile.overall_worst_zone == zone_type
@@ -349,7 +755,7 @@ class KillZonePerformanceTracker:
     
     def _format_stats(self, stats: KillZoneStats) -> Dict:
         """Format statistics for display"""
-        total_trades = stats.successful_trades + stats.failed_trades
+        total_trades = stats.total_trades
         return {
             'total_trades': total_trades,
             'win_rate': round(stats.win_rate, 1),
@@ -367,20 +773,20 @@ class KillZonePerformanceTracker:
             Dict with overall stats and zone-by-zone breakdown
         """
         profile = self.get_or_create_profile(symbol)
+        self._refresh_overall_stats(profile)
         
         summary = {
             'symbol': symbol,
             'optimal_session': profile.optimal_session,
             'overall_best_zone': profile.overall_best_zone.value if profile.overall_best_zone else None,
             'overall_worst_zone': profile.overall_worst_zone.value if profile.overall_worst_zone else None,
-            'last_updated': profile.updated_at.isoformat(),
+            'last_updated': _ns_to_iso(profile.updated_at),
             'zone_recommendations': {}
         }
         
         # Add recommendations for each zone
-        for zone_type in KillZoneType:
-            if zone_type != KillZoneType.OFF_HOURS:
-                summary['zone_recommendations'][zone_type.value] = self.get_zone_recommendation(symbol, zone_type)
+        for zone in _SUMMARY_ZONE_IDS:
+            summary['zone_recommendations'][_ZONE_TYPES[zone].value] = self._zone_recommendation(profile, zone)
         
         return summary
     
@@ -391,17 +797,18 @@ class KillZonePerformanceTracker:
         Returns:
             List of (symbol, win_rate) tuples, sorted by win rate
         """
-        results = []
-        
-        for symbol, profile in self.profiles.items():
-            if zone_type in profile.zone_stats:
-                stats = profile.zone_stats[zone_type]
-                total_trades = stats.successful_trades + stats.failed_trades
-                
-                if total_trades >= min_trades:
-                    results.append((symbol, stats.win_rate))
-        
-        return sorted(results, key=lambda x: x[1], reverse=True)
+        zone = _ZONE_TYPES.index(zone_type)
+        rows = self._table.rows
+        columns = self._table.columns
+        trades = columns['trades'][:rows, zone]
+        total_trades = (trades >> 32) + (trades & _LOSS_MASK)
+        selected = np.flatnonzero(self._table.present[:rows, zone] & (total_trades >= min_trades))
+        win_rates = columns['win_rate'][selected, zone]
+        
+        # Stable sort keeps profile order among equal win rates
+        order = np.argsort(-win_rates, kind='stable')
+        return [(self._row_symbols[row], win_rate)
+                for row, win_rate in zip(selected[order].tolist(), win_rates[order].tolist())]
     
     def get_recent_performance(self, symbol: str, days: int = 30) -> Dict:
         """
@@ -414,18 +821,20 @@ class KillZonePerformanceTracker:
         Returns:
             Recent performance statistics
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_ns = time.time_ns() - days * 86400 * 1_000_000_000
         profile = self.get_or_create_profile(symbol)
         
-        recent_stats = {}
-        total_recent_trades = 0
-        total_recent_wins = 0
+        # Zones updated since the cutoff, in first-seen order
+        zones = np.array(profile.zone_ids, dtype=np.intp)
+        columns = self._table.columns
+        zones = zones[columns['last_updated'][profile.row, zones] >= cutoff_ns]
+        trades = columns['trades'][profile.row, zones]
+        total_recent_wins = int((trades >> 32).sum())
+        total_recent_trades = total_recent_wins + int((trades & _LOSS_MASK).sum())
         
-        for zone_type, stats in profile.zone_stats.items():
-            if stats.last_updated >= cutoff_date:
-                recent_stats[zone_type.value] = self._format_stats(stats)
-                total_recent_trades += stats.successful_trades + stats.failed_trades
-                total_recent_wins += stats.successful_trades
+        recent_stats = {
+            _ZONE_TYPES[zone].value: self._format_stats(profile.zone_stats[zone]) for zone in zones.tolist()
+        }
         
         recent_win_rate = (total_recent_wins / total_recent_trades * 100) if total_recent_trades > 0 else 0
         
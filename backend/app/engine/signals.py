@@ -0,0 +1,21 @@
+"""
+Helpers shared by the ICT and SMC signal types
+
+Signal results expose an integer trade direction (1 = bullish, -1 = bearish,
+0 = neutral), which the AI enhancer's confluence check compares.
+"""
+
+from typing import Dict, Type
+from enum import Enum
+
+
+def signal_directions(signal_type: Type[Enum]) -> Dict[Enum, int]:
+    """
+    Trade direction of every member of a signal enum
+
+    1 for values containing 'bullish', -1 for 'bearish', 0 otherwise.
+    """
+    return {
+        signal: 1 if 'bullish' in signal.value else -1 if 'bearish' in signal.value else 0
+        for signal in signal_type
+    }
@@ -14,11 +14,13 @@ SMC focuses on institutional order flow and liquidity manipulation.
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+import heapq
+import math
 import numpy as np
-import pandas as pd
 from collections import defaultdict
 
 from ..models import Candle
+from .signals import signal_directions
 
 
 class SMCSignal(Enum):
@@ -34,7 +36,74 @@ class SMCSignal(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+# Liquidity pools kept per SMCStrategies instance before swept ones are dropped
+_MAX_LIQUIDITY_POOLS = 500
+
+
+def _price_bucket(price: float) -> int:
+    """Log-price bucket about 0.1% wide, used to index pool levels"""
+    return math.floor(math.log(price) * 1000)
+
+
+def _percentile(values: np.ndarray, q: float) -> float:
+    """np.percentile(values, q) with linear interpolation, from a partial sort"""
+    rank = (len(values) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = min(lower + 1, len(values) - 1)
+    fraction = rank - lower
+    
+    partitioned = np.partition(values, (lower, upper))
+    a, b = partitioned[lower], partitioned[upper]
+    # Interpolate from the nearer neighbour, rounding exactly as numpy does
+    if fraction >= 0.5:
+        return b - (b - a) * (1 - fraction)
+    return a + (b - a) * fraction
+
+
+# Trade direction per signal type (1 = bullish, -1 = bearish, 0 = neutral)
+_SIGNAL_DIRECTION: Dict[SMCSignal, int] = signal_directions(SMCSignal)
+
+
+# Fixed closing lines of each signal's rationale (never mutated)
+_SWEEP_BEARISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Equal highs taken out - institutional stop hunt",
+    "Subsequent rejection confirms manipulation",
+    "Expecting move to sell-side liquidity",
+)
+_SWEEP_BULLISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Equal lows taken out - institutional stop hunt",
+    "Subsequent rejection confirms manipulation",
+    "Expecting move to buy-side liquidity",
+)
+_INDUCEMENT_BULLISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Retail stops triggered before reversal",
+    "Institutional accumulation likely",
+)
+_INDUCEMENT_BEARISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Retail FOMO trapped before reversal",
+    "Institutional distribution likely",
+)
+_BPR_BULLISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Price consolidation zone identified",
+    "Expecting breakout above range",
+)
+_BPR_BEARISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Price consolidation zone identified",
+    "Expecting breakout below range",
+)
+_MITIGATION_BULLISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Zone filled and rejected - institutional absorption",
+    "Strong reversal signal from mitigated level",
+    "Previous support turned resistance now support again",
+)
+_MITIGATION_BEARISH_RATIONALE_TAIL: Tuple[str, ...] = (
+    "Zone filled and rejected - institutional absorption",
+    "Strong reversal signal from mitigated level",
+    "Previous resistance turned support now resistance again",
+)
+
+
+@dataclass(slots=True)
 class LiquidityPool:
     """Represents a liquidity pool (equal highs/lows)"""
     price_level: float
@@ -46,7 +115,7 @@ class LiquidityPool:
     subsequent_rejection: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class InducementPattern:
     """Represents an inducement (stop hunt) pattern"""
     direction: str  # 'bullish' or 'bearish'
@@ -57,7 +126,7 @@ class InducementPattern:
     confirmed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MitigationZone:
     """Represents a zone that was mitigated (filled)"""
     original_type: str  # 'order_block', 'fvg', 'breaker'
@@ -67,9 +136,10 @@ class MitigationZone:
     timestamp: int
     direction: str  # 'bullish' or 'bearish'
     subsequent_rejection: bool = False
+    signal_generated: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BalancedPriceRange:
     """Represents a Balanced Price Range zone"""
     high: float
@@ -81,7 +151,7 @@ class BalancedPriceRange:
     breakout_direction: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SMCSignalResult:
     """Result of SMC strategy analysis"""
     signal_type: SMCSignal
@@ -94,6 +164,28 @@ class SMCSignalResult:
     rationale: List[str]
     liquidity_target: Optional[float] = None
     confluence_ict: bool = False
+    
+    @property
+    def direction(self) -> int:
+        """Trade direction: 1 bullish, -1 bearish, 0 neutral"""
+        return _SIGNAL_DIRECTION[self.signal_type]
+
+
+@dataclass(slots=True)
+class _Scratch:
+    """Candle slices shared by the detectors within one analyze_candles call"""
+    last5_o: np.ndarray
+    last5_h: np.ndarray
+    last5_l: np.ndarray
+    last5_c: np.ndarray
+    last5_t: np.ndarray
+    last10_h: np.ndarray
+    last10_l: np.ndarray
+    last10_high: float
+    last10_low: float
+    last10_start_ts: int
+    current_price: float
+    current_ts: int
 
 
 class SMCStrategies:
@@ -101,6 +193,14 @@ class SMCStrategies:
     
     def __init__(self):
         self.liquidity_pools: List[LiquidityPool] = []
+        # Pools split by type and swept pools (in sweep order), kept alongside the list
+        self._pools_by_type: Dict[str, List[LiquidityPool]] = {'buy_side': [], 'sell_side': []}
+        self._swept_pools: List[LiquidityPool] = []
+        # Pool levels by type and price bucket, for the duplicate check
+        self._pool_buckets: Dict[str, Dict[int, List[float]]] = {
+            'buy_side': defaultdict(list),
+            'sell_side': defaultdict(list)
+        }
         self.inducements: List[InducementPattern] = []
         self.mitigation_zones: List[MitigationZone] = []
         self.bpr_zones: List[BalancedPriceRange] = []
@@ -113,254 +213,301 @@ class SMCStrategies:
         if len(candles) < 30:
             return []
         
-        df = pd.DataFrame([{
-            'timestamp': c.t,
-            'open': c.o,
-            'high': c.h,
-            'low': c.l,
-            'close': c.c,
-            'volume': c.v
-        } for c in candles])
+        # Candle fields as parallel arrays
+        n = len(candles)
+        timestamps = np.fromiter((c.t for c in candles), dtype=np.int64, count=n)
+        opens = np.fromiter((c.o for c in candles), dtype=np.float64, count=n)
+        highs = np.fromiter((c.h for c in candles), dtype=np.float64, count=n)
+        lows = np.fromiter((c.l for c in candles), dtype=np.float64, count=n)
+        closes = np.fromiter((c.c for c in candles), dtype=np.float64, count=n)
+        
+        # Recent windows read by several detectors, sliced once
+        last10_h, last10_l = highs[-10:], lows[-10:]
+        scratch = _Scratch(
+            last5_o=opens[-5:],
+            last5_h=highs[-5:],
+            last5_l=lows[-5:],
+            last5_c=closes[-5:],
+            last5_t=timestamps[-5:],
+            last10_h=last10_h,
+            last10_l=last10_l,
+            last10_high=last10_h.max(),
+            last10_low=last10_l.min(),
+            last10_start_ts=int(timestamps[-10]),
+            current_price=float(closes[-1]),
+            current_ts=int(timestamps[-1])
+        )
         
         results = []
-        current_price = df['close'].iloc[-1]
+        current_price = scratch.current_price
         
         # 1. Detect Liquidity Pools and Sweeps
-        self._detect_liquidity_pools(df)
-        sweep_results = self._detect_liquidity_sweeps(df, current_price)
+        self._detect_liquidity_pools(highs, lows, timestamps)
+        sweep_results = self._detect_liquidity_sweeps(scratch)
         results.extend(sweep_results)
         
         # 2. Detect Inducement Patterns
-        inducement_results = self._detect_inducements(df)
+        inducement_results = self._detect_inducements(scratch)
         results.extend(inducement_results)
         
         # 3. Detect Balanced Price Ranges
-        bpr_results = self._detect_bpr_zones(df, current_price)
+        bpr_results = self._detect_bpr_zones(scratch)
         results.extend(bpr_results)
         
         # 4. Track Mitigation Zones
-        self._update_mitigation_tracking(df)
+        self._update_mitigation_tracking(current_price)
         mitigation_results = self._detect_mitigation_setups(current_price)
         results.extend(mitigation_results)
         
         return self._rank_and_filter_signals(results)
     
-    def _detect_liquidity_pools(self, df: pd.DataFrame):
+    def _detect_liquidity_pools(self, highs: np.ndarray, lows: np.ndarray, timestamps: np.ndarray):
         """Detect liquidity pools (equal highs/lows)"""
         window = 20
         
-        if len(df) < window:
+        if len(highs) < window:
             return
         
-        recent_data = df.tail(window)
+        self._trim_liquidity_pools()
+        recent_timestamps = timestamps[-window:]
         
         # Find equal highs (resistance)
-        highs = recent_data['high'].values
-        for i in range(len(highs)):
-            for j in range(i + 1, len(highs)):
-                if abs(highs[i] - highs[j]) / highs[i] < 0.001:  # 0.1% tolerance
-                    pool = LiquidityPool(
-                        price_level=highs[i],
-                        type='buy_side',
-                        timestamp=int(recent_data.iloc[j]['timestamp'])
-                    )
-                    # Avoid duplicates
-                    if not any(abs(p.price_level - highs[i]) / highs[i] < 0.001 
-                              for p in self.liquidity_pools if p.type == 'buy_side'):
-                        self.liquidity_pools.append(pool)
+        self._add_equal_level_pools(highs[-window:], recent_timestamps, 'buy_side')
         
         # Find equal lows (support)
-        lows = recent_data['low'].values
-        for i in range(len(lows)):
-            for j in range(i + 1, len(lows)):
-                if abs(lows[i] - lows[j]) / lows[i] < 0.001:  # 0.1% tolerance
-                    pool = LiquidityPool(
-                        price_level=lows[i],
-                        type='sell_side',
-                        timestamp=int(recent_data.iloc[j]['timestamp'])
-                    )
-                    if not any(abs(p.price_level - lows[i]) / lows[i] < 0.001 
-                              for p in self.liquidity_pools if p.type == 'sell_side'):
-                        self.liquidity_pools.append(pool)
+        self._add_equal_level_pools(lows[-window:], recent_timestamps, 'sell_side')
     
-    def _detect_liquidity_sweeps(self, df: pd.DataFrame, current_price: float) -> List[SMCSignalResult]:
+    def _add_equal_level_pools(self, levels: np.ndarray, timestamps: np.ndarray, pool_type: str):
+        """Add a pool at each level matched by a later level within 0.1% tolerance"""
+        # equal[i, j]: level j (after i) is within 0.1% of level i
+        equal = np.abs(np.subtract.outer(levels, levels)) / levels[:, None] < 0.001
+        equal = np.triu(equal, k=1)
+        matched = np.flatnonzero(equal.any(axis=1))
+        if not len(matched):
+            return
+        first_match = equal[matched].argmax(axis=1)
+        
+        buckets = self._pool_buckets[pool_type]
+        for i, j in zip(matched.tolist(), first_match.tolist()):
+            level = levels[i]
+            # Avoid duplicates; the 0.1% tolerance never reaches past two buckets
+            bucket = _price_bucket(level)
+            if any(abs(existing - level) / level < 0.001
+                   for b in range(bucket - 2, bucket + 3) if b in buckets
+                   for existing in buckets[b]):
+                continue
+            pool = LiquidityPool(
+                price_level=level,
+                type=pool_type,
+                timestamp=int(timestamps[j])
+            )
+            self.liquidity_pools.append(pool)
+            self._pools_by_type[pool_type].append(pool)
+            buckets[bucket].append(level)
+    
+    def _trim_liquidity_pools(self):
+        """Drop the oldest swept pools once the pool list outgrows its cap"""
+        excess = len(self.liquidity_pools) - _MAX_LIQUIDITY_POOLS
+        if excess <= 0:
+            return
+        
+        kept = []
+        dropped = set()
+        for pool in self.liquidity_pools:
+            if excess > 0 and pool.swept:
+                excess -= 1
+                dropped.add(id(pool))
+                bucket = _price_bucket(pool.price_level)
+                levels = self._pool_buckets[pool.type][bucket]
+                levels.remove(pool.price_level)
+                if not levels:
+                    del self._pool_buckets[pool.type][bucket]
+            else:
+                kept.append(pool)
+        
+        if not dropped:
+            return
+        self.liquidity_pools = kept
+        for pool_type, pools in self._pools_by_type.items():
+            self._pools_by_type[pool_type] = [pool for pool in pools if id(pool) not in dropped]
+        self._swept_pools = [pool for pool in self._swept_pools if id(pool) not in dropped]
+    
+    def _detect_liquidity_sweeps(self, scratch: _Scratch) -> List[SMCSignalResult]:
         """Detect liquidity sweeps (taking out equal highs/lows)"""
         results = []
-        recent_data = df.tail(5)
+        recent_highs = scratch.last5_h
+        recent_lows = scratch.last5_l
+        current_price = scratch.current_price
         
-        for pool in self.liquidity_pools:
-            if pool.swept:
-                continue
+        open_pools = [pool for pool in self.liquidity_pools if not pool.swept]
+        if not open_pools:
+            return results
+        
+        count = len(open_pools)
+        levels = np.fromiter((pool.price_level for pool in open_pools), dtype=np.float64, count=count)
+        is_buy_side = np.fromiter((pool.type == 'buy_side' for pool in open_pools), dtype=bool, count=count)
+        is_sell_side = np.fromiter((pool.type == 'sell_side' for pool in open_pools), dtype=bool, count=count)
+        
+        # Check every open pool against the recent candles at once:
+        # buy-side liquidity is swept when price breaks above then rejects,
+        # sell-side liquidity when price breaks below then rejects
+        buy_swept = (is_buy_side
+                     & (recent_highs > levels[:, None] * 1.001).any(axis=1)
+                     & (current_price < levels))
+        sell_swept = (is_sell_side
+                      & (recent_lows < levels[:, None] * 0.999).any(axis=1)
+                      & (current_price > levels))
+        
+        for i in np.flatnonzero(buy_swept | sell_swept).tolist():
+            pool = open_pools[i]
+            pool.swept = True
+            self._swept_pools.append(pool)
+            pool.sweep_timestamp = scratch.current_ts
+            pool.subsequent_rejection = True
             
-            # Check for sweep
-            if pool.type == 'buy_side':
-                # Buy-side liquidity: price breaks above then rejects
-                high_violation = any(candle > pool.price_level * 1.001 for candle in recent_data['high'])
-                rejection = current_price < pool.price_level
+            if buy_swept[i]:
+                # Calculate targets
+                recent_low = scratch.last10_low
+                target = pool.price_level + (pool.price_level - recent_low) * 1.5
                 
-                if high_violation and rejection:
-                    pool.swept = True
-                    pool.sweep_timestamp = int(df['timestamp'].iloc[-1])
-                    pool.subsequent_rejection = True
-                    
-                    # Calculate targets
-                    recent_low = df['low'].tail(10).min()
-                    target = pool.price_level + (pool.price_level - recent_low) * 1.5
-                    
-                    result = SMCSignalResult(
-                        signal_type=SMCSignal.LIQUIDITY_SWEEP_BEARISH,
-                        strength=85.0,
-                        confidence=80.0,
-                        price=current_price,
-                        entry_zone=(current_price * 0.998, current_price * 1.002),
-                        stop_loss=pool.price_level * 1.005,
-                        take_profit=target,
-                        rationale=[
-                            f"Buy-side liquidity swept at ${pool.price_level:.2f}",
-                            "Equal highs taken out - institutional stop hunt",
-                            "Subsequent rejection confirms manipulation",
-                            "Expecting move to sell-side liquidity"
-                        ],
-                        liquidity_target=recent_low
-                    )
-                    results.append(result)
-            
-            elif pool.type == 'sell_side':
-                # Sell-side liquidity: price breaks below then rejects
-                low_violation = any(candle < pool.price_level * 0.999 for candle in recent_data['low'])
-                rejection = current_price > pool.price_level
+                result = SMCSignalResult(
+                    signal_type=SMCSignal.LIQUIDITY_SWEEP_BEARISH,
+                    strength=85.0,
+                    confidence=80.0,
+                    price=current_price,
+                    entry_zone=(current_price * 0.998, current_price * 1.002),
+                    stop_loss=pool.price_level * 1.005,
+                    take_profit=target,
+                    rationale=[
+                        f"Buy-side liquidity swept at ${pool.price_level:.2f}",
+                        *_SWEEP_BEARISH_RATIONALE_TAIL
+                    ],
+                    liquidity_target=recent_low
+                )
+            else:
+                # Calculate targets
+                recent_high = scratch.last10_high
+                target = pool.price_level - (recent_high - pool.price_level) * 1.5
                 
-                if low_violation and rejection:
-                    pool.swept = True
-                    pool.sweep_timestamp = int(df['timestamp'].iloc[-1])
-                    pool.subsequent_rejection = True
-                    
-                    # Calculate targets
-                    recent_high = df['high'].tail(10).max()
-                    target = pool.price_level - (recent_high - pool.price_level) * 1.5
-                    
-                    result = SMCSignalResult(
-                        signal_type=SMCSignal.LIQUIDITY_SWEEP_BULLISH,
-                        strength=85.0,
-                        confidence=80.0,
-                        price=current_price,
-                        entry_zone=(current_price * 0.998, current_price * 1.002),
-                        stop_loss=pool.price_level * 0.995,
-                        take_profit=target,
-                        rationale=[
-                            f"Sell-side liquidity swept at ${pool.price_level:.2f}",
-                            "Equal lows taken out - institutional stop hunt",
-                            "Subsequent rejection confirms manipulation",
-                            "Expecting move to buy-side liquidity"
-                        ],
-                        liquidity_target=recent_high
-                    )
-                    results.append(result)
+                result = SMCSignalResult(
+                    signal_type=SMCSignal.LIQUIDITY_SWEEP_BULLISH,
+                    strength=85.0,
+                    confidence=80.0,
+                    price=current_price,
+                    entry_zone=(current_price * 0.998, current_price * 1.002),
+                    stop_loss=pool.price_level * 0.995,
+                    take_profit=target,
+                    rationale=[
+                        f"Sell-side liquidity swept at ${pool.price_level:.2f}",
+                        *_SWEEP_BULLISH_RATIONALE_TAIL
+                    ],
+                    liquidity_target=recent_high
+                )
+            results.append(result)
         
         return results
     
-    def _detect_inducements(self, df: pd.DataFrame) -> List[SMCSignalResult]:
+    def _detect_inducements(self, scratch: _Scratch) -> List[SMCSignalResult]:
         """Detect inducement patterns (false breakouts)"""
         results = []
         
-        if len(df) < 5:
+        if len(scratch.last5_c) < 5:
             return results
         
-        recent = df.tail(5)
-        current_price = df['close'].iloc[-1]
+        recent_opens, recent_highs, recent_lows = scratch.last5_o, scratch.last5_h, scratch.last5_l
+        recent_closes, recent_timestamps = scratch.last5_c, scratch.last5_t
+        current_price = scratch.current_price
         
-        # Bullish Inducement: False breakdown below support
-        for i in range(2, len(recent)):
-            candle = recent.iloc[i]
-            prev_candle = recent.iloc[i-1]
-            
-            # Long wick below body with close above
-            body_size = abs(candle['close'] - candle['open'])
-            lower_wick = min(candle['open'], candle['close']) - candle['low']
+        # Candle anatomy for the whole window at once
+        body_sizes = np.abs(recent_closes - recent_opens)
+        lower_wicks = np.minimum(recent_opens, recent_closes) - recent_lows
+        upper_wicks = recent_highs - np.maximum(recent_opens, recent_closes)
+        ranges = recent_highs - recent_lows
+        
+        # Long wick below body with close above / long wick above body with close below
+        bullish = (lower_wicks > body_sizes * 2) & (recent_closes > recent_opens)
+        bearish = (upper_wicks > body_sizes * 2) & (recent_closes < recent_opens)
+        
+        for i in (np.flatnonzero((bullish | bearish)[2:]) + 2).tolist():
+            candle_high, candle_low, candle_close = recent_highs[i], recent_lows[i], recent_closes[i]
             
-            if lower_wick > body_size * 2 and candle['close'] > candle['open']:
-                # Strong bullish rejection
+            if bullish[i]:
+                # Bullish Inducement: False breakdown below support
+                wick_percentage = (lower_wicks[i] / ranges[i]) * 100
                 inducement = InducementPattern(
                     direction='bullish',
-                    inducement_price=candle['low'],
-                    reversal_price=candle['close'],
-                    timestamp=int(candle['timestamp']),
-                    wick_percentage=(lower_wick / (candle['high'] - candle['low'])) * 100,
+                    inducement_price=candle_low,
+                    reversal_price=candle_close,
+                    timestamp=int(recent_timestamps[i]),
+                    wick_percentage=wick_percentage,
                     confirmed=True
                 )
                 self.inducements.append(inducement)
                 
-                recent_high = df['high'].tail(10).max()
+                recent_high = scratch.last10_high
                 
                 result = SMCSignalResult(
                     signal_type=SMCSignal.INDUCEMENT_BULLISH,
                     strength=75.0,
                     confidence=70.0,
                     price=current_price,
-                    entry_zone=(candle['close'] * 0.995, candle['close'] * 1.005),
-                    stop_loss=candle['low'] * 0.998,
+                    entry_zone=(candle_close * 0.995, candle_close * 1.005),
+                    stop_loss=candle_low * 0.998,
                     take_profit=recent_high,
                     rationale=[
                         "Bullish inducement detected - false breakdown",
                         f"Long lower wick: {wick_percentage:.1f}% of candle",
-                        "Retail stops triggered before reversal",
-                        "Institutional accumulation likely"
+                        *_INDUCEMENT_BULLISH_RATIONALE_TAIL
                     ]
                 )
-                results.append(result)
-            
-            # Bearish Inducement: False breakout above resistance
-            upper_wick = candle['high'] - max(candle['open'], candle['close'])
-            
-            if upper_wick > body_size * 2 and candle['close'] < candle['open']:
-                # Strong bearish rejection
+            else:
+                # Bearish Inducement: False breakout above resistance
+                wick_percentage = (upper_wicks[i] / ranges[i]) * 100
                 inducement = InducementPattern(
                     direction='bearish',
-                    inducement_price=candle['high'],
-                    reversal_price=candle['close'],
-                    timestamp=int(candle['timestamp']),
-                    wick_percentage=(upper_wick / (candle['high'] - candle['low'])) * 100,
+                    inducement_price=candle_high,
+                    reversal_price=candle_close,
+                    timestamp=int(recent_timestamps[i]),
+                    wick_percentage=wick_percentage,
                     confirmed=True
                 )
                 self.inducements.append(inducement)
                 
-                recent_low = df['low'].tail(10).min()
+                recent_low = scratch.last10_low
                 
                 result = SMCSignalResult(
                     signal_type=SMCSignal.INDUCEMENT_BEARISH,
                     strength=75.0,
                     confidence=70.0,
                     price=current_price,
-                    entry_zone=(candle['close'] * 0.995, candle['close'] * 1.005),
-                    stop_loss=candle['high'] * 1.002,
+                    entry_zone=(candle_close * 0.995, candle_close * 1.005),
+                    stop_loss=candle_high * 1.002,
                     take_profit=recent_low,
                     rationale=[
                         "Bearish inducement detected - false breakout",
                         f"Long upper wick: {wick_percentage:.1f}% of candle",
-                        "Retail FOMO trapped before reversal",
-                        "Institutional distribution likely"
+                        *_INDUCEMENT_BEARISH_RATIONALE_TAIL
                     ]
                 )
-                results.append(result)
+            results.append(result)
         
         return results
     
-    def _detect_bpr_zones(self, df: pd.DataFrame, current_price: float) -> List[SMCSignalResult]:
+    def _detect_bpr_zones(self, scratch: _Scratch) -> List[SMCSignalResult]:
         """Detect Balanced Price Range zones"""
         results = []
         
-        if len(df) < 10:
-            return results
-        
-        recent = df.tail(10)
-        
         # Look for consolidation zones
-        highs = recent['high'].values
-        lows = recent['low'].values
+        highs = scratch.last10_h
+        lows = scratch.last10_l
+        current_price = scratch.current_price
+        
+        if len(highs) < 10:
+            return results
         
         # Find zone where price oscillates
-        zone_high = np.percentile(highs, 75)
-        zone_low = np.percentile(lows, 25)
+        zone_high = _percentile(highs, 75)
+        zone_low = _percentile(lows, 25)
         
         if zone_high > zone_low * 1.01:  # At least 1% range
             # Check if price is currently within or near this zone
@@ -370,8 +517,8 @@ class SMCStrategies:
                 bpr = BalancedPriceRange(
                     high=zone_high,
                     low=zone_low,
-                    start_timestamp=int(recent.iloc[0]['timestamp']),
-                    end_timestamp=int(recent.iloc[-1]['timestamp']),
+                    start_timestamp=scratch.last10_start_ts,
+                    end_timestamp=scratch.current_ts,
                     equilibrium_price=equilibrium,
                     confirmed=True
                 )
@@ -390,8 +537,7 @@ class SMCStrategies:
                         rationale=[
                             f"Balanced Price Range: ${zone_low:.2f} - ${zone_high:.2f}",
                             f"Equilibrium price: ${equilibrium:.2f}",
-                            "Price consolidation zone identified",
-                            "Expecting breakout above range"
+                            *_BPR_BULLISH_RATIONALE_TAIL
                         ]
                     )
                 else:
@@ -406,18 +552,15 @@ class SMCStrategies:
                         rationale=[
                             f"Balanced Price Range: ${zone_low:.2f} - ${zone_high:.2f}",
                             f"Equilibrium price: ${equilibrium:.2f}",
-                            "Price consolidation zone identified",
-                            "Expecting breakout below range"
+                            *_BPR_BEARISH_RATIONALE_TAIL
                         ]
                     )
                 results.append(result)
         
         return results
     
-    def _update_mitigation_tracking(self, df: pd.DataFrame):
+    def _update_mitigation_tracking(self, current_price: float):
         """Update which zones have been mitigated (filled)"""
-        current_price = df['close'].iloc[-1]
-        
         # Check existing mitigation zones for subsequent rejection
         for zone in self.mitigation_zones:
             if not zone.subsequent_rejection:
@@ -431,7 +574,7 @@ class SMCStrategies:
         results = []
         
         for zone in self.mitigation_zones:
-            if zone.subsequent_rejection and not hasattr(zone, 'signal_generated'):
+            if zone.subsequent_rejection and not zone.signal_generated:
                 zone.signal_generated = True
                 
                 if zone.direction == 'bullish':
@@ -445,9 +588,7 @@ class SMCStrategies:
                         take_profit=current_price + (current_price - zone.zone_low) * 2,
                         rationale=[
                             f"Mitigated {zone.original_type} with rejection",
-                            "Zone filled and rejected - institutional absorption",
-                            "Strong reversal signal from mitigated level",
-                            "Previous support turned resistance now support again"
+                            *_MITIGATION_BULLISH_RATIONALE_TAIL
                         ]
                     )
                 else:
@@ -461,9 +602,7 @@ class SMCStrategies:
                         take_profit=current_price - (zone.zone_high - current_price) * 2,
                         rationale=[
                             f"Mitigated {zone.original_type} with rejection",
-                            "Zone filled and rejected - institutional absorption",
-                            "Strong reversal signal from mitigated level",
-                            "Previous resistance turned support now resistance again"
+                            *_MITIGATION_BEARISH_RATIONALE_TAIL
                         ]
                     )
                 results.append(result)
@@ -488,30 +627,24 @@ class SMCStrategies:
         if not signals:
             return []
         
-        # Sort by combined strength * confidence
-        sorted_signals = sorted(
-            signals,
-            key=lambda x: (x.strength * x.confidence),
-            reverse=True
-        )
-        
-        # Remove duplicates and keep top 3
-        unique_signals = []
-        seen_types = set()
-        
-        for signal in sorted_signals:
-            if signal.signal_type not in seen_types and len(unique_signals) < 3:
-                unique_signals.append(signal)
-                seen_types.add(signal.signal_type)
+        # Best signal per type by strength * confidence; earlier signals win ties
+        best: Dict[SMCSignal, Tuple[float, int, SMCSignalResult]] = {}
+        for i, signal in enumerate(signals):
+            score = signal.strength * signal.confidence
+            current = best.get(signal.signal_type)
+            if current is None or score > current[0]:
+                best[signal.signal_type] = (score, -i, signal)
         
-        return unique_signals
+        # Keep the top 3 without sorting everything
+        top = heapq.nlargest(3, best.values(), key=lambda item: item[:2])
+        return [signal for _, _, signal in top]
     
     def get_liquidity_analysis(self) -> Dict:
         """Get current liquidity analysis"""
         return {
-            'buy_side_pools': [p for p in self.liquidity_pools if p.type == 'buy_side'],
-            'sell_side_pools': [p for p in self.liquidity_pools if p.type == 'sell_side'],
-            'swept_pools': [p for p in self.liquidity_pools if p.swept],
+            'buy_side_pools': list(self._pools_by_type['buy_side']),
+            'sell_side_pools': list(self._pools_by_type['sell_side']),
+            'swept_pools': list(self._swept_pools),
             'recent_inducements': self.inducements[-5:] if self.inducements else [],
             'active_bpr_zones': self.bpr_zones[-3:] if self.bpr_zones else []
         }
@@ -1,6 +1,7 @@
 """Technical indicators calculation module."""
 import numpy as np
-from typing import List, Tuple, Optional
+import pandas as pd
+from typing import List, Tuple, Optional, Union
 from app.models import Candle
 
 
@@ -8,12 +9,12 @@ class Indicators:
     """Technical indicators calculator with incremental updates."""
     
     @staticmethod
-    def sma(prices: List[float], period: int) -> List[float]:
+    def sma(prices: Union[List[float], np.ndarray], period: int) -> List[float]:
         """
         Calculate Simple Moving Average.
         
         Args:
-            prices: List of price values
+            prices: List or numpy array of price values
             period: SMA period
             
         Returns:
@@ -22,20 +23,33 @@ class Indicators:
         if len(prices) < period:
             return [None] * len(prices)
         
-        prices_array = np.array(prices)
-        sma_values = np.convolve(prices_array, np.ones(period)/period, mode='valid')
-        
         # Pad with None for the first (period-1) values
-        result = [None] * (period - 1) + sma_values.tolist()
+        return Indicators._none_padded(Indicators._sma_values(prices, period), period - 1)
+    
+    @staticmethod
+    def _sma_values(prices: Union[List[float], np.ndarray], period: int) -> np.ndarray:
+        """
+        Calculate Simple Moving Average as a float array.
+        
+        Returns:
+            Numpy float array of SMA values (NaN for insufficient data)
+        """
+        result = np.full(len(prices), np.nan)
+        if len(prices) < period:
+            return result
+        
+        # Window sums as differences of a running total: O(N) for any period
+        totals = np.concatenate(([0.0], np.cumsum(prices, dtype=np.float64)))
+        result[period - 1:] = (totals[period:] - totals[:-period]) / period
         return result
     
     @staticmethod
-    def rsi(prices: List[float], period: int = 14) -> List[float]:
+    def rsi(prices: Union[List[float], np.ndarray], period: int = 14) -> List[float]:
         """
         Calculate Relative Strength Index.
         
         Args:
-            prices: List of price values
+            prices: List or numpy array of price values
             period: RSI period (default 14)
             
         Returns:
@@ -44,34 +58,60 @@ class Indicators:
         if len(prices) < period + 1:
             return [None] * len(prices)
         
-        prices_array = np.array(prices)
-        deltas = np.diff(prices_array)
-        
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
+        # Pad with None for insufficient data
+        return Indicators._none_padded(Indicators._rsi_values(prices, period), period)
+    
+    @staticmethod
+    def _rsi_values(prices: Union[List[float], np.ndarray], period: int = 14) -> np.ndarray:
+        """
+        Calculate Relative Strength Index as a float array.
         
-        avg_gain = np.zeros_like(prices_array)
-        avg_loss = np.zeros_like(prices_array)
+        Returns:
+            Numpy float array of RSI values (NaN for insufficient data)
+        """
+        result = np.full(len(prices), np.nan)
+        if len(prices) < period + 1:
+            return result
         
-        # Initial averages
-        avg_gain[period] = np.mean(gains[:period])
-        avg_loss[period] = np.mean(losses[:period])
+        prices_array = np.asarray(prices, dtype=np.float64)
+        deltas = np.diff(prices_array)
         
-        # Smoothed averages (Wilder's smoothing)
-        for i in range(period + 1, len(prices_array)):
-            avg_gain[i] = (avg_gain[i-1] * (period - 1) + gains[i-1]) / period
-            avg_loss[i] = (avg_loss[i-1] * (period - 1) + losses[i-1]) / period
+        # Gains and losses side by side, written straight into one buffer
+        changes = np.zeros((len(deltas), 2))
+        np.copyto(changes[:, 0], deltas, where=deltas > 0)
+        np.negative(deltas, out=changes[:, 1], where=deltas < 0)
         
-        # Calculate RS and RSI
-        rs = np.where(avg_loss != 0, avg_gain / avg_loss, 0)
-        rsi_values = 100 - (100 / (1 + rs))
+        # Smoothed averages from index period on (Wilder's smoothing)
+        averages = Indicators._wilder_smooth(changes, period)
+        avg_gain, avg_loss = averages[:, 0], averages[:, 1]
         
-        # Pad with None for insufficient data
-        result = [None] * period + rsi_values[period:].tolist()
+        # Calculate RS and RSI, reusing the RS buffer for each step
+        rs = np.divide(avg_gain, avg_loss, out=np.zeros_like(avg_gain), where=avg_loss != 0)
+        rs += 1
+        np.divide(100, rs, out=rs)
+        np.subtract(100, rs, out=result[period:])
         return result
     
     @staticmethod
-    def macd(prices: List[float], 
+    def _wilder_smooth(values: np.ndarray, period: int) -> np.ndarray:
+        """
+        Wilder's smoothed average of per-bar changes, for each column of values.
+        
+        Seeded with the mean of the first period values, then
+        avg[i] = (avg[i-1] * (period - 1) + values[period + i - 1]) / period,
+        a first-order filter run by pandas' compiled EWM with alpha = 1/period
+        over all columns in one call.
+        
+        Returns:
+            Numpy float array of len(values) - period + 1 averages per column
+        """
+        seeded = np.empty((len(values) - period + 1, values.shape[1]))
+        seeded[0] = [np.mean(column) for column in values[:period].T]
+        seeded[1:] = values[period:]
+        return pd.DataFrame(seeded).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    
+    @staticmethod
+    def macd(prices: Union[List[float], np.ndarray], 
              fast_period: int = 12, 
              slow_period: int = 26, 
              signal_period: int = 9) -> Tuple[List[float], List[float], List[float]]:
@@ -79,7 +119,7 @@ class Indicators:
         Calculate MACD (Moving Average Convergence Divergence).
         
         Args:
-            prices: List of price values
+            prices: List or numpy array of price values
             fast_period: Fast EMA period (default 12)
             slow_period: Slow EMA period (default 26)
             signal_period: Signal line EMA period (default 9)
@@ -91,11 +131,38 @@ class Indicators:
             none_list = [None] * len(prices)
             return none_list, none_list, none_list
         
-        prices_array = np.array(prices)
+        macd_line, signal_line, histogram = Indicators._macd_values(
+            prices, fast_period, slow_period, signal_period
+        )
+        
+        # Convert to lists with None padding
+        min_period = slow_period + signal_period - 1
+        
+        macd_result = Indicators._none_padded(macd_line, slow_period - 1)
+        signal_result = Indicators._none_padded(signal_line, min_period)
+        histogram_result = Indicators._none_padded(histogram, min_period)
+        
+        return macd_result, signal_result, histogram_result
+    
+    @staticmethod
+    def _macd_values(prices: Union[List[float], np.ndarray],
+                     fast_period: int = 12,
+                     slow_period: int = 26,
+                     signal_period: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate MACD as float arrays.
+        
+        Returns:
+            Tuple of (macd_line, signal_line, histogram) numpy float arrays
+            (NaN for insufficient data)
+        """
+        if len(prices) < slow_period:
+            return tuple(np.full(len(prices), np.nan) for _ in range(3))
+        
+        prices_array = np.asarray(prices, dtype=np.float64)
         
         # Calculate EMAs
-        ema_fast = Indicators._ema(prices_array, fast_period)
-        ema_slow = Indicators._ema(prices_array, slow_period)
+        ema_fast, ema_slow = Indicators._ema_fast_slow(prices_array, fast_period, slow_period)
         
         # MACD line = Fast EMA - Slow EMA
         macd_line = ema_fast - ema_slow
@@ -106,14 +173,13 @@ class Indicators:
         # Histogram = MACD - Signal
         histogram = macd_line - signal_line
         
-        # Convert to lists with None padding
+        # Blank out values before each line has a full window
         min_period = slow_period + signal_period - 1
+        macd_line[:slow_period - 1] = np.nan
+        signal_line[:min_period] = np.nan
+        histogram[:min_period] = np.nan
         
-        macd_result = [None] * (slow_period - 1) + macd_line[slow_period - 1:].tolist()
-        signal_result = [None] * min_period + signal_line[min_period:].tolist()
-        histogram_result = [None] * min_period + histogram[min_period:].tolist()
-        
-        return macd_result, signal_result, histogram_result
+        return macd_line, signal_line, histogram
     
     @staticmethod
     def _ema(data: np.ndarray, period: int) -> np.ndarray:
@@ -125,24 +191,64 @@ class Indicators:
             period: EMA period
             
         Returns:
-            Numpy array of EMA values
+            Numpy float array of EMA values (0 before the first full period)
         """
         alpha = 2 / (period + 1)
-        ema = np.zeros_like(data)
-        ema[period - 1] = np.mean(data[:period])
+        ema = np.zeros(len(data))
         
-        for i in range(period, len(data)):
-            ema[i] = alpha * data[i] + (1 - alpha) * ema[i - 1]
+        # Seed with the SMA of the first period, then run
+        # ema[i] = alpha * data[i] + (1 - alpha) * ema[i - 1] in pandas' compiled
+        # EWM kernel (adjust=False is exactly this recurrence)
+        seeded = np.array(data[period - 1:], dtype=np.float64)
+        seeded[0] = np.mean(data[:period])
+        ema[period - 1:] = pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()
         
         return ema
     
     @staticmethod
-    def calculate_all_indicators(candles: List[Candle]) -> dict:
+    def _ema_fast_slow(data: np.ndarray, fast_period: int,
+                       slow_period: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the fast and slow EMAs of the same series together.
+        
+        Same values as two _ema calls, but both averages are seeded in and
+        written to one shared buffer instead of each allocating and
+        copying its own.
+        
+        Args:
+            data: Numpy float64 array of values
+            fast_period: Fast EMA period
+            slow_period: Slow EMA period
+            
+        Returns:
+            Tuple of (ema_fast, ema_slow) numpy float arrays
+        """
+        emas = np.zeros((2, len(data)))
+        
+        for ema, period in zip(emas, (fast_period, slow_period)):
+            seeded = ema[period - 1:]
+            seeded[:] = data[period - 1:]
+            seeded[0] = np.mean(data[:period])
+            seeded[:] = pd.Series(seeded, copy=False).ewm(alpha=2 / (period + 1), adjust=False).mean().to_numpy()
+        
+        return emas[0], emas[1]
+    
+    @staticmethod
+    def _none_padded(values: np.ndarray, count: int) -> List[Optional[float]]:
+        """Convert an indicator array to a list with None for its first count values."""
+        # Never pad past the input (e.g. a MACD signal line over too few prices)
+        count = min(count, len(values))
+        return [None] * count + values[count:].tolist()
+    
+    @staticmethod
+    def calculate_all_indicators(candles: List[Candle], as_arrays: bool = False) -> dict:
         """
         Calculate all indicators for a list of candles.
         
         Args:
             candles: List of Candle objects
+            as_arrays: Return indicator values as numpy float arrays with NaN
+                for insufficient data, skipping the conversion to lists
             
         Returns:
             Dictionary with indicator values
@@ -151,12 +257,20 @@ class Indicators:
             return {}
         
         closes = [c.c for c in candles]
+        # Converted once and shared; the indicators take arrays as-is
+        closes_array = np.asarray(closes, dtype=np.float64)
         
         # Calculate all indicators
-        sma50 = Indicators.sma(closes, 50)
-        sma200 = Indicators.sma(closes, 200)
-        rsi14 = Indicators.rsi(closes, 14)
-        macd_line, signal_line, histogram = Indicators.macd(closes)
+        if as_arrays:
+            sma50 = Indicators._sma_values(closes_array, 50)
+            sma200 = Indicators._sma_values(closes_array, 200)
+            rsi14 = Indicators._rsi_values(closes_array, 14)
+            macd_line, signal_line, histogram = Indicators._macd_values(closes_array)
+        else:
+            sma50 = Indicators.sma(closes_array, 50)
+            sma200 = Indicators.sma(closes_array, 200)
+            rsi14 = Indicators.rsi(closes_array, 14)
+            macd_line, signal_line, histogram = Indicators.macd(closes_array)
         
         return {
             "sma50": sma50,
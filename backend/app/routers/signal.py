@@ -5,7 +5,7 @@ from typing import Optional, List
 from datetime import datetime
 from app.models import SignalResponse, Interval, Candle, AssetClass, ICTAnalysis, MarketStructure, ICTSignalType, OrderBlock, FairValueGap
 from app.engine import SignalEngine
-from app.engine.kill_zones import KillZoneDetector, KillZoneType
+from app.engine.kill_zones import kill_zone_detector, KillZoneType
 from app.adapters import FinnhubAdapter, AlphaVantageAdapter, DemoAdapter
 from app.config import settings
 from app.utils import CacheManager
@@ -18,9 +18,6 @@ router = APIRouter()
 _cache: Optional[CacheManager] = None
 # Global signal engine instance with ICT strategies
 _signal_engine: Optional[SignalEngine] = None
-# Initialize kill zone detector
-_kill_zone_detector = KillZoneDetector()
-
 
 def set_cache(cache: CacheManager):
     """Set the global cache instance."""
@@ -250,19 +247,19 @@ async def get_kill_zone_status():
     """
     try:
         current_timestamp = int(datetime.utcnow().timestamp())
-        kill_zone_info = _kill_zone_detector.get_current_kill_zone(current_timestamp)
+        kill_zone_info = kill_zone_detector.get_current_kill_zone(current_timestamp)
         
         # Get recommended timeframes
-        recommended_timeframes = _kill_zone_detector.get_recommended_timeframes(
+        recommended_timeframes = kill_zone_detector.get_recommended_timeframes(
             kill_zone_info.zone_type
         )
         
         # Get bias information
-        bias_info = _kill_zone_detector.get_kill_zone_bias(kill_zone_info.zone_type)
+        bias_info = kill_zone_detector.get_kill_zone_bias(kill_zone_info.zone_type)
         
         return {
             "zone_type": kill_zone_info.zone_type.value,
-            "zone_name": kill_zone_info.zone_type.value.replace("_", " ").title(),
+            "zone_name": kill_zone_detector.get_zone_title(kill_zone_info.zone_type),
             "is_active": kill_zone_info.is_active,
             "time_until_next": kill_zone_info.time_until_next,
             "time_remaining": kill_zone_info.time_remaining,
@@ -296,9 +293,9 @@ async def get_all_kill_zones():
         
         for zone_type in KillZoneType:
             if zone_type != KillZoneType.OFF_HOURS:
-                bias = _kill_zone_detector.get_kill_zone_bias(zone_type)
+                bias = kill_zone_detector.get_kill_zone_bias(zone_type)
                 zones[zone_type.value] = {
-                    "name": zone_type.value.replace("_", " ").title(),
+                    "name": kill_zone_detector.get_zone_title(zone_type),
                     "time_window": {
                         "london_kill_zone": "3:00 AM - 5:00 AM EST",
                         "ny_kill_zone": "9:30 AM - 11:30 AM EST",
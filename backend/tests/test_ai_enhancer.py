@@ -0,0 +1,95 @@
+"""Unit tests for the AI signal enhancer."""
+from collections import namedtuple
+
+import numpy as np
+import pytest
+from app.engine.ai_enhancer import AIEnhancer
+from app.models import Candle
+
+
+# Confluence only reads a signal's direction
+DirectedSignal = namedtuple('DirectedSignal', 'direction')
+
+
+def make_candles(count, drift, noise, burst=None, seed=0):
+    """Random-walk candles with per-bar drift and noise in percent (burst noise over the last 10 bars)."""
+    rng = np.random.default_rng(seed)
+    noise = np.full(count, noise / 100)
+    if burst is not None:
+        noise[-10:] = burst / 100
+    closes = 100 * np.exp(np.cumsum(rng.normal(drift / 100, noise)))
+    opens = np.concatenate(([100.0], closes[:-1]))
+    spread = rng.random(count) * noise
+    return [
+        Candle(t=1_700_000_000 + i * 3600, o=float(o), h=float(max(o, c) * (1 + s)),
+               l=float(min(o, c) * (1 - s)), c=float(c), v=float(v))
+        for i, (o, c, s, v) in enumerate(zip(opens, closes, spread, rng.integers(100, 5000, count)))
+    ]
+
+
+def columns(candles):
+    """(opens, highs, lows, closes, volumes, timestamps) built by the caller."""
+    return (
+        np.array([c.o for c in candles]),
+        np.array([c.h for c in candles]),
+        np.array([c.l for c in candles]),
+        np.array([c.c for c in candles]),
+        np.array([c.v for c in candles]),
+        np.array([c.t for c in candles], dtype=np.int64),
+    )
+
+
+MARKETS = {
+    'uptrend': (0.4, 0.5, None),
+    'downtrend': (-0.4, 0.5, None),
+    'ranging': (0.0, 0.3, None),
+    'volatile': (0.0, 0.5, 5.0),
+}
+
+SIGNALS = [
+    (None, None),
+    ([DirectedSignal(1)], [DirectedSignal(1)]),
+    ([DirectedSignal(-1), DirectedSignal(-1)], [DirectedSignal(-1)]),
+    ([DirectedSignal(1)], [DirectedSignal(-1)]),
+]
+
+
+class TestEnhanceSignalArrays:
+    """enhance_signal_arrays against enhance_signal."""
+
+    @pytest.mark.parametrize("market", list(MARKETS))
+    @pytest.mark.parametrize("pattern_type", ['fvg_bullish', 'bos_bearish', 'liquidity_sweep_bullish'])
+    def test_matches_enhance_signal(self, market, pattern_type):
+        """Column arrays give the same score as the candles they came from."""
+        candles = make_candles(120, *MARKETS[market])
+        for ict_signals, smc_signals in SIGNALS:
+            kwargs = dict(
+                pattern_type=pattern_type, base_strength=72.0, base_confidence=65.0,
+                symbol='EURUSD', timeframe='1h', ict_signals=ict_signals, smc_signals=smc_signals
+            )
+            expected = AIEnhancer().enhance_signal(candles, **kwargs)
+            actual = AIEnhancer().enhance_signal_arrays(*columns(candles), **kwargs)
+            assert actual == expected
+
+    def test_matches_with_pattern_history(self):
+        """Recorded pattern performance is applied the same way by both entry points."""
+        candles = make_candles(80, 0.2, 1.0, seed=3)
+        enhancer = AIEnhancer()
+        for success in (True, True, False, True):
+            enhancer.update_pattern_performance('fvg_bullish', 'EURUSD', '1h', success, 1.5)
+        kwargs = dict(pattern_type='fvg_bullish', base_strength=60.0, base_confidence=70.0,
+                      symbol='EURUSD', timeframe='1h')
+        assert enhancer.enhance_signal_arrays(*columns(candles), **kwargs) == enhancer.enhance_signal(candles, **kwargs)
+
+    def test_structured_array_input(self):
+        """enhance_signal on a structured t/o/h/l/c/v array matches the array entry point."""
+        candles = make_candles(100, -0.1, 1.5, seed=5)
+        records = np.array(
+            [(c.t, c.o, c.h, c.l, c.c, c.v) for c in candles],
+            dtype=[('t', np.int64), ('o', np.float64), ('h', np.float64),
+                   ('l', np.float64), ('c', np.float64), ('v', np.float64)]
+        )
+        kwargs = dict(pattern_type='bos_bullish', base_strength=55.0, base_confidence=60.0)
+        assert AIEnhancer().enhance_signal(records, **kwargs) == \
+            AIEnhancer().enhance_signal_arrays(*columns(candles), **kwargs)
+
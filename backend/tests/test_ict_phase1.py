@@ -0,0 +1,196 @@
+"""Unit tests for ICT Phase 1 enhancements."""
+import numpy as np
+from app.engine.ict_phase1_enhancements import (
+    ICTPhase1Enhancements,
+    PHASE1_KILL_ZONE,
+    PHASE1_LIQUIDITY_SWEEP,
+    PHASE1_PD_ARRAY,
+)
+from app.models import Candle
+
+
+def make_candles(count, start=1_700_000_000, step=3600):
+    """Oscillating candles between roughly 95 and 105."""
+    candles = []
+    for i in range(count):
+        base = 100 + 5 * ((i % 10) - 5) / 5
+        candles.append(
+            Candle(t=start + i * step, o=base, h=base + 1, l=base - 1, c=base + 0.5, v=1000 + i)
+        )
+    return candles
+
+
+def random_walk(count, seed=3, start=1_700_000_000, step=900):
+    """Random-walk candles with wicks that often reach the WALK_POOLS levels."""
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 0.6, count))
+    opens = np.concatenate(([100.0], closes[:-1])) + rng.normal(0, 0.2, count)
+    highs = np.maximum(opens, closes) + rng.random(count)
+    lows = np.minimum(opens, closes) - rng.random(count)
+    volumes = rng.integers(500, 1500, count)
+    return [
+        Candle(t=start + i * step, o=float(o), h=float(h), l=float(l), c=float(c), v=float(v))
+        for i, (o, h, l, c, v) in enumerate(zip(opens, highs, lows, closes, volumes))
+    ]
+
+
+POOLS = {'buy_side': {'high': 107.0}, 'sell_side': {'low': 93.0}}
+WALK_POOLS = {'buy_side': {'h1': 100.5, 'h2': 102.0}, 'sell_side': {'l1': 99.5, 'l2': 98.0}}
+
+
+def sweep_tuples(sweeps):
+    """Comparable form of a list of LiquiditySweep."""
+    return [
+        (s.sweep_type, s.pool_level, s.sweep_timestamp, s.strength, s.reversal_candle_index)
+        for s in sweeps
+    ]
+
+
+def pd_tuple(info):
+    """Comparable form of a PDArrayInfo."""
+    return (info.current_location, info.alignment_score, info.range_size,
+            info.optimal_entry, info.is_in_ote)
+
+
+class TestFormingBarUpdates:
+    """A forming bar updated in place must not be served from stale caches."""
+
+    def test_sweeps_see_updated_last_bar(self):
+        """Raising the last bar's high through a pool is detected on reuse."""
+        candles = make_candles(60)
+        enhancer = ICTPhase1Enhancements()
+        assert enhancer.detect_liquidity_sweeps(candles, POOLS) == []
+
+        last = candles[-1]
+        candles[-1] = last.model_copy(update={'h': 110.0, 'c': last.o - 0.5})
+
+        reused = enhancer.detect_liquidity_sweeps(candles, POOLS)
+        fresh = ICTPhase1Enhancements().detect_liquidity_sweeps(candles, POOLS)
+        assert len(fresh) == 1
+        assert sweep_tuples(reused) == sweep_tuples(fresh)
+
+    def test_pd_arrays_see_updated_last_bar(self):
+        """PD arrays follow an in-place change to the last bar's range and close."""
+        candles = make_candles(60)
+        enhancer = ICTPhase1Enhancements()
+        enhancer.detect_liquidity_sweeps(candles, POOLS)
+        before = enhancer.calculate_pd_arrays(candles)
+
+        candles[-1].h = 120.0
+        candles[-1].c = 96.0
+
+        reused = enhancer.calculate_pd_arrays(candles)
+        fresh = ICTPhase1Enhancements().calculate_pd_arrays(candles)
+        assert pd_tuple(reused) == pd_tuple(fresh)
+        assert pd_tuple(reused) != pd_tuple(before)
+
+
+class TestIncrementalSweepScan:
+    """Reused instances give the same sweeps as fresh ones as the candles change."""
+
+    LOOKBACK = 30
+
+    def assert_matches_fresh(self, enhancer, candles, pools=WALK_POOLS):
+        """Sweeps from the reused instance equal a fresh instance's, returning them."""
+        reused = enhancer.detect_liquidity_sweeps(candles, pools, self.LOOKBACK)
+        fresh = ICTPhase1Enhancements().detect_liquidity_sweeps(candles, pools, self.LOOKBACK)
+        assert sweep_tuples(reused) == sweep_tuples(fresh)
+        return reused
+
+    def test_append_one_at_a_time(self):
+        """Streaming one new candle per call matches a full rescan."""
+        series = random_walk(200)
+        enhancer = ICTPhase1Enhancements()
+        found = 0
+        for end in range(self.LOOKBACK, len(series) + 1):
+            found += len(self.assert_matches_fresh(enhancer, series[:end]))
+        assert found > 0
+
+    def test_append_several_at_a_time(self):
+        """Windows advancing by several candles, including past the whole window, match."""
+        series = random_walk(300, seed=5)
+        enhancer = ICTPhase1Enhancements()
+        end = self.LOOKBACK
+        for advance in [1, 3, 7, 29, 30, 31, 45, 2, 0, 5] * 3:
+            end = min(end + advance, len(series))
+            self.assert_matches_fresh(enhancer, series[:end])
+
+    def test_replace_last_bar(self):
+        """A forming bar replaced with new values is rescanned."""
+        series = random_walk(120, seed=11)
+        enhancer = ICTPhase1Enhancements()
+        candles = series[:80]
+        self.assert_matches_fresh(enhancer, candles)
+        for high, close in [(103.0, 97.0), (99.0, 101.0), (104.0, 90.0)]:
+            candles = candles[:-1] + [candles[-1].model_copy(update={'h': high, 'l': 89.0, 'c': close})]
+            self.assert_matches_fresh(enhancer, candles)
+            candles[-1].o = close + 1.0
+            self.assert_matches_fresh(enhancer, candles)
+
+    def test_switch_between_series(self):
+        """Alternating between unrelated candle lists does not reuse the other's hits."""
+        first, second = random_walk(150, seed=1), random_walk(150, seed=2)
+        enhancer = ICTPhase1Enhancements()
+        for end in range(self.LOOKBACK, 150, 7):
+            self.assert_matches_fresh(enhancer, first[:end])
+            self.assert_matches_fresh(enhancer, second[:end])
+            # Same candles again after the other list
+            self.assert_matches_fresh(enhancer, first[:end])
+
+    def test_pools_change(self):
+        """New pool levels force a full rescan."""
+        series = random_walk(100, seed=4)
+        other_pools = {'buy_side': {'h': 101.0}, 'sell_side': {}}
+        enhancer = ICTPhase1Enhancements()
+        for end in range(self.LOOKBACK, 100, 3):
+            self.assert_matches_fresh(enhancer, series[:end])
+            self.assert_matches_fresh(enhancer, series[:end], other_pools)
+
+    def test_lookback_change(self):
+        """A longer lookback over the same candles scans the candles the last call skipped."""
+        series = random_walk(200, seed=6)
+        enhancer = ICTPhase1Enhancements()
+        for end in range(60, 200, 11):
+            for lookback in (20, 50, 30):
+                reused = enhancer.detect_liquidity_sweeps(series[:end], WALK_POOLS, lookback)
+                fresh = ICTPhase1Enhancements().detect_liquidity_sweeps(series[:end], WALK_POOLS, lookback)
+                assert sweep_tuples(reused) == sweep_tuples(fresh)
+
+
+class TestEnhancementBatch:
+    """calculate_phase1_enhancement_batch against the per-signal calculation."""
+
+    RECOMMENDATIONS = ['buy', 'SELL', 'neutral', 'Buy', 'hold', 'sell']
+
+    def test_batch_matches_single(self):
+        """Bonuses match and flags match the rationale of calculate_phase1_enhancement."""
+        series = random_walk(400, seed=9)
+        enhancer = ICTPhase1Enhancements()
+        strengths = np.linspace(40.0, 90.0, len(self.RECOMMENDATIONS))
+        seen_flags = 0
+        for end in range(60, len(series) + 1, 13):
+            candles = series[:end]
+            bonuses, flags = enhancer.calculate_phase1_enhancement_batch(
+                candles, WALK_POOLS, strengths, self.RECOMMENDATIONS
+            )
+            for rec, strength, bonus, flag in zip(self.RECOMMENDATIONS, strengths, bonuses, flags):
+                expected_bonus, rationale = ICTPhase1Enhancements().calculate_phase1_enhancement(
+                    candles, WALK_POOLS, strength, rec
+                )
+                assert bonus == expected_bonus
+                prefixes = [part.split(':')[0] for part in rationale]
+                assert bool(flag & PHASE1_KILL_ZONE) == ('Kill Zone' in prefixes)
+                assert bool(flag & PHASE1_PD_ARRAY) == ('PD Array' in prefixes)
+                assert bool(flag & PHASE1_LIQUIDITY_SWEEP) == ('Liquidity Sweep' in prefixes)
+                seen_flags |= int(flag)
+        assert seen_flags == PHASE1_KILL_ZONE | PHASE1_PD_ARRAY | PHASE1_LIQUIDITY_SWEEP
+
+    def test_batch_empty(self):
+        """No signals or no candles give empty or zero results."""
+        enhancer = ICTPhase1Enhancements()
+        bonuses, flags = enhancer.calculate_phase1_enhancement_batch(
+            random_walk(50), WALK_POOLS, np.empty(0), []
+        )
+        assert len(bonuses) == 0 and len(flags) == 0
+        bonuses, flags = enhancer.calculate_phase1_enhancement_batch([], WALK_POOLS, np.ones(3), ['buy'] * 3)
+        assert bonuses.tolist() == [0.0] * 3 and flags.tolist() == [0] * 3
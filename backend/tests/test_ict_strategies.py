@@ -0,0 +1,150 @@
+"""Unit tests for ICT strategies."""
+import numpy as np
+from app.engine.ict_strategies import (
+    ICTSignal,
+    ICTStrategies,
+    _ColumnStore,
+    _MAX_TRACKED_ZONES,
+    _candles_to_arrays,
+)
+from app.models import Candle
+
+
+def volatile_walk(count, seed=0, start=1_700_000_000, step=3600):
+    """Candles from a geometric random walk with frequent 2% moves and gaps."""
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, count)))
+    opens = np.concatenate(([100.0], closes[:-1]))
+    highs = np.maximum(opens, closes) * (1 + rng.random(count) * 0.005)
+    lows = np.minimum(opens, closes) * (1 - rng.random(count) * 0.005)
+    return [
+        Candle(t=start + i * step, o=float(o), h=float(h), l=float(l), c=float(c), v=1000.0)
+        for i, (o, h, l, c) in enumerate(zip(opens, highs, lows, closes))
+    ]
+
+
+def expected_zones(candles, first_block_index):
+    """Order block and FVG timestamps a full-series scan would keep, oldest first."""
+    _, _, highs, lows, closes, _ = _candles_to_arrays(candles)
+    timestamps = np.array([c.t for c in candles])
+    prev = closes[:-1]
+    strong_bearish = closes[1:] < prev * 0.98
+    strong = np.flatnonzero(strong_bearish | (closes[1:] > prev * 1.02)) + 1
+    fvg_bullish = lows[2:] > lows[:-2] * 1.001
+    fvg = np.flatnonzero(fvg_bullish | (highs[2:] < highs[:-2] * 0.999)) + 2
+    blocks = timestamps[strong[strong >= first_block_index]]
+    return blocks[-_MAX_TRACKED_ZONES:].tolist(), timestamps[fvg][-_MAX_TRACKED_ZONES:].tolist()
+
+
+def assert_extrema_consistent(strategies):
+    """The running order block extrema equal the extrema of the retained blocks."""
+    bullish = strategies._order_blocks.column('bullish')
+    bearish_highs = strategies._order_blocks.column('high')[~bullish]
+    bullish_lows = strategies._order_blocks.column('low')[bullish]
+    assert strategies._max_bearish_block_high == (bearish_highs.max() if bearish_highs.size else float('-inf'))
+    assert strategies._min_bullish_block_low == (bullish_lows.min() if bullish_lows.size else float('inf'))
+
+
+class TestStreamingScan:
+    """Replaying overlapping windows stores each order block and FVG once."""
+
+    WINDOW = 60
+
+    def replay(self, candles, advances):
+        """Analyze sliding windows of the series, checking invariants after each call."""
+        strategies = ICTStrategies()
+        end = self.WINDOW
+        for advance in advances:
+            end = min(end + advance, len(candles))
+            strategies.analyze_candles(candles[end - self.WINDOW:end])
+
+            block_timestamps = strategies._order_blocks.column('timestamp')
+            gap_ends = strategies._fair_value_gaps.column('end_timestamp')
+            assert len(np.unique(block_timestamps)) == len(block_timestamps)
+            assert len(np.unique(gap_ends)) == len(gap_ends)
+            assert np.all(np.diff(block_timestamps) > 0)
+            assert np.all(np.diff(gap_ends) > 0)
+            assert_extrema_consistent(strategies)
+        return strategies, end
+
+    def test_overlapping_windows(self):
+        """Windows advancing by 0-19 candles store the zones of a full scan, evicting the oldest."""
+        candles = volatile_walk(3000, seed=1)
+        rng = np.random.default_rng(2)
+        advances = rng.integers(0, 20, 400).tolist()
+        strategies, end = self.replay(candles, advances)
+
+        # The first window's order blocks come from its last 20 candles only
+        blocks, gaps = expected_zones(candles[:end], self.WINDOW - 19)
+        assert len(blocks) == _MAX_TRACKED_ZONES
+        assert len(gaps) == _MAX_TRACKED_ZONES
+        assert strategies._order_blocks.column('timestamp').tolist() == blocks
+        assert strategies._fair_value_gaps.column('end_timestamp').tolist() == gaps
+
+    def test_same_window_twice_adds_nothing(self):
+        """Re-analyzing an unchanged window stores no new zones."""
+        candles = volatile_walk(200, seed=3)
+        strategies = ICTStrategies()
+        strategies.analyze_candles(candles[-self.WINDOW:])
+        counts = (len(strategies.order_blocks), len(strategies.fair_value_gaps))
+        strategies.analyze_candles(candles[-self.WINDOW:])
+        assert (len(strategies.order_blocks), len(strategies.fair_value_gaps)) == counts
+
+    def test_first_unscanned_index(self):
+        """The index after the last scanned candle, or 0 for an unrelated series."""
+        candles = volatile_walk(80, seed=5)
+        timestamps, _, highs, lows, closes, _ = _candles_to_arrays(candles)
+        strategies = ICTStrategies()
+        assert strategies._first_unscanned_index(timestamps[:60], highs[:60], lows[:60], closes[:60]) == 0
+        assert strategies._first_unscanned_index(timestamps[5:70], highs[5:70], lows[5:70], closes[5:70]) == 55
+        assert strategies._first_unscanned_index(timestamps[5:70], highs[5:70], lows[5:70], closes[5:70]) == 65
+        other = volatile_walk(80, seed=6, start=1_800_000_000)
+        other_timestamps, _, other_highs, other_lows, other_closes, _ = _candles_to_arrays(other)
+        assert strategies._first_unscanned_index(other_timestamps, other_highs, other_lows, other_closes) == 0
+
+
+class TestColumnStore:
+    """_ColumnStore keeps the most recent rows and reports evictions."""
+
+    def test_extend_and_evict(self):
+        """Rows past maxlen are evicted oldest first, including oversized batches."""
+        store = _ColumnStore({'x': (np.int64, 0), 'flag': (np.bool_, True)}, maxlen=5)
+        appended = []
+        evicted = []
+        for size in [3, 1, 4, 0, 7, 2, 12, 5]:
+            values = np.arange(len(appended), len(appended) + size, dtype=np.int64)
+            if size:
+                evicted.extend(store.extend(x=values)['x'].tolist())
+            appended.extend(values.tolist())
+            assert store.column('x').tolist() == appended[-5:]
+            assert evicted == appended[:max(len(appended) - 5, 0)]
+            # Columns not passed to extend get their fill value
+            assert store.column('flag').all()
+
+
+class TestAnalyzeArrays:
+    """analyze_arrays against analyze_candles."""
+
+    def test_matches_analyze_candles(self):
+        """Pre-packed columns give the same signals and stored zones as candles."""
+        candles = volatile_walk(400, seed=7)
+        from_candles, from_arrays = ICTStrategies(), ICTStrategies()
+        for end in range(60, 400, 9):
+            window = candles[end - 60:end]
+            expected = from_candles.analyze_candles(window)
+            actual = from_arrays.analyze_arrays(*_candles_to_arrays(window))
+            assert actual == expected
+        assert list(from_arrays.order_blocks) == list(from_candles.order_blocks)
+        assert list(from_arrays.fair_value_gaps) == list(from_candles.fair_value_gaps)
+
+    def test_float32_columns_store_float64(self):
+        """float32 price columns still store float64 zones."""
+        candles = volatile_walk(120, seed=8)
+        strategies = ICTStrategies()
+        signals = strategies.analyze_arrays(*_candles_to_arrays(candles, dtype=np.float32))
+        assert strategies._fair_value_gaps.column('high').dtype == np.float64
+        assert all(isinstance(signal.signal_type, ICTSignal) for signal in signals)
+
+    def test_too_few_candles(self):
+        """Fewer than 50 candles give no signals."""
+        assert ICTStrategies().analyze_arrays(*_candles_to_arrays(volatile_walk(49))) == []
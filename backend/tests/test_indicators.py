@@ -223,6 +223,70 @@ class TestCalculateAllIndicators:
         assert result["close_prices"] == [c.c for c in candles]
 
 
+class TestArrayIndicators:
+    """Array path of calculate_all_indicators against the list API."""
+
+    LENGTHS = [1, 2, 13, 14, 15, 25, 26, 33, 34, 35, 49, 50, 51, 199, 200, 201, 260]
+
+    @staticmethod
+    def assert_nan_matches_none(array, values):
+        """NaN exactly where the list has None, and equal values elsewhere."""
+        assert isinstance(array, np.ndarray)
+        assert len(array) == len(values)
+        missing = [v is None for v in values]
+        assert np.isnan(array).tolist() == missing
+        present = [v for v in values if v is not None]
+        assert array[~np.isnan(array)].tolist() == pytest.approx(present)
+
+    @pytest.mark.parametrize("length", LENGTHS)
+    def test_nan_placement_matches_none(self, length):
+        """Each indicator array is NaN exactly where the list API pads with None."""
+        rng = np.random.default_rng(length)
+        closes = 100 + np.cumsum(rng.normal(0, 1, length))
+        candles = [
+            Candle(t=i * 60, o=float(c), h=float(c) + 1, l=float(c) - 1, c=float(c), v=1000)
+            for i, c in enumerate(closes)
+        ]
+
+        lists = Indicators.calculate_all_indicators(candles)
+        arrays = Indicators.calculate_all_indicators(candles, as_arrays=True)
+
+        assert set(arrays) == set(lists)
+        assert arrays["close_prices"] == lists["close_prices"]
+        for key in ("sma50", "sma200", "rsi", "macd_line", "macd_signal", "macd_histogram"):
+            self.assert_nan_matches_none(arrays[key], lists[key])
+
+    @pytest.mark.parametrize("period", [1, 3, 14, 50])
+    def test_value_helpers_match_list_api(self, period):
+        """_sma_values, _rsi_values and _macd_values match sma, rsi and macd."""
+        prices = [float(p) for p in (50 + np.cumsum(np.random.default_rng(period).normal(0, 1, 80)))]
+        for length in (0, period - 1, period, period + 1, 80):
+            window = prices[:max(length, 0)]
+            self.assert_nan_matches_none(Indicators._sma_values(window, period), Indicators.sma(window, period))
+            self.assert_nan_matches_none(Indicators._rsi_values(window, period), Indicators.rsi(window, period))
+            for array, values in zip(Indicators._macd_values(window), Indicators.macd(window)):
+                self.assert_nan_matches_none(array, values)
+
+    def test_flat_prices(self):
+        """Flat prices give the same gaps in both forms."""
+        prices = [100.0] * 60
+        self.assert_nan_matches_none(Indicators._rsi_values(prices, 14), Indicators.rsi(prices, 14))
+        for array, values in zip(Indicators._macd_values(prices), Indicators.macd(prices)):
+            self.assert_nan_matches_none(array, values)
+
+    def test_not_ready_before_warmup(self):
+        """The last SMA200 value is NaN below 200 candles and a number from 200 on."""
+        for length, ready in ((199, False), (200, True)):
+            candles = [
+                Candle(t=i * 60, o=100.0 + i, h=101.0 + i, l=99.0 + i, c=100.0 + i, v=1000)
+                for i in range(length)
+            ]
+            arrays = Indicators.calculate_all_indicators(candles, as_arrays=True)
+            assert (not np.isnan(arrays["sma200"][-1])) == ready
+            assert not np.isnan(arrays["rsi"][-1])
+            assert not np.isnan(arrays["macd_signal"][-1])
+
+
 class TestIndicatorInvariants:
     """Test mathematical invariants and properties of indicators."""
 
@@ -0,0 +1,166 @@
+"""Unit tests for kill zone detection."""
+from collections import Counter
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.engine.kill_zones import KillZoneDetector, KillZoneType
+from app.models import Candle
+
+
+NY = ZoneInfo("America/New_York")
+ZONE_TYPES = tuple(KillZoneType)
+
+# 2024-03-10 02:00 EST -> EDT and 2024-11-03 02:00 EDT -> EST, in UTC
+SPRING_FORWARD = 1_710_054_000
+FALL_BACK = 1_730_613_600
+
+
+def ny(year, month, day, hour, minute=0, second=0):
+    """Unix timestamp of a New York wall-clock time."""
+    return int(datetime(year, month, day, hour, minute, second, tzinfo=NY).timestamp())
+
+
+def around(transition, days=2, step=60):
+    """Timestamps every step seconds for days either side of a transition, with some one-second neighbours."""
+    timestamps = np.arange(transition - days * 86400, transition + days * 86400, step, dtype=np.int64)
+    return np.concatenate((timestamps, timestamps[::5] + 1, timestamps[::5] - 1))
+
+
+def reference_ids(detector, timestamps):
+    """Zone ids from the per-timestamp get_current_kill_zone."""
+    return np.array(
+        [ZONE_TYPES.index(detector.get_current_kill_zone(int(t)).zone_type) for t in timestamps.tolist()]
+    )
+
+
+def local_sod(timestamp):
+    """New York second-of-day of a Unix timestamp."""
+    local = datetime.fromtimestamp(timestamp, NY)
+    return local.hour * 3600 + local.minute * 60 + local.second
+
+
+def make_candles(timestamps):
+    """Flat candles at the given timestamps."""
+    return [Candle(t=int(t), o=1.0, h=1.0, l=1.0, c=1.0, v=1.0) for t in timestamps.tolist()]
+
+
+@pytest.mark.parametrize("transition", [SPRING_FORWARD, FALL_BACK], ids=["march", "november"])
+class TestBatchClassificationAcrossDst:
+    """Batch APIs agree with get_current_kill_zone around DST transitions."""
+
+    def test_classify_batch_without_window(self, transition):
+        """classify_batch without a prepared window matches the scalar lookup."""
+        detector = KillZoneDetector()
+        timestamps = around(transition)
+        assert np.array_equal(detector.classify_batch(timestamps), reference_ids(detector, timestamps))
+
+    def test_prepared_window(self, transition):
+        """The DST-folded UTC run table matches the scalar lookup."""
+        detector = KillZoneDetector()
+        timestamps = around(transition)
+        detector.prepare_window(int(timestamps.min()), int(timestamps.max()))
+        assert np.array_equal(detector.classify_batch(timestamps), reference_ids(detector, timestamps))
+
+    def test_get_zone_id(self, transition):
+        """get_zone_id matches the zone of get_current_kill_zone."""
+        detector = KillZoneDetector()
+        timestamps = around(transition, step=600)
+        ids = np.array([detector.get_zone_id(t) for t in timestamps.tolist()])
+        assert np.array_equal(ids, reference_ids(detector, timestamps))
+
+    def test_classify_dataframe(self, transition):
+        """classify(df) adds the same zone ids and the New York second-of-day."""
+        detector = KillZoneDetector()
+        timestamps = around(transition)
+        result = detector.classify(pd.DataFrame({'t': timestamps}))
+        assert np.array_equal(result['zone'].to_numpy(), reference_ids(detector, timestamps))
+        expected_sod = [local_sod(t) for t in timestamps.tolist()]
+        assert result['sod_est'].tolist() == expected_sod
+
+    def test_iter_zones_and_aggregate(self, transition):
+        """iter_zones keeps input order and aggregate_by_zone counts every candle once."""
+        detector = KillZoneDetector()
+        timestamps = around(transition, step=300)
+        candles = make_candles(timestamps)
+        expected = [ZONE_TYPES[i] for i in reference_ids(detector, timestamps).tolist()]
+
+        pairs = list(detector.iter_zones(iter(candles)))
+        assert [zone for zone, _ in pairs] == expected
+        assert [candle for _, candle in pairs] == candles
+
+        counts = detector.aggregate_by_zone(candles, int, lambda acc, _: acc + 1)
+        assert set(counts) == set(KillZoneType)
+        assert counts == {zone: Counter(expected)[zone] for zone in KillZoneType}
+
+
+class TestPreparedWindow:
+    """prepare_window over longer ranges and outside its range."""
+
+    def test_window_spanning_both_transitions(self):
+        """A window covering a whole DST season matches the scalar lookup."""
+        detector = KillZoneDetector()
+        timestamps = np.arange(SPRING_FORWARD - 20 * 86400, FALL_BACK + 20 * 86400, 997, dtype=np.int64)
+        detector.prepare_window(int(timestamps[0]), int(timestamps[-1]))
+        assert np.array_equal(detector.classify_batch(timestamps), reference_ids(detector, timestamps))
+
+    def test_timestamps_outside_window(self):
+        """Timestamps outside the prepared window fall back to the direct lookup."""
+        detector = KillZoneDetector()
+        detector.prepare_window(SPRING_FORWARD - 86400, SPRING_FORWARD + 86400)
+        timestamps = around(FALL_BACK, days=1, step=900)
+        assert np.array_equal(detector.classify_batch(timestamps), reference_ids(detector, timestamps))
+
+
+class TestWindowEdges:
+    """Kill zone windows include their end second."""
+
+    @pytest.mark.parametrize("wall_clock, zone", [
+        ((3, 0, 0), KillZoneType.LONDON_KILL_ZONE),
+        ((5, 0, 0), KillZoneType.LONDON_KILL_ZONE),
+        ((5, 0, 1), KillZoneType.OFF_HOURS),
+        ((11, 0, 0), KillZoneType.NY_KILL_ZONE),
+        ((11, 30, 0), KillZoneType.NY_KILL_ZONE),
+        ((11, 30, 1), KillZoneType.LONDON_CLOSE),
+        ((20, 0, 0), KillZoneType.ASIAN_SESSION),
+        ((0, 0, 0), KillZoneType.ASIAN_SESSION),
+        ((0, 0, 1), KillZoneType.OFF_HOURS),
+    ])
+    @pytest.mark.parametrize("date", [(2024, 1, 16), (2024, 7, 16)], ids=["winter", "summer"])
+    def test_edges(self, date, wall_clock, zone):
+        """Scalar, batch, prepared-window and DataFrame lookups agree at the edges."""
+        detector = KillZoneDetector()
+        timestamp = ny(*date, *wall_clock)
+        timestamps = np.array([timestamp], dtype=np.int64)
+        zone_id = ZONE_TYPES.index(zone)
+
+        assert detector.get_current_kill_zone(timestamp).zone_type == zone
+        assert detector.get_zone_id(timestamp) == zone_id
+        assert detector.classify_batch(timestamps).tolist() == [zone_id]
+        assert detector.classify(pd.DataFrame({'t': timestamps}))['zone'].tolist() == [zone_id]
+        detector.prepare_window(timestamp - 3600, timestamp + 3600)
+        assert detector.classify_batch(timestamps).tolist() == [zone_id]
+
+
+class TestNewYorkLocalTime:
+    """Zones follow New York local time, including EDT in summer."""
+
+    def test_summer_zones_follow_edt(self):
+        """London opens at 03:00 EDT (07:00 UTC) and has closed by 05:30 EDT."""
+        detector = KillZoneDetector()
+        london_open = ny(2024, 7, 16, 3)
+        assert london_open == 1_721_113_200
+        assert detector.get_current_kill_zone(london_open).zone_type == KillZoneType.LONDON_KILL_ZONE
+        assert detector.get_current_kill_zone(london_open - 60).zone_type == KillZoneType.OFF_HOURS
+        # 04:30 under a fixed UTC-5 offset, which would still be London
+        assert detector.get_current_kill_zone(ny(2024, 7, 16, 5, 30)).zone_type == KillZoneType.OFF_HOURS
+
+    def test_winter_zones_follow_est(self):
+        """London opens at 03:00 EST (08:00 UTC)."""
+        detector = KillZoneDetector()
+        london_open = ny(2024, 1, 16, 3)
+        assert london_open == 1_705_392_000
+        assert detector.get_current_kill_zone(london_open).zone_type == KillZoneType.LONDON_KILL_ZONE
+        assert detector.get_current_kill_zone(london_open - 60).zone_type == KillZoneType.OFF_HOURS
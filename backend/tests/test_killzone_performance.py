@@ -0,0 +1,251 @@
+"""Unit tests for kill zone performance tracking."""
+import gc
+import json
+import os
+import shutil
+import threading
+import time
+import weakref
+
+import numpy as np
+import pytest
+from app.engine.killzone_performance import (
+    KillZonePerformanceTracker,
+    _ZoneStatsTable,
+    _flush_live_trackers,
+)
+
+
+# 2024-01-16 03:30 New York (London kill zone)
+LONDON_TS = 1_705_393_800
+
+_TIMESTAMP_KEYS = ('last_updated', 'last_updated_ns', 'updated_at', 'updated_at_ns')
+
+
+def without_timestamps(data):
+    """Serialized profile with its wall-clock timestamps removed."""
+    data = {k: v for k, v in data.items() if k not in _TIMESTAMP_KEYS}
+    data['zone_stats'] = {
+        zone: {k: v for k, v in stats.items() if k not in _TIMESTAMP_KEYS}
+        for zone, stats in data['zone_stats'].items()
+    }
+    return data
+
+
+def make_trades(count, seed=7):
+    """Random trades over a week for a few symbols."""
+    rng = np.random.default_rng(seed)
+    symbols = rng.choice(['EURUSD', 'GBPUSD', 'BTC/USD'], count).tolist()
+    timestamps = (1_705_000_000 + rng.integers(0, 7 * 86400, count)).tolist()
+    successes = (rng.random(count) < 0.55).tolist()
+    # Values whose float sums depend on addition order
+    returns = np.round(rng.normal(0.1, 1.3, count), 3).tolist()
+    durations = (rng.random(count) * 90 + 0.1).tolist()
+    return symbols, timestamps, successes, returns, durations
+
+
+class TestProfileSaves:
+    """Profile writes from several threads."""
+
+    def test_concurrent_saves_do_not_collide(self, tmp_path, capsys):
+        """Saving one symbol from several threads leaves a valid file and no temp files."""
+        tracker = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(50):
+                    tracker.record_trade_outcome(
+                        "EURUSD", LONDON_TS, (i + offset) % 2 == 0, 1.0 + i, 30.0, "fvg"
+                    )
+                    tracker._save_profile("EURUSD")
+            except Exception as e:  # pragma: no cover - surfaced by the assert below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        tracker.flush()
+
+        assert errors == []
+        assert "Error saving profile" not in capsys.readouterr().out
+        assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+        with open(tmp_path / "EURUSD_killzone.json") as f:
+            data = json.load(f)
+        assert data["symbol"] == "EURUSD"
+
+    def test_concurrent_records_while_rows_grow(self, tmp_path, monkeypatch):
+        """Trades recorded while another thread adds symbols (growing the table) are all kept."""
+        # Slow down each column copy so records land while the table is growing
+        grow = _ZoneStatsTable._grow
+
+        def slow_grow(column, fill):
+            grown = grow(column, fill)
+            time.sleep(0.002)
+            return grown
+
+        monkeypatch.setattr(_ZoneStatsTable, "_grow", staticmethod(slow_grow))
+        tracker = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        tracker.record_trade_outcome("EURUSD", LONDON_TS, True, 1.0, 30.0, "fvg")
+        done = threading.Event()
+        recorded = []
+
+        def record_existing():
+            count = 0
+            while not done.is_set():
+                tracker.record_trade_outcome("EURUSD", LONDON_TS, True, 1.0, 30.0, "fvg")
+                count += 1
+            recorded.append(count)
+
+        recorder = threading.Thread(target=record_existing)
+        recorder.start()
+        try:
+            for i in range(300):
+                tracker.record_signal(f"SYM{i}", LONDON_TS, 70.0, "fvg", "Buy")
+        finally:
+            done.set()
+            recorder.join()
+        tracker.flush()
+
+        zone = tracker.get_recent_performance("EURUSD", days=1)['zone_breakdown']['london_kill_zone']
+        assert zone['total_trades'] == recorded[0] + 1
+        assert len(tracker.profiles) == 301
+
+
+class TestTrackerLifetime:
+    """Exit-time flushing without keeping trackers alive."""
+
+    def test_tracker_is_collected(self, tmp_path):
+        """A flushed tracker that is no longer referenced can be garbage collected."""
+        tracker = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        tracker.record_trade_outcome("EURUSD", LONDON_TS, True, 1.0, 30.0, "fvg")
+        tracker.flush()
+        ref = weakref.ref(tracker)
+        del tracker
+        gc.collect()
+        assert ref() is None
+
+    def test_exit_flush_saves_pending_changes(self, tmp_path):
+        """The exit hook saves changes still waiting for the flush timer."""
+        tracker = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        tracker.record_trade_outcome("EURUSD", LONDON_TS, True, 1.0, 30.0, "fvg")
+        assert not (tmp_path / "EURUSD_killzone.json").exists()
+        _flush_live_trackers()
+        assert (tmp_path / "EURUSD_killzone.json").exists()
+
+    def test_exit_flush_skips_removed_directory(self, tmp_path, capsys):
+        """A tracker whose directory was removed is not saved at exit."""
+        data_dir = tmp_path / "stats"
+        tracker = KillZonePerformanceTracker(data_dir=str(data_dir))
+        tracker.record_trade_outcome("EURUSD", LONDON_TS, True, 1.0, 30.0, "fvg")
+        shutil.rmtree(data_dir)
+        _flush_live_trackers()
+        assert "Error saving profile" not in capsys.readouterr().out
+        assert not data_dir.exists()
+        # Drop the pending change so its timer does not write after the test
+        tracker._dirty.clear()
+        tracker._flush_timer.cancel()
+
+
+class TestBulkRecording:
+    """record_trade_outcomes_bulk against one-by-one recording."""
+
+    def test_bulk_matches_sequential(self, tmp_path):
+        """Bulk recording gives the same profiles, including float sums, as a loop."""
+        symbols, timestamps, successes, returns, durations = make_trades(400)
+
+        sequential = KillZonePerformanceTracker(data_dir=str(tmp_path / "seq"))
+        for trade in zip(symbols, timestamps, successes, returns, durations):
+            sequential.record_trade_outcome(*trade, pattern_type="fvg")
+        bulk = KillZonePerformanceTracker(data_dir=str(tmp_path / "bulk"))
+        bulk.record_trade_outcomes_bulk(symbols, timestamps, successes, returns, durations)
+
+        assert list(bulk.profiles) == list(sequential.profiles)
+        for symbol, profile in sequential.profiles.items():
+            assert bulk.profiles[symbol].zone_ids == profile.zone_ids
+            expected = without_timestamps(sequential._serialize_profile(profile))
+            actual = without_timestamps(bulk._serialize_profile(bulk.profiles[symbol]))
+            # Exact equality: the sums must be accumulated in trade order
+            assert actual == expected
+            expected_summary = sequential.get_symbol_summary(symbol)
+            actual_summary = bulk.get_symbol_summary(symbol)
+            expected_summary.pop('last_updated')
+            actual_summary.pop('last_updated')
+            assert actual_summary == expected_summary
+
+    def test_bulk_empty_is_noop(self, tmp_path):
+        """An empty batch creates no profiles."""
+        tracker = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        tracker.record_trade_outcomes_bulk([], [], [], [], [])
+        assert tracker.profiles == {}
+
+
+class TestProfileFormat:
+    """On-disk profile format and migration of older files."""
+
+    def test_old_average_only_profile_migrates(self, tmp_path):
+        """Profiles saved with averages and ISO timestamps only load as running sums."""
+        old = {
+            'symbol': 'EURUSD',
+            'zone_stats': {
+                'london_kill_zone': {
+                    'total_signals': 12,
+                    'successful_trades': 6,
+                    'failed_trades': 2,
+                    'win_rate': 75.0,
+                    'avg_return_percent': 1.5,
+                    'avg_duration_minutes': 40.0,
+                    'best_pattern': 'fvg',
+                    'worst_pattern': 'ob',
+                    'last_updated': '2024-01-16T08:30:00',
+                }
+            },
+            'overall_best_zone': 'london_kill_zone',
+            'overall_worst_zone': 'london_kill_zone',
+            'optimal_session': 'london',
+            'updated_at': '2024-01-16T08:30:00',
+        }
+        with open(tmp_path / "EURUSD_killzone.json", "w") as f:
+            json.dump(old, f)
+
+        tracker = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        data = tracker._serialize_profile(tracker.profiles['EURUSD'])
+        stats = data['zone_stats']['london_kill_zone']
+        assert stats['successful_trades'] == 6
+        assert stats['failed_trades'] == 2
+        assert stats['sum_return'] == pytest.approx(12.0)
+        assert stats['sum_duration'] == pytest.approx(320.0)
+        assert stats['avg_return_percent'] == pytest.approx(1.5)
+        assert stats['avg_duration_minutes'] == pytest.approx(40.0)
+        assert stats['last_updated'] == '2024-01-16T08:30:00'
+        assert stats['last_updated_ns'] == 1_705_393_800 * 1_000_000_000
+        assert data['updated_at_ns'] == 1_705_393_800 * 1_000_000_000
+
+        # Recording on top of the migrated sums keeps the averages consistent
+        tracker.record_trade_outcome('EURUSD', LONDON_TS, False, -3.0, 10.0, 'fvg')
+        zone = tracker.get_recent_performance('EURUSD', days=1)['zone_breakdown']['london_kill_zone']
+        assert zone['total_trades'] == 9
+        assert zone['avg_return_percent'] == pytest.approx(1.0, abs=0.01)
+
+    def test_save_load_round_trip(self, tmp_path):
+        """Packed counts are written as separate counts and read back unchanged."""
+        symbols, timestamps, successes, returns, durations = make_trades(200)
+        tracker = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        tracker.record_trade_outcomes_bulk(symbols, timestamps, successes, returns, durations)
+        tracker.flush()
+
+        with open(tmp_path / "EURUSD_killzone.json") as f:
+            on_disk = json.load(f)
+        for stats in on_disk['zone_stats'].values():
+            assert 'trades' not in stats
+            assert isinstance(stats['successful_trades'], int)
+            assert isinstance(stats['failed_trades'], int)
+            assert isinstance(stats['last_updated_ns'], int)
+
+        reloaded = KillZonePerformanceTracker(data_dir=str(tmp_path))
+        assert set(reloaded.profiles) == set(tracker.profiles)
+        for symbol, profile in tracker.profiles.items():
+            assert (reloaded._serialize_profile(reloaded.profiles[symbol])
+                    == tracker._serialize_profile(profile))
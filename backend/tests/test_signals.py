@@ -0,0 +1,52 @@
+"""Unit tests for the shared signal helpers."""
+from app.engine.ict_strategies import ICTSignal, ICTSignalResult
+from app.engine.signals import signal_directions
+from app.engine.smc_strategies import SMCSignal, SMCSignalResult
+
+
+class TestSignalDirections:
+    """signal_directions for the ICT and SMC signal enums."""
+
+    def test_ict_directions(self):
+        """Every ICT signal type maps to its trade direction."""
+        assert signal_directions(ICTSignal) == {
+            ICTSignal.BULLISH_BREAKER: 1,
+            ICTSignal.BEARISH_BREAKER: -1,
+            ICTSignal.FVG_BULLISH: 1,
+            ICTSignal.FVG_BEARISH: -1,
+            # Market maker models name no direction in their value
+            ICTSignal.MM_BUY_MODEL: 0,
+            ICTSignal.MM_SELL_MODEL: 0,
+            ICTSignal.BOS_BULLISH: 1,
+            ICTSignal.BOS_BEARISH: -1,
+            ICTSignal.MSS_BULLISH: 1,
+            ICTSignal.MSS_BEARISH: -1,
+            ICTSignal.NEUTRAL: 0,
+        }
+
+    def test_smc_directions(self):
+        """Every SMC signal type maps to its trade direction."""
+        assert signal_directions(SMCSignal) == {
+            SMCSignal.LIQUIDITY_SWEEP_BULLISH: 1,
+            SMCSignal.LIQUIDITY_SWEEP_BEARISH: -1,
+            SMCSignal.INDUCEMENT_BULLISH: 1,
+            SMCSignal.INDUCEMENT_BEARISH: -1,
+            SMCSignal.MITIGATION_BULLISH: 1,
+            SMCSignal.MITIGATION_BEARISH: -1,
+            SMCSignal.BPR_BULLISH: 1,
+            SMCSignal.BPR_BEARISH: -1,
+            SMCSignal.NEUTRAL: 0,
+        }
+
+    def test_result_direction(self):
+        """Signal results report the direction of their signal type."""
+        ict = ICTSignalResult(
+            signal_type=ICTSignal.BOS_BULLISH, strength=70.0, confidence=60.0, price=100.0,
+            entry_zone=(99.0, 100.0), stop_loss=98.0, take_profit=104.0, rationale=()
+        )
+        smc = SMCSignalResult(
+            signal_type=SMCSignal.INDUCEMENT_BEARISH, strength=70.0, confidence=60.0, price=100.0,
+            entry_zone=(100.0, 101.0), stop_loss=102.0, take_profit=96.0, rationale=[]
+        )
+        assert ict.direction == 1
+        assert smc.direction == -1